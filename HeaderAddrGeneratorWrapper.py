@@ -37,6 +37,8 @@
 ##	Revision history:
 ##		24.01.2018	Implemented the script
 ##      27.11.2018  Changed script to be a class
+##      16.10.2026  Added option to write accessors of registers
+##      16.10.2026  Added option to write structure overlays of blocks
 ##
 ################################################################################
 
@@ -49,6 +51,7 @@ import inspect
 import math
 
 from .gen_lib import *
+from .spec_cache import load_component
 from .ip_xact.h_addr_generator import HeaderAddrGenerator
 
 class HeaderAddrGeneratorWrapper():
@@ -59,6 +62,10 @@ class HeaderAddrGeneratorWrapper():
     # Path to a IP-XACT specification file with register maps
     xactSpec = ""
 
+    # Directory with cache of loaded IP-XACT specifications. When empty,
+    # specification is always parsed.
+    specCacheDir = ""
+
     # Name of the IP-XACT Memory map which should be used for VHDL package generatio.
     memMap = None
     
@@ -72,30 +79,61 @@ class HeaderAddrGeneratorWrapper():
 
     # Output where to write the VHDL package.
     outFile = ""
+
+    # When set to "True", output file is written only when its content changes.
+    writeOnlyChanged = False
+
+    # Output sink of generator: "memory", "file" or "chunked". Streaming
+    # sinks ("file", "chunked") keep only small part of output in memory.
+    outSink = "memory"
+
+    # When set to "True", static inline accessors of registers and fields
+    # with shift / mask constants and compile-time layout checks are written.
+    writeAccessors = False
+
+    # When set to "True", structure overlay of each register block with
+    # compile-time checks of offsets of its members is written.
+    writeBlockStructs = False
 	
-    def do_update(self):
-	    with open(self.xactSpec) as f:
-		    name = None
-		    offset = 0
-		    addrMap = None
-		    fieldMap = None
-            
-		    component = Component()
-		    component.load(f)
+    def generate(self, component, baseGen=None):
+	    """
+	    Generate C header from loaded IP-XACT component.
+	    Arguments:
+	        component	Loaded IP-XACT component
+	        baseGen		Generator of the same memory map whose word indices
+	                    should be re-used (optional)
+	    """
+	    stats = OutputStats()
+	    onlyChanged = str_arg_to_bool(str(self.writeOnlyChanged))
+
+	    with open_output(self.outFile, onlyChanged, stats) as of:
 		    
-		    with open_output(self.outFile) as of:
-			    
-			    headerGen = HeaderAddrGenerator(component, self.memMap, self.wordWidth)
-			    headerGen.set_of(of)
-			    
-			    if (self.licPath != ""):
-				    lic_text = load_license(self.licPath)
-				    write_license(lic_text, '*', of)
-				    
-			    headerGen.prefix = "ctu_can_fd"
-			    headerGen.create_addrMap_package(self.headName)
+		    headerGen = HeaderAddrGenerator(component, self.memMap, self.wordWidth)
+		    if (baseGen != None):
+			    headerGen.share_indices(baseGen)
+		    headerGen.outSink = self.outSink
+		    headerGen.writeAccessors = str_arg_to_bool(str(self.writeAccessors))
+		    headerGen.writeBlockStructs = str_arg_to_bool(
+								str(self.writeBlockStructs))
+
+		    headerGen.set_of(of)
+		    
+		    if (self.licPath != ""):
+			    lic_text = load_license(self.licPath)
+			    write_license(lic_text, '*', of)
 			    
-			    headerGen.commit_to_file()
+		    headerGen.prefix = "ctu_can_fd"
+		    headerGen.create_addrMap_package(self.headName)
+		    
+		    headerGen.commit_to_file()
+
+	    stats.report("C header")
+
+    def do_update(self):
+	    with open(self.xactSpec) as f:
+		    component = load_component(f, self.specCacheDir)
+
+	    self.generate(component)
 
     if __name__ == '__main__':
         self.do_update()
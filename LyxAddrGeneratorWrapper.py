@@ -47,6 +47,7 @@ import inspect
 import math
 
 from .gen_lib import *
+from .spec_cache import load_component
 from .ip_xact.lyx_addr_generator import LyxAddrGenerator
 
 
@@ -55,6 +56,10 @@ class LyxAddrGeneratorWrapper():
 	# Path to a IP-XACT specification file with register maps
 	xactSpec = ""
 
+	# Directory with cache of loaded IP-XACT specifications. When empty,
+	# specification is always parsed.
+	specCacheDir = ""
+
 	# Name of the IP-XACT Memory map which should be used for VHDL package generatio.
 	memMap = None
 
@@ -66,6 +71,13 @@ class LyxAddrGeneratorWrapper():
 	# Output where to write the VHDL package.
 	outFile = ""
 
+	# When set to "True", output file is written only when its content changes.
+	writeOnlyChanged = False
+
+	# Output sink of generator: "memory", "file" or "chunked". Streaming
+	# sinks ("file", "chunked") keep only small part of output in memory.
+	outSink = "memory"
+
 	# If memory map region overview should be generated
 	genRegions = False
 
@@ -76,32 +88,45 @@ class LyxAddrGeneratorWrapper():
 	lyxTemplate = ""
 
 
+	def generate(self, component, baseGen=None):
+		"""
+		Generate Lyx documentation from loaded IP-XACT component.
+		Arguments:
+			component	Loaded IP-XACT component
+			baseGen		Generator of the same memory map whose word indices
+						should be re-used (optional)
+		"""
+		stats = OutputStats()
+		onlyChanged = str_arg_to_bool(str(self.writeOnlyChanged))
+
+		with open_output(self.outFile, onlyChanged, stats) as of:
+			
+			lyxGen = LyxAddrGenerator(component, self.memMap, self.wordWidth, 
+										genRegions=self.genRegions,
+										genFiDesc=self.genFiDesc)
+			if (baseGen != None):
+				lyxGen.share_indices(baseGen)
+			lyxGen.outSink = self.outSink
+
+			lyxGen.set_of(of)
+			lyxGen.load_lyx_template(self.lyxTemplate)
+			
+			# Write the documentation
+			lyxGen.write_mem_map_both()
+
+			lyxGen.lyxGen.commit_append_lines_all()
+			
+			lyxGen.commit_to_file()
+
+		stats.report("Lyx documentation")
+
+
 	def do_update(self):
 
-		args = parse_args()
 		with open(self.xactSpec) as f:
-			name = None
-			offset = 0
-			addrMap = None
-			fieldMap = None
-		    
-			component = Component()
-			component.load(f)
-			
-			with open_output(self.outFile) as of:
-				
-				lyxGen = LyxAddrGenerator(component, self.memMap, self.wordWidth, 
-											genRegions=self.genRegions,
-											genFiDesc=self.genFiDesc)
-				lyxGen.set_of(of)
-				lyxGen.load_lyx_template(self.lyxTemplate)
-				
-				# Write the documentation
-				lyxGen.write_mem_map_both()
-
-				lyxGen.lyxGen.commit_append_lines_all()
-				
-				lyxGen.commit_to_file()
+			component = load_component(f, self.specCacheDir)
+
+		self.generate(component)
 
 	if __name__ == '__main__':
 		self.do_update()
@@ -0,0 +1,139 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Driver for generation of several targets from single IP-XACT memory
+##   map. IP-XACT specification is loaded only once, word indices of address
+##   blocks are built only once and shared by all generators. Targets are
+##   configured wrappers:
+##		VhdlRegMapGeneratorWrapper 	- VHDL RTL of register map
+##		VhdlAddrGeneratorWrapper	- VHDL package with constants
+##		HeaderAddrGeneratorWrapper	- C header
+##		LyxAddrGeneratorWrapper		- Lyx documentation
+##
+##	 Example:
+##		driver = RegMapGeneratorDriver()
+##		driver.xactSpec = "spec/can_fd.xml"
+##		driver.memMap = "CAN_Registers"
+##		driver.targets = [vhdlRegMapWrapper, headerWrapper, lyxWrapper]
+##		driver.do_update()
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+import os
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .gen_lib import *
+from .spec_cache import load_component
+from .ip_xact.addr_generator import IpXactAddrGenerator
+
+
+class RegMapGeneratorDriver():
+
+	# Path to a IP-XACT specification file with register maps
+	xactSpec = ""
+
+	# Directory with cache of loaded IP-XACT specifications. When empty,
+	# specification is always parsed.
+	specCacheDir = ""
+
+	# Name of the IP-XACT Memory map which should be used for generation.
+	# Overrides memory map of each target.
+	memMap = None
+
+	# Size of the access bus word. Overrides word width of each target.
+	wordWidth = 32
+
+	# List of configured wrappers to generate
+	targets = None
+
+	# When set to "True", targets are generated concurrently.
+	concurrent = False
+
+	# Maximal number of targets generated at once (None - all targets)
+	maxWorkers = None
+
+
+	def __init__(self):
+		self.targets = []
+
+
+	def create_base_generator(self, component):
+		"""
+		Create generator whose word indices are built in advance and shared
+		by generators of all targets.
+		"""
+		baseGen = IpXactAddrGenerator(component, self.memMap, self.wordWidth)
+		if (baseGen.memMap == None):
+			print("ERROR: Memory map " + str(self.memMap) + " not found in " +
+					self.xactSpec)
+			sys.exit(1)
+
+		baseGen.build_blk_wrd_indices()
+
+		return baseGen
+
+
+	def generate(self, component):
+		"""
+		Generate all targets from loaded IP-XACT component.
+		"""
+		baseGen = self.create_base_generator(component)
+
+		for target in self.targets:
+			target.memMap = self.memMap
+			target.wordWidth = self.wordWidth
+
+		if (not str_arg_to_bool(str(self.concurrent)) or len(self.targets) < 2):
+			for target in self.targets:
+				target.generate(component, baseGen)
+			return
+
+		# Generators of targets have their own output buffers, shared word
+		# indices are only read.
+		with ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+			futures = [executor.submit(target.generate, component, baseGen)
+						for target in self.targets]
+
+			# Re-raise first failure of a target
+			for future in futures:
+				future.result()
+
+
+	def do_update(self):
+
+		with open(self.xactSpec) as f:
+
+			# Load IP-Xact component only once for all targets
+			component = load_component(f, self.specCacheDir)
+
+		self.generate(component)
@@ -52,6 +52,7 @@ import inspect
 import math
 
 from .gen_lib import *
+from .spec_cache import load_component
 from .ip_xact.vhdl_addr_generator import VhdlAddrGenerator
 
 
@@ -63,6 +64,10 @@ class VhdlAddrGeneratorWrapper():
     # Path to a IP-XACT specification file with register maps
     xactSpec = ""
 
+    # Directory with cache of loaded IP-XACT specifications. When empty,
+    # specification is always parsed.
+    specCacheDir = ""
+
     # Name of the IP-XACT Memory map which should be used for VHDL package generatio.
     memMap = None
     
@@ -77,29 +82,53 @@ class VhdlAddrGeneratorWrapper():
     # Output where to write the VHDL package.
     outFile = ""
 
+    # When set to "True", output file is written only when its content changes.
+    writeOnlyChanged = False
+
+    # Output sink of generator: "memory", "file" or "chunked". Streaming
+    # sinks ("file", "chunked") keep only small part of output in memory.
+    outSink = "memory"
+
+
+    def generate(self, component, baseGen=None):
+	    """
+	    Generate VHDL package with constants from loaded IP-XACT component.
+	    Arguments:
+	        component	Loaded IP-XACT component
+	        baseGen		Generator of the same memory map whose word indices
+	                    should be re-used (optional)
+	    """
+	    stats = OutputStats()
+	    onlyChanged = str_arg_to_bool(str(self.writeOnlyChanged))
+
+	    with open_output(self.outFile, onlyChanged, stats) as of:
+		    
+		    vhdlGen = VhdlAddrGenerator(component, self.memMap, self.wordWidth)
+		    if (baseGen != None):
+			    vhdlGen.share_indices(baseGen)
+		    vhdlGen.outSink = self.outSink
+
+		    vhdlGen.set_of(of)
+		    
+		    if (self.licPath != ""):
+			    lic_text = load_license(self.licPath)
+			    write_license(lic_text, '-', of)
+		    
+		    vhdlGen.create_addrMap_package(self.packName)
+		    
+		    vhdlGen.commit_to_file()
+
+	    stats.report("VHDL package")
+
 
     def do_update(self):
 
 	    with open(self.xactSpec) as spec_file:
-		    name = None
-		    offset = 0
-		    
+
             # Load IP-Xact component
-		    component = Component()
-		    component.load(spec_file)
-			    
-		    with open_output(self.outFile) as of:
-			    
-			    vhdlGen = VhdlAddrGenerator(component, self.memMap, self.wordWidth)
-			    vhdlGen.set_of(of)
-			    
-			    if (self.licPath != ""):
-				    lic_text = load_license(self.licPath)
-				    write_license(lic_text, '-', of)
-			    
-			    vhdlGen.create_addrMap_package(self.packName)
-			    
-			    vhdlGen.commit_to_file()
+		    component = load_component(spec_file, self.specCacheDir)
+
+	    self.generate(component)
 
     if __name__ == '__main__':
         self.do_update()
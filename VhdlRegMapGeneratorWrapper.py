@@ -32,6 +32,19 @@
 ##	Revision history:
 ##		25.11.2018	Implemented the script
 ##      27.11.2018  Changed implementation to be a class
+##      16.10.2026  Added parallel generation of register blocks
+##      16.10.2026  Added write-if-changed output mode
+##      16.10.2026  Added pipelined read data multiplexor tree option
+##      16.10.2026  Added compacted read data multiplexor input option
+##      16.10.2026  Added address decoder choice and generation report
+##      16.10.2026  Added configurable pipelining of register blocks
+##      16.10.2026  Added RAM implementation of memory blocks
+##      16.10.2026  Added table-driven register file option
+##      16.10.2026  Added AXI4 bus front end of memory map
+##      16.10.2026  Added AXI4-Lite and Avalon-MM bus front ends
+##      16.10.2026  Added top level entity of memory map
+##      16.10.2026  Added clock domain crossing variant of register blocks
+##      16.10.2026  Templates copied only when they are used
 ##
 ################################################################################
 
@@ -44,9 +57,88 @@ import inspect
 import math
 
 from .gen_lib import *
+from .spec_cache import load_component, convert_to_spec_node
 from .ip_xact.vhdl_reg_map_generator import VhdlRegMapGenerator
 
 from shutil import copyfile
+from concurrent.futures import ProcessPoolExecutor
+
+# Generator settings of worker process for parallel generation of register
+# blocks: [component, memMap, wordWidth, lic_text, writeOnlyChanged,
+#		  genOptions]
+worker_settings = None
+
+
+def configure_reg_map_generator(vhdlGen, genOptions):
+	"""
+	Set options of register map generator.
+	Arguments:
+		vhdlGen		Register map generator
+		genOptions	Dictionary: generator attribute -> value
+	"""
+	for (name, value) in genOptions.items():
+		setattr(vhdlGen, name, value)
+
+
+def init_reg_block_worker(settings):
+	"""
+	Initialize worker process for parallel generation of register blocks.
+	Component is passed only once per worker process.
+	"""
+	global worker_settings
+	worker_settings = settings
+
+
+def write_reg_block_worker(block_index, file_path):
+	"""
+	Write register block implementation in worker process. Each call uses
+	its own generator, thus no state is shared between register blocks.
+	"""
+	[component, memMap, wordWidth, lic_text, writeOnlyChanged,
+		genOptions] = worker_settings
+
+	vhdlGen = VhdlRegMapGenerator(component, memMap, wordWidth)
+	configure_reg_map_generator(vhdlGen, genOptions)
+
+	# Statistics are returned to the main process
+	stats = OutputStats()
+
+	block = vhdlGen.memMap.addressBlock[block_index]
+	write_reg_block_file(vhdlGen, block, file_path, lic_text,
+							writeOnlyChanged, stats)
+
+	return stats
+
+
+def get_block_file_name(block):
+	"""
+	Get name of file with implementation of a block. None is returned for
+	unsupported blocks.
+	"""
+	if (block.usage == "register"):
+		return block.name.lower() + "_reg_map.vhd"
+	elif (block.usage == "memory"):
+		return block.name.lower() + "_mem_map.vhd"
+	return None
+
+
+def write_reg_block_file(vhdlGen, block, file_path, lic_text,
+							onlyChanged=False, stats=None):
+	"""
+	Write implementation of single register or memory block to a file.
+	"""
+	of = open_output(file_path, onlyChanged, stats)
+	vhdlGen.set_of(of)
+
+	write_license(lic_text, '-', of)
+	if (block.usage == "memory"):
+		vhdlGen.write_mem_block(block)
+	else:
+		vhdlGen.write_reg_block(block)
+	vhdlGen.commit_to_file()
+
+	of.close()
+
 
 class VhdlRegMapGeneratorWrapper():
 
@@ -56,6 +148,10 @@ class VhdlRegMapGeneratorWrapper():
 	# Path to a IP-XACT specification file with register maps
 	xactSpec = ""
 
+	# Directory with cache of loaded IP-XACT specifications. When empty,
+	# specification is always parsed.
+	specCacheDir = ""
+
 	# Name of the IP-XACT Memory map which should be used for VHDL package generatio.
 	memMap = None
 
@@ -68,9 +164,105 @@ class VhdlRegMapGeneratorWrapper():
 	# false read data are available within the same clock cycle
 	registeredRead = True
 
+	# Type of read data multiplexor of register blocks: "flat" (single level
+	# multiplexor) or "tree" (log-depth multiplexor tree with pipeline stages)
+	readMuxType = "flat"
+
+	# Number of pipeline stages of read data multiplexor tree. Read latency of
+	# each block is exported as <block>_READ_LATENCY constant in the package.
+	readMuxStages = 0
+
+	# When set to "True", only words with readable registers are inputs of
+	# read data multiplexor and address is remapped to index of such word.
+	readMuxCompact = False
+
+	# Type of address decoder: "auto" (chosen by occupancy of the block and
+	# estimated number of LUTs), "compare" (comparator per word) or "dense"
+	# (binary to one-hot decoder)
+	addrDecType = "auto"
+
+	# Minimal occupancy of block words for which dense address decoder can
+	# be chosen in "auto" mode
+	addrDecDenseOccupancy = 0.5
+
+	# Pipeline stages of register blocks, comma separated list of:
+	#	write	- Register stage on bus inputs of a register block
+	#	decode	- Registered address decoder (bus signals delayed with it)
+	#	read	- Pipeline stage in read data multiplexor
+	# E.g. "decode,write,read". Latencies of each block are exported in the
+	# package and listed in generation report.
+	pipeline = ""
+
+	# Implementation of writable registers: "instances" (register instance
+	# for each register) or "table" (single loop over constant tables for
+	# registers of the same width)
+	regFileType = "instances"
+
+	# Comma separated list of register blocks whose clock domain crossing
+	# variant (<block>_reg_map_cdc) is generated, or "all". Output / input
+	# records of such blocks are in core clock domain (clk_core). Bus master
+	# must hold accesses while "full" of the variant is set (bus front ends
+	# do so).
+	cdcBlocks = ""
+
+	# Number of accesses buffered by FIFO of clock domain crossing variant
+	cdcFifoDepth = 8
+
+	# When set to "True", top level entity of memory map (<memmap>_top) is
+	# written. It decodes all blocks of memory map from single memory bus.
+	# Top level is always written when bus front end is used.
+	writeTop = False
+
+	# Register stages after one-hot block select of top level entity
+	topDecodeStages = 1
+
+	# Register stages within OR-tree merge of read data of top level entity
+	topMergeStages = 0
+
+	# Number of inputs of single OR within read data merge tree
+	topMergeFanIn = 4
+
+	# Bus front end of memory map: "none", "axi4", "axi4lite" or "avalon".
+	# Front end entity (<memmap>_<front end>) instantiates all blocks of the
+	# memory map behind single bus slave. Front end is chosen per memory map.
+	busFrontEnd = "none"
+
+	# Width of transaction ID of AXI4 front end
+	axiIdWidth = 4
+
+	# Number of outstanding reads of bus front end (0 - read latency of
+	# front end + 2)
+	maxOutstandingReads = 0
+
+	# When set to "True", generation report (<memmap>_report.txt) with
+	# implementation choices and resource estimates is written.
+	writeReport = False
+
 	# Output directory where to write VHDL register map implementation.
 	outDir = ""
 
+	# When set to "True", register blocks are generated in parallel in a pool
+	# of processes. Output is the same as with serial generation.
+	parallelBlocks = False
+
+	# Number of worker processes for parallel generation (None - number of
+	# CPUs)
+	maxWorkers = None
+
+	# When set to "True", output files are written only when their content
+	# changes. Unchanged files (and templates) keep their timestamps.
+	writeOnlyChanged = False
+
+	# Output sink of generator: "memory", "file" or "chunked". Streaming
+	# sinks ("file", "chunked") keep only small part of output in memory.
+	outSink = "memory"
+
+	# Statistics of written / skipped output files
+	outStats = None
+
+	# Loaded IP-XACT component
+	component = None
+
 
 	# Variable for loaded license Text
 	lic_text = ""
@@ -82,7 +274,8 @@ class VhdlRegMapGeneratorWrapper():
 		"""
 		reg_map_pkg_name = os.path.join(dir_path, vhdlGen.memMap.name.lower() + "_pkg.vhd")
 		
-		of = open(reg_map_pkg_name, 'w')
+		of = open_output(reg_map_pkg_name, self.is_write_only_changed(),
+							self.outStats)
 		vhdlGen.set_of(of)
 
 		write_license(self.lic_text, '-', of)
@@ -92,25 +285,98 @@ class VhdlRegMapGeneratorWrapper():
 		of.close()
 
 
+	def write_reg_map_cdc(self, vhdlGen, dir_path):
+		"""
+		Write clock domain crossing variants of register blocks.
+		"""
+		for block in vhdlGen.memMap.addressBlock:
+			if (not vhdlGen.is_cdc_block(block)):
+				continue
+
+			cdc_name = os.path.join(dir_path, vhdlGen.get_cdc_name(block) +
+									".vhd")
+
+			of = open_output(cdc_name, self.is_write_only_changed(),
+								self.outStats)
+			vhdlGen.set_of(of)
+
+			write_license(self.lic_text, '-', of)
+			vhdlGen.write_reg_block_cdc(block)
+			vhdlGen.commit_to_file()
+
+			of.close()
+
+
+	def write_reg_map_top(self, vhdlGen, dir_path):
+		"""
+		Write top level entity of memory map.
+		"""
+		top_name = os.path.join(dir_path, vhdlGen.get_top_name() + ".vhd")
+
+		of = open_output(top_name, self.is_write_only_changed(),
+							self.outStats)
+		vhdlGen.set_of(of)
+
+		write_license(self.lic_text, '-', of)
+		vhdlGen.write_mem_map_top()
+		vhdlGen.commit_to_file()
+
+		of.close()
+
+
+	def write_reg_map_front_end(self, vhdlGen, dir_path):
+		"""
+		Write bus front end of memory map.
+		"""
+		if (not self.busFrontEnd in vhdlGen.frontEndTemplates):
+			print("Unknown bus front end: " + self.busFrontEnd)
+			return
+
+		front_end_name = os.path.join(dir_path,
+								vhdlGen.get_front_end_name() + ".vhd")
+
+		of = open_output(front_end_name, self.is_write_only_changed(),
+							self.outStats)
+		vhdlGen.set_of(of)
+
+		write_license(self.lic_text, '-', of)
+		vhdlGen.write_mem_map_front_end()
+		vhdlGen.commit_to_file()
+
+		of.close()
+
+
+	def write_reg_map_report(self, vhdlGen, dir_path):
+		"""
+		Write generation report of register map.
+		"""
+		report_name = os.path.join(dir_path, vhdlGen.memMap.name.lower() + "_report.txt")
+
+		of = open_output(report_name, self.is_write_only_changed(),
+							self.outStats)
+		for line in vhdlGen.create_reg_map_report():
+			of.write(line)
+		of.close()
+
+
 	def write_reg_map_implementation(self, vhdlGen, dir_path):
 		"""
 		Write register map implementation. Create separate entity file for
-		each register memory block.
+		each register block and each memory block.
 		"""
+		if (str_arg_to_bool(str(self.parallelBlocks))):
+			if (self.write_reg_map_implementation_parallel(vhdlGen, dir_path)):
+				return
+
 		for block in vhdlGen.memMap.addressBlock:
 			print("Processing memory block: " + block.name)
 			
-			if (block.usage == "register"):
-				file_path = os.path.join(dir_path, block.name.lower() + "_reg_map.vhd")
-
-				of = open(file_path, 'w')
-				vhdlGen.set_of(of)
-
-				write_license(self.lic_text, '-', of)
-				vhdlGen.write_reg_block(block)
-				vhdlGen.commit_to_file()
-
-				of.close()
+			file_name = get_block_file_name(block)
+			if (file_name != None):
+				file_path = os.path.join(dir_path, file_name)
+				write_reg_block_file(vhdlGen, block, file_path, self.lic_text,
+										self.is_write_only_changed(),
+										self.outStats)
 
 			else:
 				print("Skipping unsupported block type: " + block.usage)
@@ -118,56 +384,218 @@ class VhdlRegMapGeneratorWrapper():
 			print("\n")
 
 
+	def write_reg_map_implementation_parallel(self, vhdlGen, dir_path):
+		"""
+		Write register map implementation with each register block generated
+		in a separate worker process. Returns False when parallel generation
+		is not possible and serial generation should be used instead.
+		"""
+		tasks = []
+		for (i, block) in enumerate(vhdlGen.memMap.addressBlock):
+			file_name = get_block_file_name(block)
+			if (file_name != None):
+				tasks.append([i, os.path.join(dir_path, file_name)])
+
+		if (len(tasks) < 2):
+			return False
+
+		# Worker processes get the component as tree of plain objects since
+		# object of IP-XACT parser might not be transferable to other process.
+		try:
+			component = convert_to_spec_node(self.component, {})
+		except TypeError as err:
+			print("Parallel generation not possible: {}".format(err))
+			return False
+
+		settings = [component, self.memMap, self.wordWidth, self.lic_text,
+					self.is_write_only_changed(), self.get_generator_options()]
+
+		with ProcessPoolExecutor(max_workers=self.maxWorkers,
+									initializer=init_reg_block_worker,
+									initargs=(settings,)) as executor:
+			futures = [executor.submit(write_reg_block_worker, task[0], task[1])
+						for task in tasks]
+
+			# Report in the same order as serial generation
+			for block in vhdlGen.memMap.addressBlock:
+				print("Processing memory block: " + block.name)
+				if (get_block_file_name(block) == None):
+					print("Skipping unsupported block type: " + block.usage)
+				print("\n")
+
+			for future in futures:
+				self.outStats.add(future.result())
+
+		return True
+
+
 	def copy_reg_map_sources(self, vhdlGen, dir_path, destDir):
 		"""
-		Copy VHDL templates to destination directory!
+		Copy VHDL templates used by generated entities to destination
+		directory!
 		"""
 		for templ_name, templ_path in vhdlGen.template_sources.items():
+			if (not vhdlGen.is_template_used(templ_name)):
+				continue
+
 			src_path = os.path.join(ROOT_PATH, templ_path)
 			dest_path = os.path.join(ROOT_PATH, destDir)
 			dest_path = os.path.join(dest_path, os.path.basename(templ_path))
 
-			copyfile(src_path, dest_path)
+			copy_output(src_path, dest_path, self.is_write_only_changed(),
+						self.outStats)
+
+
+	def parse_pipeline(self):
+		"""
+		Parse list of pipeline stages. Unknown stages are reported and
+		ignored.
+		"""
+		stages = []
+		for stage in self.pipeline.split(","):
+			stage = stage.strip().lower()
+			if (stage == ""):
+				continue
+			if (stage not in ["write", "decode", "read"]):
+				print("Unknown pipeline stage: " + stage)
+				continue
+			stages.append(stage)
+		return stages
+
+
+	def parse_cdc_blocks(self):
+		"""
+		Parse list of register blocks with clock domain crossing variant.
+		Unknown blocks are reported and ignored.
+		"""
+		if (self.component == None):
+			return []
+
+		names = []
+		for map_inst in self.component.memoryMaps.memoryMap:
+			if (map_inst.name == self.memMap):
+				names = [block.name.lower() for block in map_inst.addressBlock
+							if (block.usage == "register")]
+
+		if (self.cdcBlocks.strip().lower() == "all"):
+			return names
+
+		blocks = []
+		for name in self.cdcBlocks.split(","):
+			name = name.strip().lower()
+			if (name == ""):
+				continue
+			if (name not in names):
+				print("Unknown register block for clock domain crossing: " +
+						name)
+				continue
+			blocks.append(name)
+		return blocks
+
+
+	def get_generator_options(self):
+		"""
+		Get options of register map generator configured by the wrapper.
+		Returns dictionary: generator attribute -> value.
+		"""
+		genOptions = {}
+
+		# Configure registered / non-registered read
+		if (str_arg_to_bool(self.registeredRead)):
+			genOptions["registered_read"] = True
+		else:
+			genOptions["registered_read"] = False
+
+		genOptions["outSink"] = self.outSink
+		genOptions["readMuxType"] = self.readMuxType
+		genOptions["readMuxStages"] = int(self.readMuxStages)
+		genOptions["readMuxCompact"] = str_arg_to_bool(str(self.readMuxCompact))
+		genOptions["addrDecType"] = self.addrDecType
+		genOptions["addrDecDenseOccupancy"] = float(self.addrDecDenseOccupancy)
+		genOptions["pipeline"] = self.parse_pipeline()
+		genOptions["regFileType"] = self.regFileType
+		genOptions["cdcBlocks"] = self.parse_cdc_blocks()
+		genOptions["cdcFifoDepth"] = int(self.cdcFifoDepth)
+		genOptions["writeTop"] = str_arg_to_bool(str(self.writeTop))
+		genOptions["topDecodeStages"] = int(self.topDecodeStages)
+		genOptions["topMergeStages"] = int(self.topMergeStages)
+		genOptions["topMergeFanIn"] = int(self.topMergeFanIn)
+		genOptions["busFrontEnd"] = self.busFrontEnd
+		genOptions["axiIdWidth"] = int(self.axiIdWidth)
+		genOptions["maxOutstandingReads"] = int(self.maxOutstandingReads)
+
+		return genOptions
+
+
+	def is_write_only_changed(self):
+		"""
+		Check if output files should be written only when changed.
+		"""
+		return str_arg_to_bool(str(self.writeOnlyChanged))
+
+
+	def generate(self, component, baseGen=None):
+		"""
+		Generate VHDL register map from loaded IP-XACT component.
+		Arguments:
+			component	Loaded IP-XACT component
+			baseGen		Generator of the same memory map whose word indices
+						should be re-used (optional)
+		"""
+		# Create new VHDL register map generator
+		self.component = component
+		self.outStats = OutputStats()
+		vhdlGen = VhdlRegMapGenerator(component, self.memMap, self.wordWidth)
+		if (baseGen != None):
+			vhdlGen.share_indices(baseGen)
+		configure_reg_map_generator(vhdlGen, self.get_generator_options())
+
+		# Load license text
+		self.lic_text = ""
+		if (self.licPath != ""):
+			self.lic_text = load_license(self.licPath)
+
+		# Check output directory
+		dir_path = os.path.join(ROOT_PATH, self.outDir)
+		if (not os.path.isdir(dir_path)):
+			print("ERROR: " + dir_path + " is not a directory")
+			sys.exit(1)
+
+		# Create common package for whole address map
+		self.write_reg_map_package(vhdlGen, dir_path)
+
+		# Create implementation of each register block within address map
+		self.write_reg_map_implementation(vhdlGen, dir_path)
+
+		# Create clock domain crossing variants of register blocks
+		self.write_reg_map_cdc(vhdlGen, dir_path)
+
+		# Create top level entity of the memory map
+		if (str_arg_to_bool(str(self.writeTop)) or self.busFrontEnd != "none"):
+			self.write_reg_map_top(vhdlGen, dir_path)
+
+		# Create bus front end of the memory map
+		if (self.busFrontEnd != "none"):
+			self.write_reg_map_front_end(vhdlGen, dir_path)
+
+		# Write report with implementation choices
+		if (str_arg_to_bool(str(self.writeReport))):
+			self.write_reg_map_report(vhdlGen, dir_path)
+
+		# Copy source templates to destination directory
+		self.copy_reg_map_sources(vhdlGen, dir_path, self.outDir)
+
+		self.outStats.report("VHDL register map")
 
 
 	def do_update(self):
 
 		with open(self.xactSpec) as f:
-			name = None
-			offset = 0
 
 			# Load IP-Xact component
-			component = Component()
-			component.load(f)
-
-			# Create new VHDL register map generator
-			vhdlGen = VhdlRegMapGenerator(component, self.memMap, self.wordWidth)
-
-			# Load license text
-			self.lic_text = ""
-			if (self.licPath != ""):
-				self.lic_text = load_license(self.licPath)
-
-			# Check output directory
-			dir_path = os.path.join(ROOT_PATH, self.outDir)
-			if (not os.path.isdir(dir_path)):
-				print("ERROR: " + dir_path + " is not a directory")
-				sys.exit(1)
-
-			# Configure registered / non-registered read
-			if (str_arg_to_bool(self.registeredRead)):
-				vhdlGen.registered_read = True
-			else:
-				vhdlGen.registered_read = False
-
-			# Create common package for whole address map
-			self.write_reg_map_package(vhdlGen, dir_path)
-
-			# Create implementation of each register block within address map
-			self.write_reg_map_implementation(vhdlGen, dir_path)
+			component = load_component(f, self.specCacheDir)
 
-			# Copy source templates to destination directory
-			self.copy_reg_map_sources(vhdlGen, dir_path, self.outDir)
+		self.generate(component)
 
 
 	if __name__ == '__main__':
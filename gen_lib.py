@@ -31,6 +31,8 @@
 ##	Revision history:
 ##		24.01.2018	First implementation based on the previous stand-alone
 ##                  script for generation of VHDL package
+##		16.10.2026	Added write-if-changed outputs
+##		16.10.2026	Copied outputs replaced atomically
 ##
 ################################################################################
 
@@ -41,6 +43,11 @@ import importlib.util
 import os
 import inspect
 import math
+import hashlib
+import filecmp
+import tempfile
+
+from shutil import copyfile, copymode
 
 ################################################################################
 # File path to the local repo of the PyXact framework
@@ -53,9 +60,171 @@ from ipyxact.ipyxact import Component
 from license_updater import *
 
 
-def open_output(output):
+class OutputStats():
+	"""
+	Statistics of written and skipped (unchanged) output files.
+	"""
+
+	# Number of written files
+	written = 0
+
+	# Number of files skipped since their content did not change
+	skipped = 0
+
+	def __init__(self):
+		self.written = 0
+		self.skipped = 0
+
+
+	def add(self, stats):
+		"""
+		Add statistics of other outputs (e.g. from worker process).
+		"""
+		self.written += stats.written
+		self.skipped += stats.skipped
+
+
+	def report(self, name):
+		"""
+		Print number of written and skipped output files.
+		"""
+		print("{}: {} files written, {} unchanged files skipped".format(name,
+				self.written, self.skipped))
+
+
+class ChangedOnlyOutput():
+	"""
+	Output file which is written only when its content changes. Content is
+	kept in memory and compared with existing file upon close. Changed file
+	is replaced atomically (temporary file + rename), unchanged file is not
+	touched at all and keeps its timestamp.
+	"""
+
+	# Path of the output file
+	path = None
+
+	# Output content
+	content = None
+
+	# Statistics to update upon close
+	stats = None
+
+	def __init__(self, path, stats=None):
+		self.path = path
+		self.content = []
+		self.stats = stats
+
+
+	def write(self, text):
+		self.content.append(text)
+
+
+	def is_changed(self, text):
+		"""
+		Check if text differs from content of existing output file.
+		"""
+		if (not os.path.isfile(self.path)):
+			return True
+
+		with open(self.path, 'r') as fd:
+			old_text = fd.read()
+
+		new_hash = hashlib.sha256(text.encode()).digest()
+		old_hash = hashlib.sha256(old_text.encode()).digest()
+
+		return new_hash != old_hash
+
+
+	def close(self):
+		"""
+		Write the content to the output file if it changed. Returns True
+		if file was written, False otherwise.
+		"""
+		if (self.content == None):
+			return False
+
+		text = "".join(self.content)
+		self.content = None
+
+		if (not self.is_changed(text)):
+			if (self.stats != None):
+				self.stats.skipped += 1
+			return False
+
+		# Temporary file is created by "open" to get the same permissions as
+		# regular output file.
+		tmp_path = "{}.{}.tmp".format(self.path, os.getpid())
+		try:
+			with open(tmp_path, 'w') as of:
+				of.write(text)
+			os.replace(tmp_path, self.path)
+		except:
+			if (os.path.isfile(tmp_path)):
+				os.remove(tmp_path)
+			raise
+
+		if (self.stats != None):
+			self.stats.written += 1
+		return True
+
+
+	def __enter__(self):
+		return self
+
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		# Don't replace output by partially generated content
+		if (exc_type != None):
+			self.content = None
+			return False
+		self.close()
+		return False
+
+
+def open_output(output, onlyChanged=False, stats=None):
+	"""
+	Open output file for writing.
+	Arguments:
+		output		Path of the output file
+		onlyChanged	When True, file is written only if its content changes
+		stats		Output statistics to update (optional)
+	"""
+	if (onlyChanged):
+		return ChangedOnlyOutput(output, stats)
+
+	if (stats != None):
+		stats.written += 1
 	return open(output, 'w')
 
+
+def copy_output(src, dest, onlyChanged=False, stats=None):
+	"""
+	Copy file to output. When "onlyChanged" is set, file is copied only
+	if the destination differs from the source. Destination is replaced
+	atomically (temporary file in destination directory + rename).
+	"""
+	if (onlyChanged and os.path.isfile(dest) and
+		filecmp.cmp(src, dest, shallow=False)):
+		if (stats != None):
+			stats.skipped += 1
+		return False
+
+	(fd, tmp_path) = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dest)),
+										suffix=".tmp")
+	os.close(fd)
+	try:
+		copyfile(src, tmp_path)
+		copymode(src, tmp_path)
+		os.replace(tmp_path, dest)
+	except:
+		if (os.path.isfile(tmp_path)):
+			os.remove(tmp_path)
+		raise
+
+	if (stats != None):
+		stats.written += 1
+	return True
+
 def split_string(input, size):
 	return [input[start:start+size] for start in range(0, len(input), size)]
 	
@@ -0,0 +1,93 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Classification of IP-XACT register access values to flag sets. Each
+##   access value (read-write, read-only, writeOnce ...) is converted to an
+##   integer with flags of access types it consists of. Access type checks
+##   are then simple bit tests.
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+# Access type flags
+ACCESS_READ		= 0x1
+ACCESS_WRITE	= 0x2
+ACCESS_ONCE		= 0x4
+ACCESS_ONLY		= 0x8
+
+# Sub-strings of IP-XACT access value and flags they represent
+ACCESS_FLAG_NAMES = [["read", ACCESS_READ], ["write", ACCESS_WRITE],
+					 ["Once", ACCESS_ONCE], ["only", ACCESS_ONLY]]
+
+
+def calc_access_flags(access):
+	"""
+	Convert IP-XACT access value (or its part) to set of access flags.
+	E.g.:
+		read-writeOnce	-> ACCESS_READ | ACCESS_WRITE | ACCESS_ONCE
+		read-only		-> ACCESS_READ | ACCESS_ONLY
+		""				-> 0 (matches any register)
+	"""
+	flags = 0
+	if (access == None):
+		return flags
+
+	for [name, flag] in ACCESS_FLAG_NAMES:
+		if (name in access):
+			flags |= flag
+
+	return flags
+
+
+def calc_access_masks(accesses):
+	"""
+	Convert list of IP-XACT access values to list of access flag sets.
+	"""
+	return [calc_access_flags(access) for access in accesses]
+
+
+def has_access_flags(flags, masks):
+	"""
+	Check if access flags contain all flags of at least one of the masks.
+	"""
+	for mask in masks:
+		if ((flags & mask) == mask):
+			return True
+	return False
+
+
+def is_access_flags(flags, masks):
+	"""
+	Check if access flags are equal to at least one of the masks.
+	"""
+	for mask in masks:
+		if (flags == mask):
+			return True
+	return False
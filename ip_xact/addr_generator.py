@@ -32,6 +32,10 @@
 ##
 ##	Revision history:
 ##		25.01.2018	First implementation
+##		16.10.2026	Word queries answered from per-block word index
+##		16.10.2026	Access types of registers classified to flag sets
+##		16.10.2026	Configurable output sink of language generator
+##		16.10.2026	Bit masks of registers calculated as integers
 ##
 ################################################################################
 
@@ -39,6 +43,12 @@ from abc import ABCMeta, abstractmethod
 
 import math
 
+from pyXact_generator.ip_xact.block_word_index import BlockWordIndex
+from pyXact_generator.ip_xact.access_type import *
+from pyXact_generator.ip_xact.reg_masks import *
+from pyXact_generator.languages.output_sink import create_output_sink, \
+													DEFAULT_CHUNK_SIZE
+
 class IpXactAddrGenerator(metaclass=ABCMeta):
 
 	# IP-XACT memory map object
@@ -53,10 +63,39 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 	pyXactComp = None	
 	
 	of = None
+
+	# Language generator used by the address generator
+	lanGen = None
+
+	# Type of output sink: "memory" (whole output is written at once upon
+	# commit), "file" (each line is passed to the file) or "chunked" (output
+	# is written in chunks of "outChunkSize" characters).
+	outSink = "memory"
+
+	# Size of output chunk for "chunked" output sink (in characters)
+	outChunkSize = DEFAULT_CHUNK_SIZE
+
+	# Word indices of address blocks (dictionary: block name -> BlockWordIndex)
+	blkWrdIndices = None
+
+	# Access flags of registers (dictionary: id(register) -> access flags)
+	regAccessFlags = None
+
+	# Access flag masks of queried access types (dictionary: tuple of access
+	# types -> list of masks)
+	accessMasks = None
+
+	# Bit masks of registers (dictionary: id(register) -> [data_mask,
+	# rstval_mask, autoclear_mask])
+	regMasks = None
 	
 	def __init__(self, pyXactComp, memMap, wordWidth):
 		self.wrdWidthBit = wordWidth
 		self.wrdWidthByte = int(wordWidth / 8)
+		self.blkWrdIndices = {}
+		self.regAccessFlags = {}
+		self.accessMasks = {}
+		self.regMasks = {}
 
 		if (not pyXactComp.memoryMaps):
 			return None
@@ -67,6 +106,21 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 
 		self.pyXactComp = pyXactComp		
 
+		self.classify_reg_accesses()
+
+
+	def classify_reg_accesses(self):
+		"""
+		Classify access type of each register within the memory map to set
+		of access flags.
+		"""
+		if (self.memMap == None):
+			return
+
+		for block in self.memMap.addressBlock:
+			for reg in block.register:
+				self.regAccessFlags[id(reg)] = calc_access_flags(reg.access)
+
 
 	def commit_to_file(self, of, text):
 		""" 
@@ -82,11 +136,16 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 	
 	def set_of(self, of):
 		""" 
-		Sets the output file to the internal output file of instance
+		Sets the output file to the internal output file of instance. For
+		streaming output sinks, new sink writing to the file is created.
 		Arguments:
 			of		Output file to set
 		"""
 		self.of = of
+
+		if (self.lanGen != None and self.outSink != "memory"):
+			self.lanGen.set_sink(create_output_sink(self.outSink, of,
+								self.outChunkSize))
 	
 	
 	def move_till_text(self, of, text):
@@ -103,23 +162,58 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 				break
 
 
-	def get_regs_from_word(self, word_addr, block):
+	def get_blk_wrd_index(self, block):
 		"""
-		Create list of registers within given memory word address
+		Get word index of an address block. Index is built upon first request
+		for a block and re-used by all further word queries on the block.
 		"""
-		regs_in_wrd = []
-		for reg in sorted(block.register, key=lambda a: a.addressOffset):
-			reg_wrd_addr = reg.addressOffset - reg.addressOffset % self.wrdWidthByte;
+		index = self.blkWrdIndices.get(block.name)
+		if (index == None or index.block is not block):
+			index = BlockWordIndex(block, self.wrdWidthByte,
+									self.reg_has_access_type)
+			self.blkWrdIndices[block.name] = index
 
-			if (reg_wrd_addr == word_addr):
-				regs_in_wrd.append(reg)
+		return index
 
-			# Exit upon last possible register (further are for sure in higher 
-			# words), no need to search further
-			if (reg.addressOffset > (word_addr + self.wrdWidthByte)):
-				break
 
-		return regs_in_wrd
+	def build_blk_wrd_indices(self, accesses_list=[[""], ["read"], ["write"]]):
+		"""
+		Build word indices of all address blocks within the memory map in
+		advance, together with views for given access types. Afterwards, the
+		indices are only read, thus they can be shared by generators which
+		run concurrently.
+		"""
+		if (self.memMap == None):
+			return
+
+		for block in self.memMap.addressBlock:
+			index = self.get_blk_wrd_index(block)
+			for accesses in accesses_list:
+				index.get_access_view(accesses)
+				self.get_access_masks(accesses)
+
+
+	def share_indices(self, gen):
+		"""
+		Re-use block word indices and register access flags of other
+		generator of the same memory map and word width.
+		"""
+		if (gen.wrdWidthByte != self.wrdWidthByte or
+			gen.memMap is not self.memMap):
+			print("Word indices can't be shared between generators of " \
+					"different memory maps or word widths!")
+			return
+
+		self.blkWrdIndices = gen.blkWrdIndices
+		self.regAccessFlags = gen.regAccessFlags
+		self.accessMasks = gen.accessMasks
+
+
+	def get_regs_from_word(self, word_addr, block):
+		"""
+		Create list of registers within given memory word address
+		"""
+		return self.get_blk_wrd_index(block).get_regs_from_word(word_addr)
 
 
 	def addr_reg_lookup(self, fieldReg):
@@ -144,6 +238,42 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 		return math.floor(addr - (addr % self.wrdWidthByte))
 
 
+	def get_reg_access_flags(self, reg):
+		"""
+		Get access flags of a register. Registers which were not classified
+		upon load of the memory map are classified now.
+		"""
+		flags = self.regAccessFlags.get(id(reg))
+		if (flags == None):
+			flags = calc_access_flags(reg.access)
+			self.regAccessFlags[id(reg)] = flags
+		return flags
+
+
+	def get_reg_masks(self, reg):
+		"""
+		Get data mask, reset value mask and autoclear mask of a register as
+		integers (see calc_reg_masks). Masks are calculated on first request.
+		"""
+		masks = self.regMasks.get(id(reg))
+		if (masks == None):
+			masks = calc_reg_masks(reg)
+			self.regMasks[id(reg)] = masks
+		return masks
+
+
+	def get_access_masks(self, accesses):
+		"""
+		Get access flag masks for list of access types.
+		"""
+		key = tuple(accesses)
+		masks = self.accessMasks.get(key)
+		if (masks == None):
+			masks = calc_access_masks(accesses)
+			self.accessMasks[key] = masks
+		return masks
+
+
 	def reg_is_access_type(self, reg, accesses):
 		"""
 		Check if register is explicitly of given access type. If input
@@ -153,10 +283,8 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 		    searched access type: write-Once
 			False is returned		
 		"""
-		for access in accesses:
-			if (access == reg.access):
-				return True
-		return False		
+		return is_access_flags(self.get_reg_access_flags(reg),
+								self.get_access_masks(accesses))
 
 
 	def reg_has_access_type(self, reg, accesses):
@@ -168,10 +296,16 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 		    searched access type: write-Once
 			True is returned
 		"""
-		for access in accesses:
-			if (access in reg.access):
-				return True
-		return False
+		return has_access_flags(self.get_reg_access_flags(reg),
+								self.get_access_masks(accesses))
+
+
+	def get_access_regs(self, block, accesses=[""]):
+		"""
+		Get registers of a block with given access types, sorted by address
+		offset.
+		"""
+		return self.get_blk_wrd_index(block).get_access_regs(accesses)
 
 
 	def is_reg_write_indicate(self, reg):
@@ -207,20 +341,15 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 			[low_addr, high_addr] - Lowest higher addresses within a block
 				with registers of given access types.
 		"""
-		low_addr = block.range
-		high_addr = 0
-
-		for reg in block.register:
-			if (not (self.reg_has_access_type(reg, accesses))):
-				continue
+		return self.get_blk_wrd_index(block).calc_wrd_span(accesses)
 
-			if (reg.addressOffset < low_addr):
-				low_addr = self.align_addr_to_wrd(reg.addressOffset) 
 
-			if (reg.addressOffset > high_addr):
-				high_addr = self.align_addr_to_wrd(reg.addressOffset)
-
-		return [low_addr, high_addr]
+	def get_used_words(self, block, accesses=[""]):
+		"""
+		Get sorted list of word addresses within a block with at least one
+		register of given access types.
+		"""
+		return self.get_blk_wrd_index(block).get_used_words(accesses)
 
 
 	def calc_blk_wrd_count(self, block, accesses=[""]):
@@ -232,21 +361,7 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 			accesses    List of register access types that should be considered.
 						If not specified, every register is considered.
 		"""
-		cnt = 0
-		highestWrd = -1
-		for reg in sorted(block.register, key=lambda a: a.addressOffset):
-
-			# Check if register is of given Access type
-			if (not (self.reg_has_access_type(reg, accesses))):
-				continue
-
-			act_wrd = self.align_addr_to_wrd(reg.addressOffset)
-
-			if (highestWrd < act_wrd):
-				highestWrd = act_wrd
-				cnt = cnt + 1
-
-		return cnt
+		return self.get_blk_wrd_index(block).calc_wrd_count(accesses)
 
 
 	def get_wrd_index(self, block, reg, accesses=[""]):
@@ -254,35 +369,14 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 		Calculate index of memory word which contains given register. Take
 		into account only registers with given access types.
 		"""
-		index = 0
-
-		# Check each word in the memory block
-		[low_addr, high_addr] = self.calc_blk_wrd_span(block, accesses)
-		high_addr += self.wrdWidthByte
-
-		for wrd_addr in range(low_addr, high_addr, self.wrdWidthByte):
-			
-			# Check that on this memory word, there is a register exisiting
-			# with a given access type            
-			for s_reg in sorted(block.register, key=lambda a: a.addressOffset): 
-
-				# Skip registers whose access type we are not interested in
-				if (not self.reg_has_access_type(s_reg, accesses)):
-					continue;
+		return self.get_blk_wrd_index(block).get_wrd_index(reg, accesses)
 
-				# Check that register resides within this word
-				aligned_reg_addr = self.align_addr_to_wrd(s_reg.addressOffset)
-				if (aligned_reg_addr == wrd_addr):
-					index += 1
-					break
 
-			# If register word address is matching the actually searched
-			# address, we the index holds the
-			searched_addr = self.align_addr_to_wrd(reg.addressOffset)
-			if (searched_addr == wrd_addr):
-				return index
-
-		return None
+	def get_sorted_regs(self, block):
+		"""
+		Get registers of an address block sorted by address offset.
+		"""
+		return self.get_blk_wrd_index(block).sortedRegs
 
 
 	def parameter_lookup(self, uid):
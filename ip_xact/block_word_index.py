@@ -0,0 +1,187 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Word index of IP-XACT address block. Registers of the block are sorted
+##   and grouped to memory words only once. Queries on word span, word count
+##   and word index are then answered without re-scanning the block.
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##		16.10.2026	Register arrays expanded to their elements
+##
+################################################################################
+
+import bisect
+
+from pyXact_generator.ip_xact.reg_array import expand_reg_arrays
+
+class BlockWordIndex():
+
+	# IP-XACT address block object
+	block = None
+
+	# Word width in Bytes
+	wrdWidthByte = None
+
+	# Registers of the block sorted by address offset. Register arrays are
+	# expanded to their elements.
+	sortedRegs = None
+
+	# Dictionary: word address -> list of registers within the word
+	wrdRegs = None
+
+	# Filtered views of the block, one per access type list. Each view is a
+	# list: [sorted_words, {word_address : dense_index}, sorted_registers]
+	accessViews = None
+
+	# Function deciding if register is of given access types:
+	#	reg_filter(reg, accesses) -> True / False
+	regFilter = None
+
+
+	def __init__(self, block, wrdWidthByte, regFilter):
+		self.block = block
+		self.wrdWidthByte = wrdWidthByte
+		self.regFilter = regFilter
+		self.accessViews = {}
+
+		self.sortedRegs = sorted(expand_reg_arrays(block.register),
+									key=lambda a: a.addressOffset)
+
+		self.wrdRegs = {}
+		for reg in self.sortedRegs:
+			wrd_addr = self.align_addr_to_wrd(reg.addressOffset)
+			self.wrdRegs.setdefault(wrd_addr, []).append(reg)
+
+
+	def align_addr_to_wrd(self, addr):
+		"""
+		Align address of a register to word address.
+		"""
+		return addr - (addr % self.wrdWidthByte)
+
+
+	def get_access_view(self, accesses):
+		"""
+		Get sorted list of registers of given access types, sorted list of
+		words with such registers and table of dense indices of these words.
+		Views are built on first request for given access types and kept
+		afterwards.
+		"""
+		key = tuple(accesses)
+		view = self.accessViews.get(key)
+		if (view != None):
+			return view
+
+		regs = []
+		words = []
+		for reg in self.sortedRegs:
+			if (not self.regFilter(reg, accesses)):
+				continue
+
+			regs.append(reg)
+			wrd_addr = self.align_addr_to_wrd(reg.addressOffset)
+			if (not words or words[-1] != wrd_addr):
+				words.append(wrd_addr)
+
+		# Dense index is counted from 1, as word index of the generator
+		dense_index = {}
+		for (i, wrd_addr) in enumerate(words):
+			dense_index[wrd_addr] = i + 1
+
+		view = [words, dense_index, regs]
+		self.accessViews[key] = view
+		return view
+
+
+	def get_access_regs(self, accesses=[""]):
+		"""
+		Get registers of given access types sorted by address offset.
+		"""
+		return self.get_access_view(accesses)[2]
+
+
+	def get_regs_from_word(self, word_addr):
+		"""
+		Get list of registers within given memory word address, sorted by
+		address offset.
+		"""
+		return self.wrdRegs.get(word_addr, [])
+
+
+	def get_used_words(self, accesses=[""]):
+		"""
+		Get sorted list of word addresses with at least one register of given
+		access types.
+		"""
+		return self.get_access_view(accesses)[0]
+
+
+	def calc_wrd_span(self, accesses=[""]):
+		"""
+		Calculate minimal address span of the block with registers of given
+		access types.
+		Returns:
+			[low_addr, high_addr] - Lowest and highest word addresses within
+				a block with registers of given access types.
+		"""
+		words = self.get_access_view(accesses)[0]
+		if (not words):
+			return [self.block.range, 0]
+
+		return [words[0], words[-1]]
+
+
+	def calc_wrd_count(self, accesses=[""]):
+		"""
+		Calculate number of memory words occupied by registers of given access
+		types.
+		"""
+		return len(self.get_access_view(accesses)[0])
+
+
+	def get_wrd_index(self, reg, accesses=[""]):
+		"""
+		Calculate index of memory word which contains given register. Only
+		words with registers of given access types are counted. Index of the
+		first such word is 1. None is returned when the register lies out of
+		span of such words.
+		"""
+		[words, dense_index, regs] = self.get_access_view(accesses)
+		wrd_addr = self.align_addr_to_wrd(reg.addressOffset)
+
+		index = dense_index.get(wrd_addr)
+		if (index != None):
+			return index
+
+		if (not words or wrd_addr < words[0] or wrd_addr > words[-1]):
+			return None
+
+		# Register word does not contain any register of given access type,
+		# count the words below it.
+		return bisect.bisect_right(words, wrd_addr)
@@ -30,11 +30,18 @@
 ## 
 ##	Revision history:
 ##		25.01.2018	First implementation
+##		16.10.2026	Write helpers of shadow register groups
+##		16.10.2026	Set / clear / toggle aliases of registers
+##		16.10.2026	Static inline accessors of registers and fields
+##		16.10.2026	Structure overlay of address blocks
 ##
 ################################################################################
 
 from abc import ABCMeta, abstractmethod
 from pyXact_generator.ip_xact.addr_generator import IpXactAddrGenerator
+from pyXact_generator.ip_xact.shadow_group import get_shadow_groups
+from pyXact_generator.ip_xact.reg_alias import get_reg_aliases
+from pyXact_generator.ip_xact.reg_array import get_reg_dim
 
 from pyXact_generator.languages.gen_h import HeaderGenerator
 from pyXact_generator.languages.declaration import LanDeclaration
@@ -44,14 +51,22 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 	headerGen = None
 	prefix	= ""
 
+	# When True, static inline accessors of registers and fields are written
+	# together with shift / mask constants and compile-time layout checks.
+	writeAccessors = False
+
+	# When True, structure overlay of each register block is written
+	# together with compile-time checks of offsets of its members.
+	writeBlockStructs = False
+
 	def __init__(self, pyXactComp, memMap, wrdWidthBit):
 		super().__init__(pyXactComp, memMap, wrdWidthBit)
 		self.headerGen = HeaderGenerator()
+		self.lanGen = self.headerGen
 	
 	
 	def commit_to_file(self):
-		for line in self.headerGen.out :
-			self.of.write(line)
+		self.headerGen.flush_output(self.of)
 	
 
 	def create_reg_field_decl(self, reg, field):
@@ -70,6 +85,15 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 		return fieldDecl
 
 
+	def get_reg_group_union_name(self, regGroup):
+		"""
+		Get name of union of group of registers within single memory word.
+		Name is concatenated from all register names within the group.
+		"""
+		return self.prefix + "_" + "_".join([reg.name.lower()
+												for reg in regGroup])
+
+
 	def write_reg_group_union(self, regGroup):
 		"""
 		Write group of IP-XACT register objects as a single union to generator
@@ -91,7 +115,7 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 		"""
 		fielDecls = []
 		enumDecl = []
-		unName = self.prefix + "_"
+		unName = self.get_reg_group_union_name(regGroup)
 
 		for (j,reg) in enumerate(regGroup):
 
@@ -104,11 +128,6 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 
 				fielDecls.append(fieldDecl)
 
-			# Append register name to the union name
-			unName += reg.name.lower()
-			if (j != len(regGroup) - 1):
-				unName += "_"
-
 		enumDecl = []
 
 		# Create declaration of u<wrd_width> union member
@@ -239,6 +258,452 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 										decls)
 	
 	
+	def get_reg_c_type(self, reg):
+		"""
+		Get C type of register value (uint<size>_t).
+		"""
+		return "uint{}_t".format(reg.size)
+
+
+	def get_reg_define_prefix(self, reg, field=None):
+		"""
+		Get prefix of constants of register or its field:
+			<PREFIX>_<REG>[_<FIELD>]
+		"""
+		name = self.prefix + "_" + reg.name
+		if (field != None):
+			name += "_" + field.name
+		return name.upper()
+
+
+	def format_c_mask(self, mask, size):
+		"""
+		Format mask as unsigned C literal of given bit size.
+		"""
+		suffix = "U"
+		if (size > 32):
+			suffix = "ULL"
+		return "0x{:0{}x}{}".format(mask, int(size / 4), suffix)
+
+
+	def write_reg_field_consts(self, reg):
+		"""
+		Write shift and mask constants of fields of a register. Shifts are
+		relative to the register (not to the memory word):
+			#define <PREFIX>_<REG>_<FIELD>_SHIFT	<bit offset>
+			#define <PREFIX>_<REG>_<FIELD>_MASK		<mask>
+		"""
+		for field in sorted(reg.field, key=lambda a: a.bitOffset):
+			name = self.get_reg_define_prefix(reg, field)
+			mask = ((1 << field.bitWidth) - 1) << field.bitOffset
+			self.headerGen.create_define(name + "_SHIFT",
+											str(field.bitOffset))
+			self.headerGen.create_define(name + "_MASK",
+											self.format_c_mask(mask, reg.size))
+
+
+	def write_reg_accessors(self, reg):
+		"""
+		Write static inline accessors of a register. Readable register gets
+		read accessor, writable register gets write accessor. Each field
+		gets get / set accessor which extracts / inserts field from / to
+		register value:
+			<prefix>_<reg>_read(base)
+			<prefix>_<reg>_write(base, value)
+			<prefix>_<reg>_<field>_get(reg)
+			<prefix>_<reg>_<field>_set(reg, value)
+		Accessors of register arrays have index of the element after "base"
+		and number of elements is given by <PREFIX>_<REG>_COUNT.
+		Register addresses are relative to base of the memory map.
+		"""
+		ctype = self.get_reg_c_type(reg)
+		name = (self.prefix + "_" + reg.name).lower()
+		addr = self.get_reg_define_prefix(reg)
+		index = ""
+
+		dim = get_reg_dim(reg)
+		if (dim > 0):
+			self.headerGen.create_define(addr + "_COUNT", str(dim))
+			self.headerGen.wr_nl()
+			addr = "{} + index * {}".format(addr, int(reg.size / 8))
+			index = ",\n\tunsigned int index"
+
+		if (self.reg_has_access_type(reg, ["read"])):
+			self.headerGen.wr_line("static inline {} {}_read(const volatile " \
+				"void *base{})\n".format(ctype, name, index))
+			self.headerGen.wr_line("{\n")
+			self.headerGen.wr_line("\treturn *(const volatile {} *)((const " \
+				"volatile uint8_t *)base +\n".format(ctype))
+			self.headerGen.wr_line("\t\t{});\n".format(addr))
+			self.headerGen.wr_line("}\n")
+			self.headerGen.wr_nl()
+
+		if (self.reg_has_access_type(reg, ["write"])):
+			self.headerGen.wr_line("static inline void {}_write(volatile " \
+				"void *base{}, {} value)\n".format(name, index, ctype))
+			self.headerGen.wr_line("{\n")
+			self.write_mmio_store(ctype, addr, "value")
+			self.headerGen.wr_line("}\n")
+			self.headerGen.wr_nl()
+
+		for field in sorted(reg.field, key=lambda a: a.bitOffset):
+			fname = (name + "_" + field.name).lower()
+			const = self.get_reg_define_prefix(reg, field)
+
+			self.headerGen.wr_line("static inline {} {}_get({} reg)\n".format(
+				ctype, fname, ctype))
+			self.headerGen.wr_line("{\n")
+			self.headerGen.wr_line("\treturn ({})((reg & {}_MASK) >>\n".format(
+				ctype, const))
+			self.headerGen.wr_line("\t\t{}_SHIFT);\n".format(const))
+			self.headerGen.wr_line("}\n")
+			self.headerGen.wr_nl()
+
+			self.headerGen.wr_line("static inline {} {}_set({} reg, {} " \
+				"value)\n".format(ctype, fname, ctype, ctype))
+			self.headerGen.wr_line("{\n")
+			self.headerGen.wr_line("\treturn ({})((reg & ~{}_MASK) |\n".format(
+				ctype, const))
+			self.headerGen.wr_line("\t\t((value << {}_SHIFT) &\n".format(
+				const))
+			self.headerGen.wr_line("\t\t {}_MASK));\n".format(const))
+			self.headerGen.wr_line("}\n")
+			self.headerGen.wr_nl()
+
+
+	def write_layout_asserts(self, regs):
+		"""
+		Write compile-time checks of layout of registers of an address block:
+			- Union of each memory word has size of the word.
+			- Register address is aligned to its size.
+			- Fields of register do not overlap and fit into the register.
+		"""
+		for regGroup in self.sort_regs_to_wrd_groups(regs):
+			if (not regGroup):
+				continue
+			self.headerGen.create_static_assert("sizeof(union {}) == {}".format(
+				self.get_reg_group_union_name(regGroup), self.wrdWidthByte),
+				"Unexpected size of {} union".format(
+					self.get_reg_group_union_name(regGroup)))
+
+		for reg in sorted(regs, key=lambda a: a.addressOffset):
+			self.headerGen.create_static_assert("{} % {} == 0".format(
+				self.get_reg_define_prefix(reg), int(reg.size / 8)),
+				"{} is not aligned to its size".format(reg.name.upper()))
+
+			if (not reg.field):
+				continue
+			masks = ["{}_MASK".format(self.get_reg_define_prefix(reg, field))
+						for field in sorted(reg.field, key=lambda a: a.bitOffset)]
+			self.headerGen.create_static_assert("(0ULL + {}) ==\n\t({})".format(
+				" + ".join(masks), " | ".join(masks)),
+				"Fields of {} overlap".format(reg.name.upper()))
+			self.headerGen.create_static_assert("(({}) & ~0x{:x}ULL) == 0".format(
+				" | ".join(masks), (1 << reg.size) - 1),
+				"Fields of {} exceed its size".format(reg.name.upper()))
+
+
+	def write_mem_map_accessors(self):
+		"""
+		Write shift / mask constants and accessors of registers and fields
+		within the memory map, followed by compile-time layout checks.
+		"""
+		blocks = [block for block in self.memMap.addressBlock
+					if block.usage != "memory"]
+
+		self.headerGen.wr_nl()
+		self.headerGen.write_comment("Register accessors:", 0, small=False)
+		self.headerGen.wr_nl()
+
+		for block in blocks:
+			for reg in sorted(block.register, key=lambda a: a.addressOffset):
+				self.headerGen.write_comment(reg.name.upper(), 0, small=True)
+				self.write_reg_field_consts(reg)
+				self.headerGen.wr_nl()
+				self.write_reg_accessors(reg)
+
+		# Static assertions are available since C11
+		self.headerGen.wr_line("#if defined(__STDC_VERSION__) && " \
+			"(__STDC_VERSION__ >= 201112L)\n")
+		for block in blocks:
+			self.write_layout_asserts(block.register)
+		self.headerGen.wr_line("#endif\n")
+		self.headerGen.wr_nl()
+
+
+	def get_block_struct_name(self, block):
+		"""
+		Get name of structure overlay of an address block.
+		"""
+		return (self.prefix + "_" + block.name + "_regs").lower()
+
+
+	def get_block_struct_members(self, block):
+		"""
+		Get members of structure overlay of an address block in order of
+		their offsets. Gaps between registers are filled by reserved byte
+		arrays, last one fills the block till its range. Register arrays
+		are members of array type.
+		Returns:
+			List of [name, type, count, offset, reg], "reg" is None and
+			"count" is number of bytes for reserved members.
+		"""
+		members = []
+		offset = 0
+		for reg in sorted(block.register, key=lambda a: a.addressOffset):
+			if (reg.addressOffset < offset):
+				print("Register {} of block {} overlaps previous register, " \
+					"it is not member of {}".format(reg.name, block.name,
+						self.get_block_struct_name(block)))
+				continue
+
+			if (reg.addressOffset > offset):
+				members.append(["reserved_{:x}".format(offset), "uint8_t",
+								reg.addressOffset - offset, offset, None])
+
+			count = max(get_reg_dim(reg), 1)
+			members.append([reg.name.lower(), self.get_reg_c_type(reg),
+							get_reg_dim(reg), reg.addressOffset, reg])
+			offset = reg.addressOffset + count * int(reg.size / 8)
+
+		if (block.range > offset):
+			members.append(["reserved_{:x}".format(offset), "uint8_t",
+							block.range - offset, offset, None])
+
+		return members
+
+
+	def write_block_struct(self, block):
+		"""
+		Write structure overlay of an address block. Block mapped at single
+		base pointer is accessed by members with constant offsets:
+			struct <prefix>_<block>_regs {
+				volatile uint32_t <reg>;
+				volatile uint8_t reserved_<offset>[<bytes>];
+				...
+			};
+		Members are naturally aligned, thus structure needs no packing.
+		"""
+		decls = []
+		for [name, ctype, count, offset, reg] in \
+				self.get_block_struct_members(block):
+			if (count > 0):
+				name += "[{}]".format(count)
+			decls.append(LanDeclaration(name, value=None, type=ctype,
+										specifier="volatile", gap=1))
+
+		self.headerGen.create_structure(self.get_block_struct_name(block),
+										decls)
+		self.headerGen.wr_nl()
+
+
+	def write_block_struct_asserts(self, block):
+		"""
+		Write compile-time checks of offsets of registers within structure
+		overlay of an address block and of its size.
+		"""
+		name = self.get_block_struct_name(block)
+		for [member, ctype, count, offset, reg] in \
+				self.get_block_struct_members(block):
+			if (reg == None):
+				continue
+			self.headerGen.create_static_assert("offsetof(struct {}, {}) " \
+				"== {}".format(name, member, hex(offset)),
+				"Unexpected offset of {} in {}".format(member, name))
+
+		if (block.range >= self.calc_block_struct_end(block)):
+			self.headerGen.create_static_assert("sizeof(struct {}) == " \
+				"{}".format(name, hex(block.range)),
+				"Unexpected size of {}".format(name))
+
+
+	def calc_block_struct_end(self, block):
+		"""
+		Calculate offset of end of the last member of structure overlay.
+		"""
+		[name, ctype, count, offset, reg] = \
+			self.get_block_struct_members(block)[-1]
+		if (reg == None):
+			return offset + count
+		return offset + max(count, 1) * int(reg.size / 8)
+
+
+	def write_block_structs(self):
+		"""
+		Write structure overlay of each register block within the memory
+		map, followed by compile-time checks of its layout.
+		"""
+		blocks = [block for block in self.memMap.addressBlock
+					if block.usage != "memory" and block.register]
+		if (not blocks):
+			return
+
+		self.headerGen.wr_nl()
+		self.headerGen.write_comment("Register block overlays:", 0,
+										small=False)
+		self.headerGen.wr_nl()
+
+		for block in blocks:
+			self.headerGen.write_comment("{} block (base address {})".format(
+				block.name, hex(block.baseAddress)), 0, small=True)
+			self.write_block_struct(block)
+
+		# Static assertions are available since C11
+		self.headerGen.wr_line("#if defined(__STDC_VERSION__) && " \
+			"(__STDC_VERSION__ >= 201112L)\n")
+		self.headerGen.create_includes(["<stddef.h>"])
+		for block in blocks:
+			self.write_block_struct_asserts(block)
+		self.headerGen.wr_line("#endif\n")
+		self.headerGen.wr_nl()
+
+
+	def write_mmio_store(self, ctype, addr, value):
+		"""
+		Write statement which stores value to memory mapped address given
+		relative to "base" pointer. Long address is given on separate line.
+		"""
+		line = "\t*(volatile {} *)((volatile uint8_t *)base + {}) =\n".format(
+					ctype, addr)
+		if (len(line) > 80):
+			self.headerGen.wr_line("\t*(volatile {} *)((volatile uint8_t *)" \
+				"base +\n".format(ctype))
+			self.headerGen.wr_line("\t\t{}) = {};\n".format(addr, value))
+		else:
+			self.headerGen.wr_line(line)
+			self.headerGen.wr_line("\t\t{};\n".format(value))
+
+
+	def get_shadow_group_name(self, block, group):
+		"""
+		Get name of shadow group unique within the memory map:
+			<prefix>_<block>_<group>
+		"""
+		return self.prefix + "_" + block.name.lower() + "_" + group.name
+
+
+	def write_shadow_group_helper(self, block, group):
+		"""
+		Write helper which writes all registers of shadow group. Commit
+		register is written last, thus the group is committed by the helper
+		at once. Register addresses are relative to base of the memory map:
+			static inline void <prefix>_<block>_<group>_write(volatile void *base,
+								uint32_t <reg>, ...)
+		"""
+		regs = [reg for reg in group.regs if reg is not group.commitReg]
+		regs.append(group.commitReg)
+
+		cmnt = "Shadow group {} of {}: committed by write to {}".format(
+					group.name.upper(), block.name,
+					group.commitReg.name.upper())
+		self.headerGen.write_comment(cmnt, 0, small=True)
+
+		# Arguments of helper wrapped to lines
+		args = ["volatile void *base"]
+		args += ["{} {}".format(self.get_reg_c_type(reg), reg.name.lower())
+					for reg in regs]
+		line = "static inline void {}_write(".format(
+					self.get_shadow_group_name(block, group).lower())
+		for (i, arg) in enumerate(args):
+			if (i > 0 and len(line) + len(arg) > 76):
+				self.headerGen.wr_line(line.rstrip() + "\n")
+				line = "\t\t\t\t"
+			line += arg
+			if (i != len(args) - 1):
+				line += ", "
+		self.headerGen.wr_line(line + ")\n")
+
+		self.headerGen.wr_line("{\n")
+		for reg in regs:
+			self.write_mmio_store(self.get_reg_c_type(reg),
+				(self.prefix + "_" + reg.name).upper(), reg.name.lower())
+		self.headerGen.wr_line("}\n")
+		self.headerGen.wr_nl()
+
+
+	def write_shadow_groups(self):
+		"""
+		Write commit registers of shadow groups within the memory map as an
+		enum, and helper to write each group.
+		"""
+		blk_groups = []
+		for block in self.memMap.addressBlock:
+			if (block.usage == "memory"):
+				continue
+			groups = get_shadow_groups(block, self.get_sorted_regs(block),
+						lambda reg: self.reg_has_access_type(reg, ["write"]))
+			blk_groups += [[block, group] for group in groups]
+
+		if (not blk_groups):
+			return
+
+		self.headerGen.wr_nl()
+		self.headerGen.write_comment("Commit registers of shadow groups", 0,
+										small=True)
+		decls = []
+		for [block, group] in blk_groups:
+			decls.append(LanDeclaration((self.get_shadow_group_name(block,
+								group) + "_commit").upper(),
+								value=group.commitReg.addressOffset +
+									block.baseAddress,
+								intType="enum"))
+		self.headerGen.create_enum(self.prefix.lower() + "_shadow_commit",
+									decls)
+		self.headerGen.wr_nl()
+
+		for [block, group] in blk_groups:
+			self.write_shadow_group_helper(block, group)
+
+
+	def write_reg_aliases(self):
+		"""
+		Write addresses of set / clear / toggle aliases of registers as an
+		enum, and helper for each alias:
+			static inline void <prefix>_<reg>_<set|clr|tgl>(
+								volatile void *base, uint32_t mask)
+		"""
+		aliases = []
+		for block in self.memMap.addressBlock:
+			if (block.usage == "memory"):
+				continue
+			aliases += [[block, alias] for alias in get_reg_aliases(block,
+						self.get_sorted_regs(block),
+						lambda reg: self.reg_has_access_type(reg, ["write"]),
+						self.wrdWidthByte,
+						lambda addr: self.get_regs_from_word(addr, block))]
+
+		if (not aliases):
+			return
+
+		self.headerGen.wr_nl()
+		self.headerGen.write_comment("Set / clear / toggle aliases of " \
+			"registers (write-only)", 0, small=True)
+		decls = []
+		for [block, alias] in aliases:
+			decls.append(LanDeclaration((self.prefix + "_" + alias.reg.name +
+								"_" + alias.kind).upper(),
+								value=alias.addressOffset + block.baseAddress,
+								intType="enum"))
+		self.headerGen.create_enum(self.prefix.lower() + "_reg_alias", decls)
+		self.headerGen.wr_nl()
+
+		for [block, alias] in aliases:
+			name = (self.prefix + "_" + alias.reg.name + "_" +
+					alias.kind).lower()
+			self.headerGen.write_comment("{} bits of {} which are 1 in " \
+				"mask".format({"set" : "Set", "clr" : "Clear",
+							   "tgl" : "Toggle"}[alias.kind],
+							   alias.reg.name.upper()), 0, small=True)
+			self.headerGen.wr_line("static inline void {}(volatile void " \
+				"*base, {} mask)\n".format(name,
+											self.get_reg_c_type(alias.reg)))
+			self.headerGen.wr_line("{\n")
+			self.write_mmio_store(self.get_reg_c_type(alias.reg), name.upper(),
+									"mask")
+			self.headerGen.wr_line("}\n")
+			self.headerGen.wr_nl()
+
+
 	def create_addrMap_package(self, name):
 		"""
 		Create C header file package for "memMap" IP-XACT memory block.
@@ -246,6 +711,12 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 			1. Enum with addresses of each register
 			2. Unions for each memory word with registers.
 			3. Enums for each enumerated values of Register fields.
+			4. Shift / mask constants, accessors of registers and fields and
+			   compile-time layout checks (if "writeAccessors" is set).
+			5. Structure overlay of each register block with compile-time
+			   checks of its layout (if "writeBlockStructs" is set).
+			6. Write helpers of shadow register groups.
+			7. Addresses and helpers of register aliases.
 		"""
 		self.headerGen.wr_nl()
 		self.headerGen.write_comment("This file is autogenerated, DO NOT EDIT!",
@@ -269,6 +740,22 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 		if (self.memMap):
 			print ("Writing bit fields of '%s' register map" % self.memMap.name)
 			self.write_mem_map_fields()
+
+		# Write accessors of registers and fields
+		if (self.memMap and self.writeAccessors):
+			print ("Writing accessors of '%s' register map" % self.memMap.name)
+			self.write_mem_map_accessors()
+
+		# Write structure overlays of register blocks
+		if (self.memMap and self.writeBlockStructs):
+			print ("Writing block overlays of '%s' register map" %
+					self.memMap.name)
+			self.write_block_structs()
+
+		# Write helpers of shadow register groups
+		if (self.memMap):
+			self.write_shadow_groups()
+			self.write_reg_aliases()
 	
 		self.headerGen.commit_append_line(1)
 		
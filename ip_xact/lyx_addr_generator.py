@@ -57,14 +57,14 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 		super().__init__(pyXactComp, memMap, wrdWidthBit)
 
 		self.lyxGen = LyxGenerator()
+		self.lanGen = self.lyxGen
 
 		self.genFieldDesc = str_arg_to_bool(str(genFiDesc))
 		self.genRegions = str_arg_to_bool(str(genRegions))
 	
 	
 	def commit_to_file(self):
-		for line in self.lyxGen.out :
-			self.of.write(line)	
+		self.lyxGen.flush_output(self.of)
 
 
 	def reg_append_short_enums(self, field):
@@ -0,0 +1,123 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Set / clear / toggle alias addresses of writable registers. Alias of a
+##   register is given by vendor extension with address offset of the alias
+##   ("setAlias", "clrAlias", "tglAlias"). Logic 1 written to the alias sets,
+##   clears or toggles corresponding bit of the register, bits written with
+##   logic 0 are kept. Aliases are write-only, they must be placed on words
+##   without registers at the same position within word as the register.
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+from pyXact_generator.ip_xact.reg_array import get_reg_array_index
+from pyXact_generator.ip_xact.shadow_group import get_vendor_ext
+
+# Kinds of aliases and vendor extensions with their address offsets
+ALIAS_KINDS = [["set", "setAlias"],
+			   ["clr", "clrAlias"],
+			   ["tgl", "tglAlias"]]
+
+
+class RegAlias():
+
+	# Aliased register
+	reg = None
+
+	# Kind of alias ("set", "clr" or "tgl")
+	kind = None
+
+	# Address offset of alias within address block
+	addressOffset = None
+
+	def __init__(self, reg, kind, addressOffset):
+		self.reg = reg
+		self.kind = kind
+		self.addressOffset = addressOffset
+
+
+def get_reg_aliases(block, regs, is_writable, wrdWidthByte, get_word_regs):
+	"""
+	Get aliases of registers of an address block, sorted by address offset.
+	Only writable registers which are neither arrays nor conditionally
+	present can have aliases. Aliases which overlap registers or other
+	aliases are skipped.
+	Arguments:
+		block			Address block object
+		regs			Registers of the block sorted by address offset
+		is_writable		Function returning True for writable register
+		wrdWidthByte	Word width in bytes
+		get_word_regs	Function returning registers within given word
+						address of the block
+	"""
+	aliases = []
+	used_bytes = set()
+	for reg in regs:
+		for [kind, ext] in ALIAS_KINDS:
+			offset = get_vendor_ext(reg, ext)
+			if (offset == None):
+				continue
+
+			if (not is_writable(reg) or get_reg_array_index(reg) != None or
+				reg.isPresent != ""):
+				print("{} alias of register {} of block {} is not supported " \
+					"(only writable registers which are not arrays and are " \
+					"always present), skipping it".format(kind.upper(),
+						reg.name, block.name))
+				continue
+
+			offset = int(str(offset), 0)
+			wrd_addr = offset - offset % wrdWidthByte
+			reg_bytes = set(range(offset, offset + int(reg.size / 8)))
+
+			if (offset % wrdWidthByte != reg.addressOffset % wrdWidthByte or
+				offset + int(reg.size / 8) > block.range or
+				get_word_regs(wrd_addr) or (used_bytes & reg_bytes)):
+				print("{} alias of register {} of block {} at offset {} " \
+					"overlaps other register, is outside of the block or " \
+					"has different position within word, skipping it".format(
+						kind.upper(), reg.name, block.name, hex(offset)))
+				continue
+
+			used_bytes |= reg_bytes
+			aliases.append(RegAlias(reg, kind, offset))
+
+	return sorted(aliases, key=lambda a: a.addressOffset)
+
+
+def has_reg_alias(reg):
+	"""
+	Check if register has at least one alias given by vendor extension.
+	"""
+	for [kind, ext] in ALIAS_KINDS:
+		if (get_vendor_ext(reg, ext) != None):
+			return True
+	return False
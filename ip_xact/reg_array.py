@@ -0,0 +1,118 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+
+###############################################################################
+##
+##   Register arrays of IP-XACT address blocks. Register with "dim" property
+##   is expanded to its elements, so that word queries see each element on
+##   its own address. Generators which emit arrays as a whole recognise the
+##   elements by their index within the array.
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+import copy
+
+
+def get_reg_dim(reg):
+	"""
+	Get number of elements of register array given by "dim" property of
+	IP-XACT register. Multi-dimensional arrays are flattened (row-major
+	order). Zero is returned for registers which are not arrays.
+	"""
+	dims = getattr(reg, "dim", None)
+	if (not isinstance(dims, list)):
+		dims = [dims]
+
+	count = 0
+	for dim in dims:
+		if (dim == None or dim == ""):
+			continue
+		count = max(count, 1) * int(dim)
+
+	return count
+
+
+def expand_reg_array(reg):
+	"""
+	Expand register array to list of its elements. Elements are copies of
+	the register placed "size" bits apart, starting at address offset of the
+	array. Index of an element is stored in its "arrayIndex" and number of
+	elements in "arrayDim" attribute. Register which is not an array is
+	returned as single item list.
+	"""
+	dim = get_reg_dim(reg)
+	if (dim == 0):
+		return [reg]
+
+	stride = int(reg.size / 8)
+	elems = []
+	for i in range(dim):
+		elem = copy.copy(reg)
+		elem.addressOffset = reg.addressOffset + i * stride
+		elem.arrayIndex = i
+		elem.arrayDim = dim
+		elems.append(elem)
+
+	return elems
+
+
+def expand_reg_arrays(regs):
+	"""
+	Expand all register arrays within list of registers to their elements.
+	"""
+	elems = []
+	for reg in regs:
+		elems.extend(expand_reg_array(reg))
+	return elems
+
+
+def get_reg_array_index(reg):
+	"""
+	Get index of register array element. None is returned for registers
+	which are not elements of an array.
+	"""
+	return getattr(reg, "arrayIndex", None)
+
+
+def get_reg_array_dim(reg):
+	"""
+	Get number of elements of an array which the register is element of.
+	Zero is returned for registers which are not elements of an array.
+	"""
+	return getattr(reg, "arrayDim", 0)
+
+
+def is_reg_array_tail(reg):
+	"""
+	Check if register is element of an array other than the first one.
+	Generators emitting the array as a whole skip such elements.
+	"""
+	index = get_reg_array_index(reg)
+	return (index != None and index > 0)
@@ -0,0 +1,92 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Bit masks of IP-XACT registers calculated as integers. Data mask, reset
+##   value mask and autoclear mask of a register are calculated in single
+##   pass over register fields. Bit 0 of the mask is bit 0 of the register.
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+# Indices of masks returned by calc_reg_masks
+MASK_DATA		= 0
+MASK_RSTVAL		= 1
+MASK_AUTOCLEAR	= 2
+
+
+def calc_bit_mask(bitOffset, bitWidth):
+	"""
+	Calculate mask with "bitWidth" ones starting at "bitOffset".
+	"""
+	if (bitWidth <= 0):
+		return 0
+	return ((1 << bitWidth) - 1) << bitOffset
+
+
+def calc_field_rstval(field):
+	"""
+	Get reset value of a field. Fields without reset value are reset to zero.
+	"""
+	if (field.resets == None or field.resets.reset == None):
+		return 0
+	return int(field.resets.reset.value)
+
+
+def calc_reg_masks(reg):
+	"""
+	Calculate data mask, reset value mask and autoclear mask of a register.
+	Returns:
+		[data_mask, rstval_mask, autoclear_mask]
+			data_mask		- "1" for each bit implemented in the register.
+			rstval_mask		- Value of the register after reset.
+			autoclear_mask	- "1" for each bit of field with "clear" as write
+							  action.
+	"""
+	data_mask = 0
+	rstval_mask = 0
+	autoclear_mask = 0
+
+	for field in reg.field:
+		# Single bit is marked also for fields with zero width
+		data_mask |= calc_bit_mask(field.bitOffset, max(field.bitWidth, 1))
+
+		rstval_mask |= ((calc_field_rstval(field) &
+							calc_bit_mask(0, field.bitWidth)) << field.bitOffset)
+
+		# Highest bit of wider field is not marked (compatibility with
+		# previously generated register maps).
+		if (field.modifiedWriteValue == "clear"):
+			autoclear_mask |= calc_bit_mask(field.bitOffset,
+											max(field.bitWidth - 1, 1))
+
+	reg_mask = calc_bit_mask(0, reg.size)
+
+	return [data_mask & reg_mask, rstval_mask & reg_mask,
+			autoclear_mask & reg_mask]
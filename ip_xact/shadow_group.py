@@ -0,0 +1,144 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Shadow register groups of IP-XACT address blocks. Registers of a group
+##   are marked by "shadowGroup" vendor extension with name of the group.
+##   Writes to the registers land in shadow storage, values of all registers
+##   of a group are committed to output at once by write to commit register
+##   of the group. Commit register is the register with "shadowCommit"
+##   vendor extension set to "true", or the register with the highest
+##   address within the group when no register is marked.
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+from pyXact_generator.gen_lib import *
+from pyXact_generator.ip_xact.reg_array import get_reg_array_index
+from pyXact_generator.ip_xact.reg_masks import calc_reg_masks, MASK_AUTOCLEAR
+
+
+def get_vendor_ext(obj, name, default=None):
+	"""
+	Get value of vendor extension of IP-XACT object. Vendor extensions can
+	be loaded either as dictionary or as object with attributes.
+	"""
+	exts = getattr(obj, "vendorExtensions", None)
+	if (exts == None):
+		return default
+
+	if (isinstance(exts, dict)):
+		value = exts.get(name, default)
+	else:
+		value = getattr(exts, name, default)
+
+	if (value == None or value == ""):
+		return default
+	return value
+
+
+def get_shadow_group(reg):
+	"""
+	Get name of shadow group (lower case) which register is member of. None
+	is returned for registers which are not members of any group.
+	"""
+	group = get_vendor_ext(reg, "shadowGroup")
+	if (group == None):
+		return None
+	return str(group).lower()
+
+
+def is_shadow_commit(reg):
+	"""
+	Check if register is explicitly marked as commit register of its shadow
+	group.
+	"""
+	return str_arg_to_bool(str(get_vendor_ext(reg, "shadowCommit", False)))
+
+
+class ShadowGroup():
+
+	# Name of the group (lower case)
+	name = None
+
+	# Registers of the group sorted by address offset
+	regs = None
+
+	# Register whose write commits values of all registers of the group
+	commitReg = None
+
+	def __init__(self, name):
+		self.name = name
+		self.regs = []
+
+
+def get_shadow_groups(block, regs, is_writable):
+	"""
+	Get shadow groups of an address block, sorted by name. Only writable
+	registers ("is_writable" returns True) can be members of a group. Arrays,
+	conditionally present registers and registers with auto clear bits
+	(which would clear before the commit) are not supported and are skipped.
+	Arguments:
+		block			Address block object
+		regs			Registers of the block sorted by address offset
+		is_writable		Function returning True for writable register
+	"""
+	groups = {}
+	for reg in regs:
+		name = get_shadow_group(reg)
+		if (name == None):
+			continue
+
+		if (not is_writable(reg) or get_reg_array_index(reg) != None
+			or reg.isPresent != "" or
+			calc_reg_masks(reg)[MASK_AUTOCLEAR] != 0):
+			print("Register {} of block {} can't be member of shadow group " \
+				"'{}' (only writable registers which are not arrays, are " \
+				"always present and have no auto clear bits), skipping " \
+				"it".format(reg.name, block.name, name))
+			continue
+
+		if (name not in groups):
+			groups[name] = ShadowGroup(name)
+		groups[name].regs.append(reg)
+
+	for group in groups.values():
+		for reg in group.regs:
+			if (is_shadow_commit(reg)):
+				if (group.commitReg != None):
+					print("Shadow group '{}' of block {} has more commit " \
+						"registers, using {}".format(group.name, block.name,
+												group.commitReg.name))
+					continue
+				group.commitReg = reg
+
+		if (group.commitReg == None):
+			group.commitReg = group.regs[-1]
+
+	return [groups[name] for name in sorted(groups)]
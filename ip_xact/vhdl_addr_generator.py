@@ -48,14 +48,14 @@ class VhdlAddrGenerator(IpXactAddrGenerator):
 	def __init__(self, pyXactComp, memMap, wrdWidth):
 		super().__init__(pyXactComp, memMap, wrdWidth)
 		self.vhdlGen = VhdlGenerator()
+		self.lanGen = self.vhdlGen
 
 
 	def commit_to_file(self):
 		""" 
 		Commit the generator output into the output file.
 		"""
-		for line in self.vhdlGen.out :
-			self.of.write(line)
+		self.vhdlGen.flush_output(self.of)
 
 
 	def write_reg_enums(self, field):
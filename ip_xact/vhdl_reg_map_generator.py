@@ -31,6 +31,20 @@
 ##
 ##	Revision history:
 ##		7.10.2018	First implementation
+##		16.10.2026	Address vector entries of actual word address width
+##		16.10.2026	Pipelined read data multiplexor tree
+##		16.10.2026	Compacted read data multiplexor input
+##		16.10.2026	Dense address decoder, generation report
+##		16.10.2026	Configurable pipelining of register blocks
+##		16.10.2026	RAM implementation of memory blocks
+##		16.10.2026	Register arrays as array types and generate loops
+##		16.10.2026	Table-driven register file
+##		16.10.2026	AXI4 front end of memory map
+##		16.10.2026	AXI4-Lite and Avalon-MM front ends of memory map
+##		16.10.2026	Top level entity of memory map with pipelined decode
+##		16.10.2026	Clock domain crossing variant of register blocks
+##		16.10.2026	Shadow register groups with atomic commit
+##		16.10.2026	Set / clear / toggle aliases of registers
 ##
 ################################################################################
 
@@ -40,6 +54,11 @@ import sys
 
 from abc import ABCMeta, abstractmethod
 from pyXact_generator.ip_xact.addr_generator import IpXactAddrGenerator
+from pyXact_generator.ip_xact.reg_masks import MASK_DATA, MASK_RSTVAL, \
+												MASK_AUTOCLEAR
+from pyXact_generator.ip_xact.reg_array import *
+from pyXact_generator.ip_xact.shadow_group import get_shadow_groups
+from pyXact_generator.ip_xact.reg_alias import get_reg_aliases, has_reg_alias
 
 from pyXact_generator.gen_lib import *
 
@@ -53,28 +72,189 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 	# Paths of VHDL templates
 	template_sources = {}
 	template_sources["addr_dec_template_path"] = "templates/address_decoder.vhd"
+	template_sources["addr_dec_dense_template_path"] = "templates/address_decoder_dense.vhd"
 	template_sources["reg_template_path"] = "templates/memory_reg.vhd"
 	template_sources["data_mux_template_path"] = "templates/data_mux.vhd"
+	template_sources["data_mux_tree_template_path"] = "templates/data_mux_tree.vhd"
 	template_sources["mem_bus_template_path"] = "templates/memory_bus.vhd"
 	template_sources["access_signaller_template_path"] = "templates/access_signaler.vhd"
 	template_sources["cmn_reg_map_pkg"] = "templates/cmn_reg_map_pkg.vhd"
+	template_sources["mem_ram_template_path"] = "templates/memory_ram.vhd"
+	template_sources["axi4_slave_template_path"] = "templates/axi4_slave.vhd"
+	template_sources["axi4lite_slave_template_path"] = "templates/axi4lite_slave.vhd"
+	template_sources["avalon_slave_template_path"] = "templates/avalon_slave.vhd"
+	template_sources["skid_buffer_template_path"] = "templates/skid_buffer.vhd"
+	template_sources["cdc_fifo_template_path"] = "templates/cdc_fifo.vhd"
+
+	# Templates of bus front ends of memory map (front end -> template)
+	frontEndTemplates = {"axi4" : "axi4_slave_template_path",
+						 "axi4lite" : "axi4lite_slave_template_path",
+						 "avalon" : "avalon_slave_template_path"}
 
 
 	of_pkg = None
 
+	# Read data of register and memory blocks are registered (REGISTERED_READ
+	# of block instances within front end of memory map)
+	registered_read = True
+
+	# Bus front end of memory map ("none" or key of frontEndTemplates). Front
+	# end is an entity which decodes blocks of memory map and instantiates
+	# them behind single bus slave.
+	busFrontEnd = "none"
+
+	# Width of transaction ID of AXI4 front end
+	axiIdWidth = 4
+
+	# Names of register blocks (lower case) with clock domain crossing
+	# variant (<block>_reg_map_cdc). Output / input records of such blocks
+	# are in core clock domain. Top level entity instantiates the variant
+	# and merges their "full" outputs, bus front end holds accesses by it.
+	cdcBlocks = []
+
+	# Number of accesses which can be buffered by FIFO of clock domain
+	# crossing variant (power of 2, at least 4 and more than number of
+	# decode stages of top level entity)
+	cdcFifoDepth = 8
+
+	# Top level entity of memory map (<memmap>_top) is generated. It is
+	# always generated with bus front end, which instantiates it.
+	writeTop = False
+
+	# Register stages after one-hot block select of top level entity of
+	# memory map (<memmap>_top). Bus signals are delayed with block select.
+	topDecodeStages = 1
+
+	# Register stages within OR-tree merge of read data of top level entity
+	topMergeStages = 0
+
+	# Number of inputs of single OR within read data merge tree
+	topMergeFanIn = 4
+
+	# Number of outstanding reads of bus front end (read data FIFO depth).
+	# When 0, read latency of front end + 2 is used, which allows reads at
+	# one access per clock cycle.
+	maxOutstandingReads = 0
+
+	# Type of read data multiplexor:
+	#	"flat"	- Single level multiplexor (data_mux)
+	#	"tree"	- Multiplexor tree with pipeline stages (data_mux_tree)
+	readMuxType = "flat"
+
+	# Number of pipeline stages of read data multiplexor tree
+	readMuxStages = 0
+
+	# When True, only words with readable registers are inputs of read data
+	# multiplexor. Address is remapped to index of such word.
+	readMuxCompact = False
+
+	# Type of address decoder:
+	#	"auto"		- Chosen by occupancy of block words and estimated
+	#				  number of LUTs of both decoders
+	#	"compare"	- Comparator for each word (address_decoder)
+	#	"dense"		- Binary to one-hot decoder (address_decoder_dense)
+	addrDecType = "auto"
+
+	# Minimal occupancy of block words (used words / decoded words) for which
+	# dense address decoder can be chosen in "auto" mode.
+	addrDecDenseOccupancy = 0.5
+
+	# Number of LUT inputs for estimation of logic resources
+	lutInputs = 6
+
+	# Number of address bits decoded together by pre-decoder of dense address
+	# decoder (estimation of logic resources)
+	preDecBits = 3
+
+	# Pipeline stages of register blocks (list of stage names):
+	#	"write"		- Register stage on bus inputs of the block (address, write
+	#				  data, byte enables, chip select, read and write).
+	#	"decode"	- Registered address decoder output. Bus signals are
+	#				  delayed by one clock cycle to stay aligned with it.
+	#	"read"		- Pipeline stage in read data multiplexor (tree).
+	pipeline = []
+
+	# Implementation of writable registers:
+	#	"instances"	- memory_reg instance for each register
+	#	"table"		- Registers of the same width are implemented by single
+	#				  "for generate" loop. Data masks, reset values, auto clear
+	#				  masks and positions of the registers are constant tables
+	#				  indexed by the loop.
+	regFileType = "instances"
+
+	# Bus signals of register block which are delayed by pipeline stages and
+	# bounds of their types ([upBound, lowBound], None for std_logic)
+	busSignals = [["address", ["ADDRESS_WIDTH - 1", "0"]],
+				  ["w_data", ["DATA_WIDTH - 1", "0"]],
+				  ["be", ["DATA_WIDTH / 8 - 1", "0"]],
+				  ["cs", None],
+				  ["read", None],
+				  ["write", None]]
+
+	# Shadow register groups of blocks (dictionary: block name -> list of
+	# ShadowGroup)
+	blkShadowGroups = None
+
+	# Set / clear / toggle aliases of registers of blocks (dictionary: block
+	# name -> list of RegAlias)
+	blkRegAliases = None
+
 	def __init__(self, pyXactComp, memMap, wrdWidth):
 		super().__init__(pyXactComp, memMap, wrdWidth)
 		self.vhdlGen = VhdlGenerator()
+		self.lanGen = self.vhdlGen
+		self.blkShadowGroups = {}
+		self.blkRegAliases = {}
 	
 	
 	def commit_to_file(self):
 		""" 
 		Commit the generator output into the output file.
 		"""
-		for line in self.vhdlGen.out :
-			self.of.write(line)
+		self.vhdlGen.flush_output(self.of)
+
+
+	def is_template_used(self, templ_name):
+		"""
+		Check if template (key of template_sources) is instantiated by
+		generated entities. Templates of bus front ends, skid buffer, clock
+		domain crossing FIFO and RAM are used only when configured. Address
+		decoders and read data multiplexors are used only when chosen for
+		some register block.
+		"""
+		blocks = []
+		if (self.memMap != None):
+			blocks = self.memMap.addressBlock
+		reg_blocks = [block for block in blocks if block.usage == "register"]
+
+		if (templ_name in self.frontEndTemplates.values()):
+			return self.frontEndTemplates.get(self.busFrontEnd) == templ_name
+
+		if (templ_name == "skid_buffer_template_path"):
+			return self.busFrontEnd in ["axi4lite", "avalon"]
 
-		self.vhdlGen.out = []
+		if (templ_name == "cdc_fifo_template_path"):
+			return any([self.is_cdc_block(block) for block in blocks])
+
+		if (templ_name == "mem_ram_template_path"):
+			return any([block.usage == "memory" for block in blocks])
+
+		if (templ_name == "addr_dec_template_path"):
+			return any([self.get_addr_dec_type(block) == "compare"
+						for block in reg_blocks])
+
+		if (templ_name == "addr_dec_dense_template_path"):
+			return any([self.get_addr_dec_type(block) == "dense"
+						for block in reg_blocks])
+
+		if (templ_name == "data_mux_template_path"):
+			return any([not self.is_read_mux_tree(block)
+						for block in reg_blocks])
+
+		if (templ_name == "data_mux_tree_template_path"):
+			return any([self.is_read_mux_tree(block) for block in reg_blocks])
+
+		return True
 
 
 	def create_reg_ports(self, block, signDict):
@@ -100,6 +280,92 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 			signDict[port.name] = port
 
 
+	def has_pipeline_stage(self, stage):
+		"""
+		Check if pipeline stage ("write", "decode", "read") is enabled.
+		"""
+		return stage in self.pipeline
+
+
+	def get_bus_stage_suffixes(self):
+		"""
+		Get suffixes of bus signals of enabled bus pipeline stages in order
+		of the stages.
+		"""
+		suffixes = []
+		if (self.has_pipeline_stage("write")):
+			suffixes.append("_bus_q")
+		if (self.has_pipeline_stage("decode")):
+			suffixes.append("_dec_q")
+		return suffixes
+
+
+	def get_bus_signal(self, name, decoder=False):
+		"""
+		Get name of bus signal after bus pipeline stages. Address decoder
+		gets its inputs before "decode" stage, since its output is registered.
+		"""
+		suffixes = self.get_bus_stage_suffixes()
+		if (decoder and self.has_pipeline_stage("decode")):
+			suffixes = suffixes[:-1]
+
+		if (not suffixes):
+			return name
+		return name + suffixes[-1]
+
+
+	def calc_bus_stages(self):
+		"""
+		Calculate number of pipeline stages on bus signals of a block.
+		"""
+		return len(self.get_bus_stage_suffixes())
+
+
+	def create_bus_pipeline_decls(self, signDict):
+		"""
+		Create declarations of bus signals delayed by pipeline stages.
+		"""
+		for suffix in self.get_bus_stage_suffixes():
+			for [name, bounds] in self.busSignals:
+				decl = LanDeclaration(name + suffix, value = None)
+				decl.type = "std_logic"
+				decl.specifier = "signal"
+				decl.bitWidth = 1
+				if (bounds != None):
+					[decl.upBound, decl.lowBound] = bounds
+				signDict[name + suffix] = decl
+
+
+	def create_bus_pipeline_stages(self):
+		"""
+		Create registers of bus pipeline stages. Each stage delays all bus
+		signals by one clock cycle.
+		"""
+		src_suffix = ""
+		for suffix in self.get_bus_stage_suffixes():
+			self.vhdlGen.write_comment("Pipeline stage of bus signals ({})".format(
+				suffix[1:]), gap = 4)
+			self.vhdlGen.wr_line("    {}_proc : process(res_n, clk_sys)\n".format(
+				suffix[1:]))
+			self.vhdlGen.wr_line("    begin\n")
+			self.vhdlGen.wr_line("        if (res_n = RESET_POLARITY) then\n")
+			for [name, bounds] in self.busSignals:
+				if (bounds != None):
+					rst_val = "(OTHERS => '0')"
+				else:
+					rst_val = "'0'"
+				self.vhdlGen.wr_line("            {} <= {};\n".format(
+					name + suffix, rst_val))
+			self.vhdlGen.wr_line("        elsif (rising_edge(clk_sys)) then\n")
+			for [name, bounds] in self.busSignals:
+				self.vhdlGen.wr_line("            {} <= {};\n".format(
+					name + suffix, name + src_suffix))
+			self.vhdlGen.wr_line("        end if;\n")
+			self.vhdlGen.wr_line("    end process;\n")
+			self.vhdlGen.wr_line("\n")
+			src_suffix = suffix
+
+
 	def create_wr_reg_sel_decl(self, block, signDict):
 		"""
 		Create declaration of register selector signal for writable
@@ -115,27 +381,18 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 	def calc_addr_vect_value(self, block):
 		"""
 		Calculate address vector value for address decoder for reach register
-		word.
+		word. Each entry has width of word address within the block.
 		"""
-		vect_val = ""
 		addr_entry_width = self.calc_wrd_address_width(block)
 
-		# Check if register is present on a given word, if yes, append it to the
-		# vector.
-		[low_addr, high_addr] = self.calc_blk_wrd_span(block)
-		high_addr += self.wrdWidthByte
-
-		for wrd_addr in range(low_addr, high_addr, self.wrdWidthByte):
-			regs_in_wrd = self.get_regs_from_word(wrd_addr, block)
-
-			# Word with no registers can be skipped, nothing is appended to
-			# address vector
-			if (not regs_in_wrd):
-				continue;
-
-			# Append address vector value
+		# Only words with registers are in address vector. Word with the
+		# lowest address is the rightmost entry.
+		entries = []
+		for wrd_addr in self.get_used_words(block):
 			shifted_val = int(wrd_addr / self.wrdWidthByte)
-			vect_val = str("{:06b}".format(shifted_val)) + vect_val
+			entries.append("{:0{}b}".format(shifted_val, addr_entry_width))
+
+		vect_val = "".join(reversed(entries))
 
 		return vect_val
 
@@ -160,17 +417,29 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		"""
 		Create declaration of read data multiplexor input signal. Length of
 		read data mux input covers the minimum necessary length to cover
-		all words with readable registers.
+		all words with readable registers (only these words when read data
+		multiplexor input is compacted).
 		"""
 		signDict["read_data_mux_in"] = LanDeclaration("read_data_mux_in", value = None)
 		signDict["read_data_mux_in"].type = "std_logic"
-
-		[low_addr, high_addr] = self.calc_blk_wrd_span(block, ["read"])
-		high_addr += self.wrdWidthByte
-		signDict["read_data_mux_in"].bitWidth = (high_addr - low_addr) * 8;
+		signDict["read_data_mux_in"].bitWidth = self.calc_read_mux_in_width(block)
 		signDict["read_data_mux_in"].specifier = "signal"
 
 
+	def create_read_mux_sel_decl(self, block, signDict):
+		"""
+		Create declaration of read data multiplexor selector for compacted
+		read data multiplexor input.
+		"""
+		sel_width = self.calc_read_mux_sel_width(block)
+		signDict["read_mux_sel"] = LanDeclaration("read_mux_sel", value = None)
+		signDict["read_mux_sel"].type = "std_logic"
+		signDict["read_mux_sel"].bitWidth = sel_width
+		signDict["read_mux_sel"].upBound = str(sel_width - 1)
+		signDict["read_mux_sel"].lowBound = "0"
+		signDict["read_mux_sel"].specifier = "signal"
+
+
 	def create_read_data_mask_n_decl(self, block, signDict):
 		"""
 		Create declaration of Read data mask signal for Read data multiplexor.
@@ -228,6 +497,10 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		# Create data mask signal for read multiplextor
 		self.create_read_data_mask_n_decl(block, signDict)
 
+		# Create selector of compacted read data multiplexor
+		if (self.is_read_mux_compact(block)):
+			self.create_read_mux_sel_decl(block, signDict)
+
 		# Create internal signal for output register structure (output values
 		# of writable registers)
 		self.create_write_data_int_decl(block, signDict)
@@ -235,6 +508,115 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		# Create declaration of read data clear signal
 		self.create_read_mux_ena_int_decl(signDict)
 
+		# Create declarations of pipelined bus signals
+		self.create_bus_pipeline_decls(signDict)
+
+		# Create declarations of packed read data of register arrays
+		self.create_reg_array_rd_decls(block, signDict)
+
+		# Create constant tables of table-driven register file
+		if (self.regFileType == "table"):
+			self.create_reg_table_decls(block, signDict)
+
+		# Create committed values of shadow register groups
+		self.create_shadow_decls(block, signDict)
+
+		# Create selects and write data of register aliases
+		self.create_reg_alias_decls(block, signDict)
+
+
+	def calc_reg_record_item(self, block, reg, appendix, suffix="", index=None):
+		"""
+		Create name of register item within input / output record of a block.
+		Elements of register arrays are selected by index (number or name
+		of "for generate" variable).
+		"""
+		item = (block.name + appendix + reg.name + suffix).lower()
+		if (index != None):
+			item += "(" + str(index) + ")"
+		return item
+
+
+	def get_reg_read_appendix(self, reg):
+		"""
+		Get record from which read value of a register is taken. Read-write
+		registers are fed from its own values! All other register types are
+		fed from outside of the module.
+		"""
+		if (self.reg_is_access_type(reg, ["read-write"])):
+			return "_out_i."
+		return "_in."
+
+
+	def is_reg_array_rd_packed(self, reg):
+		"""
+		Check if read data of register array are fed to read data multiplexor
+		as single packed vector. Array must be readable, start at word
+		boundary and cover whole words.
+		"""
+		dim = get_reg_array_dim(reg)
+		if (dim == 0 or not self.reg_has_access_type(reg, ["read"])):
+			return False
+
+		head_offset = reg.addressOffset - get_reg_array_index(reg) * \
+						int(reg.size / 8)
+		arr_bytes = dim * int(reg.size / 8)
+
+		return (head_offset % self.wrdWidthByte == 0 and
+				arr_bytes % self.wrdWidthByte == 0)
+
+
+	def calc_reg_array_wrd_span(self, reg):
+		"""
+		Calculate word addresses of first and last word of register array
+		which the register is element of.
+		"""
+		elem_bytes = int(reg.size / 8)
+		head_offset = reg.addressOffset - get_reg_array_index(reg) * elem_bytes
+		tail_offset = head_offset + (get_reg_array_dim(reg) - 1) * elem_bytes
+		return [self.align_addr_to_wrd(head_offset),
+				self.align_addr_to_wrd(tail_offset)]
+
+
+	def create_reg_array_rd_decls(self, block, signDict):
+		"""
+		Create declarations of packed read data of register arrays.
+		"""
+		for reg in self.get_sorted_regs(block):
+			if (is_reg_array_tail(reg) or not self.is_reg_array_rd_packed(reg)):
+				continue
+
+			name = reg.name.lower() + "_rd_data"
+			signDict[name] = LanDeclaration(name, value = None)
+			signDict[name].type = "std_logic"
+			signDict[name].bitWidth = get_reg_array_dim(reg) * reg.size
+			signDict[name].specifier = "signal"
+
+
+	def create_reg_array_rd_data(self, block):
+		"""
+		Create drivers of packed read data of register arrays. Each element
+		is placed on its position within the words of the array.
+		"""
+		for reg in self.get_sorted_regs(block):
+			if (is_reg_array_tail(reg) or not self.is_reg_array_rd_packed(reg)):
+				continue
+
+			name = reg.name.lower()
+			self.vhdlGen.write_comment(reg.name.upper() + \
+				" register array read data", gap = 4)
+			self.vhdlGen.create_for_generate(name + "_rd_gen", "i",
+				["0", str(get_reg_array_dim(reg) - 1)], gap = 4)
+
+			self.vhdlGen.create_signal_connection(
+				"{}_rd_data((i + 1) * {} - 1 downto i * {})".format(name,
+					reg.size, reg.size),
+				self.calc_reg_record_item(block, reg,
+					self.get_reg_read_appendix(reg), index="i"), gap = 8)
+
+			self.vhdlGen.commit_append_line(1)
+			self.vhdlGen.wr_line("\n")
+
 
 	def append_reg_byte_val(self, block, reg, byte_ind, read_wrd):
 		"""
@@ -251,14 +633,9 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		# Register starts on given byte -> Append it
 		if (reg_offset == byte_ind):
 			
-			# Read-write registers are fed from its own values! All other
-			# register types are fed from outside of the module.
-			if (self.reg_is_access_type(reg, ["read-write"])):
-				appendix = "_out_i."
-			else:
-				appendix = "_in."
-
-			read_wrd += (block.name + appendix + reg.name).lower()
+			read_wrd += self.calc_reg_record_item(block, reg,
+							self.get_reg_read_appendix(reg),
+							index=get_reg_array_index(reg))
 			if (byte_ind != 0):
 				read_wrd += " & "
 			return [False, read_wrd]
@@ -310,22 +687,46 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 
 		# Check each word in the memory block, Start from highest address
 		# since highest bits in std_logic_vector correspond to highest
-		# address!
-		[low_addr, high_addr] = self.calc_blk_wrd_span(block, ["read"])
-		high_addr += self.wrdWidthByte
-		for addr in reversed(range(low_addr, high_addr, self.wrdWidthByte)):
+		# address! Compacted input contains only words with readable
+		# registers.
+		if (self.is_read_mux_compact(block)):
+			read_words = self.get_used_words(block, ["read"])
+			low_addr = read_words[0]
+		else:
+			[low_addr, high_addr] = self.calc_blk_wrd_span(block, ["read"])
+			high_addr += self.wrdWidthByte
+			read_words = range(low_addr, high_addr, self.wrdWidthByte)
+
+		# Words of register arrays with packed read data are covered by
+		# single item. Words below "arr_low_addr" are skipped then.
+		arr_low_addr = None
 
-			# Create comment with word address
-			self.vhdlGen.write_comment("Adress:" + str(addr), gap=4, small=True)
+		for addr in reversed(read_words):
+
+			if (arr_low_addr != None and addr >= arr_low_addr):
+				continue
 
 			# Search for all registers which are also "read" in given word
 			regs_in_wrd = self.get_regs_from_word(addr, block)
-			wrd_value = self.create_read_wrd_from_regs(regs_in_wrd, block)
+
+			if (regs_in_wrd and self.is_reg_array_rd_packed(regs_in_wrd[0])):
+				[arr_low_addr, arr_high_addr] = \
+					self.calc_reg_array_wrd_span(regs_in_wrd[0])
+				self.vhdlGen.write_comment("Adresses:" + str(arr_low_addr) +
+					" - " + str(arr_high_addr), gap=4, small=True)
+				wrd_value = "    " + regs_in_wrd[0].name.lower() + "_rd_data"
+				last_addr = arr_low_addr
+			else:
+				# Create comment with word address
+				self.vhdlGen.write_comment("Adress:" + str(addr), gap=4,
+											small=True)
+				wrd_value = self.create_read_wrd_from_regs(regs_in_wrd, block)
+				last_addr = addr
 
 			self.vhdlGen.wr_line(wrd_value)
 
 			# Append "&" or ";" to the word address
-			if (addr == low_addr):
+			if (last_addr == low_addr):
 				self.vhdlGen.wr_line(";\n")
 			else:
 				self.vhdlGen.wr_line(" &\n")
@@ -345,11 +746,79 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		return [addr_hind, addr_lind]
 
 
+	def calc_blk_occupancy(self, block):
+		"""
+		Calculate occupancy of a block: number of words with registers divided
+		by number of words addressable by word address.
+		"""
+		return self.calc_blk_wrd_count(block) / \
+				(2 ** self.calc_wrd_address_width(block))
+
+
+	def get_addr_dec_type(self, block):
+		"""
+		Get type of address decoder of a block: "compare" or "dense". In
+		"auto" mode, dense decoder is chosen only for sufficiently occupied
+		block when its estimated number of LUTs is lower.
+		"""
+		if (self.calc_wrd_address_width(block) < 1):
+			return "compare"
+
+		if (self.addrDecType == "auto"):
+			if (self.calc_blk_occupancy(block) >= self.addrDecDenseOccupancy and
+				self.calc_addr_dec_luts(block, "dense") <
+				self.calc_addr_dec_luts(block, "compare")):
+				return "dense"
+			return "compare"
+
+		if (self.addrDecType == "dense"):
+			return "dense"
+
+		return "compare"
+
+
+	def calc_and_luts(self, inputs):
+		"""
+		Estimate number of LUTs of AND gate with given number of inputs.
+		"""
+		if (inputs <= 1):
+			return 0
+		return math.ceil((inputs - 1) / (self.lutInputs - 1))
+
+
+	def calc_addr_dec_luts(self, block, decType):
+		"""
+		Estimate number of LUTs of address decoder of given type. Each output
+		of comparator decoder compares whole address and enable. Dense decoder
+		pre-decodes groups of address bits and each output combines one line
+		of each group with enable.
+		"""
+		addr_width = self.calc_wrd_address_width(block)
+		entries = self.calc_blk_wrd_count(block)
+
+		if (decType == "compare"):
+			return entries * self.calc_and_luts(addr_width + 1)
+
+		groups = math.ceil(addr_width / self.preDecBits)
+		pre_dec_luts = 0
+		for i in range(groups):
+			group_bits = min(self.preDecBits, addr_width - i * self.preDecBits)
+			pre_dec_luts += (2 ** group_bits) * \
+							max(1, self.calc_and_luts(group_bits))
+
+		return pre_dec_luts + entries * self.calc_and_luts(groups + 1)
+
+
 	def create_addr_decoder(self, block):
 		"""
-        Create instance of address decoder for writable registers.
+        Create instance of address decoder for writable registers. Dense
+        or comparator decoder is used (see get_addr_dec_type).
 		"""
-		path = os.path.join(ROOT_PATH, self.template_sources["addr_dec_template_path"])
+		if (self.get_addr_dec_type(block) == "dense"):
+			templ_name = "addr_dec_dense_template_path"
+		else:
+			templ_name = "addr_dec_template_path"
+		path = os.path.join(ROOT_PATH, self.template_sources[templ_name])
 
 		addr_dec = self.vhdlGen.load_entity_template(path)
 		addr_dec.isInstance = True
@@ -360,7 +829,10 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		addr_dec.generics["address_width"].value = self.calc_wrd_address_width(block)
 		addr_dec.generics["address_entries"].value = self.calc_blk_wrd_count(block)
 		addr_dec.generics["addr_vect"].value = "ADDR_VECT"
-		addr_dec.generics["registered_out"].value = "false"
+		if (self.has_pipeline_stage("decode")):
+			addr_dec.generics["registered_out"].value = "true"
+		else:
+			addr_dec.generics["registered_out"].value = "false"
 		addr_dec.generics["reset_polarity"].value = "reset_polarity".upper()
 
 		# Connect ports
@@ -368,13 +840,13 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		addr_dec.ports["res_n"].value = "res_n"
 		
 		addr_indices = self.calc_addr_indices(block)
-		addr_str =  "address(" + str(addr_indices[0])
+		addr_str =  self.get_bus_signal("address", decoder=True) + "(" + str(addr_indices[0])
 		addr_str += " downto " + str(addr_indices[1]) + ")"
 		addr_dec.ports["address"].value = addr_str
 
 		addr_dec.ports["addr_dec"].value = "reg_sel"
 
-		addr_dec.ports["enable"].value = "cs"
+		addr_dec.ports["enable"].value = self.get_bus_signal("cs", decoder=True)
 
         # Create instance of a component
 		self.vhdlGen.write_comment("Write address to One-hot decoder", gap = 4)
@@ -389,21 +861,8 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		which is implemented in the register, "0" for each bit which is not
 		implemented in a register.
 		"""
-
-        # Suppose there is no implemented register
-		data_mask = ["0" for x in range(reg.size)]
-
-        # Go through fields and mark each field which is present
-		for field in sorted(reg.field, key=lambda a: a.bitOffset):
-			if (field.bitWidth > 1):
-				for j in range(field.bitOffset, field.bitOffset + field.bitWidth):
-					data_mask[j] = "1"
-			else:
-				data_mask[field.bitOffset] = "1"
-
-		# Reverse the list, since std_logic_vector has opposite order than list.
-        # Concat values and surround by ""
-		return '"' + ''.join(data_mask[::-1]) + '"'
+		return self.vhdlGen.format_bit_string(
+					self.get_reg_masks(reg)[MASK_DATA], reg.size)
 
 
 	def calc_reg_rstval_mask(self, reg):
@@ -411,21 +870,8 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
         Calculate mask or reset values for given register. Reset mask contains
         value of reset after "res_n" input is released.
 		"""
-
-        # Suppose all registers are reset to zero
-		rst_mask = ["0" for x in range(reg.size)]
-
-		# Go through fields and replace each bit index by a reset value
-		for field in sorted(reg.field, key=lambda a: a.bitOffset):
-			remainder = field.resets.reset.value
-			for j in range(field.bitWidth):
-				if (remainder % 2 == 1):
-					rst_mask[field.bitOffset + j] = "1"				
-				remainder = int(remainder / 2)
-
-		# Reverse the list, since std_logic_vector has opposite order than list!
-		# Concat values and surround by ""
-		return '"' + ''.join(rst_mask[::-1]) + '"'
+		return self.vhdlGen.format_bit_string(
+					self.get_reg_masks(reg)[MASK_RSTVAL], reg.size)
 
 
 	def calc_autoclear_mask(self, reg):
@@ -434,33 +880,25 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		register marked as "clear" in "write action" will be automatically cleared
 		after write (One-shot like).
 		"""
-		# Suppose no bit is autoclear
-		autoclearMask = ["0" for x in range(reg.size)]
-
-		# Go through register fields and mark each bit whose field has "clear" action
-		# on write
-		for field in sorted(reg.field, key=lambda a: a.bitOffset):
-			if (field.modifiedWriteValue == "clear"):
-				if (field.bitWidth > 1):
-					for j in range(field.bitOffset, field.bitOffset + field.bitWidth - 1):
-						autoclearMask[j] = "1"
-				else:
-					autoclearMask[field.bitOffset] = "1"
-
-		# Reverse the list, since std_logic_vector has opposite order than list!
-		# Concat values and surround by ""
-		return '"' + ''.join(autoclearMask[::-1]) + '"'
+		return self.vhdlGen.format_bit_string(
+					self.get_reg_masks(reg)[MASK_AUTOCLEAR], reg.size)
 
 
-	def calc_reg_byte_enable_vector(self, reg):
+	def calc_reg_byte_enable_vector(self, reg, var=None):
 		"""
 		Create byte enable vector for a register. Position of register within
-		a memory word is considered.
+		a memory word is considered. Within "for generate" loop over register
+		array ("var" given), position is given by L_BE constant of the loop.
 		"""
+		if (var != None):
+			return "{}(L_BE + {} downto L_BE)".format(self.get_bus_signal("be"),
+													int(reg.size / 8) - 1)
+
 		l_be_ind = reg.addressOffset % 4
 		h_be_ind = l_be_ind + int(reg.size / 8) - 1
 
-		be_val = "be({} downto {})".format(h_be_ind, l_be_ind)
+		be_val = "{}({} downto {})".format(self.get_bus_signal("be"),
+											h_be_ind, l_be_ind)
 
 		return be_val
 
@@ -477,35 +915,51 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		reg_inst.generics["auto_clear"].value = self.calc_autoclear_mask(reg)
 
 
-	def fill_reg_ports(self, block, reg, reg_inst):
+	def fill_reg_ports(self, block, reg, reg_inst, var=None):
 		"""
-		Fill ports for VHDL register instance from IP-XACT register object
+		Fill ports for VHDL register instance from IP-XACT register object.
+		Instance within "for generate" loop over register array ("var" given)
+		is connected by constants of the loop.
 		"""
 		reg_inst.ports["clk_sys"].value = "clk_sys"
 		reg_inst.ports["res_n"].value = "res_n"
 
-		reg_value = (block.name + "_out_i." + reg.name).lower()
+		reg_value = self.calc_reg_record_item(block, reg, "_out_i.", index=var)
 		reg_inst.ports["reg_value"].value = reg_value
 
 		# Calculate data input indices within a memory word
-		l_ind = (reg.addressOffset * 8) % self.wrdWidthBit
-		h_ind = l_ind + reg.size - 1
-		reg_inst.ports["data_in"].value = "w_data({} downto {})".format(h_ind, l_ind)
-		reg_inst.ports["write"].value = "write"
+		if (var != None):
+			l_ind = "L_IND"
+			h_ind = "L_IND + " + str(reg.size - 1)
+			reg_sel_index = "WRD_IND"
+		else:
+			l_ind = (reg.addressOffset * 8) % self.wrdWidthBit
+			h_ind = l_ind + reg.size - 1
+			reg_sel_index = self.get_wrd_index(block, reg) - 1
+
+		reg_inst.ports["data_in"].value = "{}({} downto {})".format(
+			self.get_bus_signal("w_data"), h_ind, l_ind)
+		reg_inst.ports["write"].value = self.get_bus_signal("write")
 
-		reg_sel_index = self.get_wrd_index(block, reg) - 1
 		reg_inst.ports["cs"].value = "reg_sel(" + str(reg_sel_index) + ")"
 
+		# Register with aliases is written via alias logic
+		if (var == None and self.get_reg_alias_list(block, reg)):
+			reg_inst.ports["data_in"].value = reg.name.lower() + "_data_in"
+			reg_inst.ports["cs"].value = reg.name.lower() + "_cs"
+
 		# Calculate byte enable index / indices from position of register within a
 		# memory word.
-		reg_inst.ports["w_be"].value = self.calc_reg_byte_enable_vector(reg)
+		reg_inst.ports["w_be"].value = self.calc_reg_byte_enable_vector(reg, var)
 
 
-	def create_reg_instance(self, block, reg):
+	def create_reg_instance(self, block, reg, var=None, gap=4):
 		"""
 		Create VHDL instance from IP-XACT register object. If "isPresent" property
         is set, parameter name is searched in IP-XACT input and it's name is used
-        as generic condition for register presence.
+        as generic condition for register presence. Instance within "for
+		generate" loop over register array is created when "var" is given,
+		presence of the array is then handled by the loop.
 		"""
 		# Load register template path and create basic instance
 		path = os.path.join(ROOT_PATH, self.template_sources["reg_template_path"])
@@ -514,13 +968,18 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		reg_inst.intType = "entity"
 		reg_inst.value = reg.name.lower() + "_reg_comp"
 
-		self.vhdlGen.write_comment(reg.name.upper() + " register", gap = 4)
-
 		# Fill generics of reg map component			
 		self.fill_reg_inst_generics(reg, reg_inst)
 
 		# Fill Ports of reg map component
-		self.fill_reg_ports(block, reg, reg_inst)
+		self.fill_reg_ports(block, reg, reg_inst, var)
+
+		if (var != None):
+			self.vhdlGen.format_entity_decl(reg_inst, base_indent=gap)
+			self.vhdlGen.create_comp_instance(reg_inst)
+			return
+
+		self.vhdlGen.write_comment(reg.name.upper() + " register", gap = 4)
 
 		# Write conditional generic expression if register isPresent property 
 		# depends on IP-XACT Parameter
@@ -577,40 +1036,48 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 			signaller_inst.generics["write_signalling_reg"].value = False	
 
 
-	def fill_access_signaller_ports(self, block, reg, signaller_inst):
+	def fill_access_signaller_ports(self, block, reg, signaller_inst, var=None):
 		"""
 		Fill ports for VHDL access signaller instance from IP-XACT register
-		object.
+		object. Instance within "for generate" loop over register array ("var"
+		given) is connected by constants of the loop.
 		"""
 		signaller_inst.ports["clk_sys"].value = "clk_sys"
 		signaller_inst.ports["res_n"].value = "res_n"
 
 		# Get word index from address decoder
-		reg_sel_index = self.get_wrd_index(block, reg) - 1
+		if (var != None):
+			reg_sel_index = "WRD_IND"
+		else:
+			reg_sel_index = self.get_wrd_index(block, reg) - 1
 		signaller_inst.ports["cs"].value = "reg_sel(" + str(reg_sel_index) + ")"
 
 		# Connect memory bus signals
-		signaller_inst.ports["read"].value = "read"
-		signaller_inst.ports["write"].value = "write"
-		signaller_inst.ports["be"].value = self.calc_reg_byte_enable_vector(reg)
+		signaller_inst.ports["read"].value = self.get_bus_signal("read")
+		signaller_inst.ports["write"].value = self.get_bus_signal("write")
+		signaller_inst.ports["be"].value = self.calc_reg_byte_enable_vector(reg,
+																			var)
 
 		# Connect write access signalling
 		wr_signal = "open"
 		if (self.is_reg_write_indicate(reg)):
-			wr_signal = (block.name + "_out_i." + reg.name + "_write").lower()			
+			wr_signal = self.calc_reg_record_item(block, reg, "_out_i.",
+													"_write", var)
 		signaller_inst.ports["write_signal"].value = wr_signal
 
 		# Connect read access signalling
 		rd_signal = "open"
 		if (self.is_reg_read_indicate(reg)):
-			rd_signal = (block.name + "_out_i." + reg.name + "_read").lower()			
+			rd_signal = self.calc_reg_record_item(block, reg, "_out_i.",
+													"_read", var)
 		signaller_inst.ports["read_signal"].value = rd_signal
 
 
-	def create_access_signaller(self, block, reg):
+	def create_access_signaller(self, block, reg, var=None, gap=4):
 		"""
 		Create access signaller components for registers which have this feature
-		enabled.
+		enabled. Instance within "for generate" loop over register array is
+		created when "var" is given.
 		"""
 		path = os.path.join(ROOT_PATH, self.template_sources["access_signaller_template_path"])
 		signaller_inst = self.vhdlGen.load_entity_template(path)
@@ -622,151 +1089,751 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		self.fill_access_signaller_generics(reg, signaller_inst)
 
 		# Fill ports of access signaller
-		self.fill_access_signaller_ports(block, reg, signaller_inst)
+		self.fill_access_signaller_ports(block, reg, signaller_inst, var)
 
-		self.vhdlGen.write_comment(reg.name.upper() + " access signallization", gap = 4)
+		if (var == None):
+			self.vhdlGen.write_comment(reg.name.upper() + " access signallization", gap = 4)
 		
 		# Create component of signaller
-		self.vhdlGen.format_entity_decl(signaller_inst)
+		self.vhdlGen.format_entity_decl(signaller_inst, base_indent=gap)
 		self.vhdlGen.create_comp_instance(signaller_inst)
 
 
-	def create_write_reg_instances(self, block):
+	def create_reg_array_consts(self, block, reg, gap):
 		"""
-		Create VHDL instance for each writable register in a memory block.
+		Create constants of "for generate" loop over register array with
+		position of element "i" within memory words:
+			WRD_IND	- Index of word (register selector)
+			L_IND	- Lowest bit of element within the word
+			L_BE	- Lowest byte enable of element within the word
 		"""
-		for i,reg in enumerate(sorted(block.register, key=lambda a: a.addressOffset)):
+		wrd_offset = reg.addressOffset % self.wrdWidthByte
+		elem_bytes = int(reg.size / 8)
+		byte_pos = "({} + i * {})".format(wrd_offset, elem_bytes)
+		reg_sel_index = self.get_wrd_index(block, reg) - 1
 
-			# Create register instances for writable registers
-			if (self.reg_has_access_type(reg, ["write"])):
-				self.create_reg_instance(block, reg)
+		values = [["WRD_IND", "{} + {} / {}".format(reg_sel_index, byte_pos,
+													self.wrdWidthByte)],
+				  ["L_IND", "({} mod {}) * 8".format(byte_pos,
+													self.wrdWidthByte)],
+				  ["L_BE", "{} mod {}".format(byte_pos, self.wrdWidthByte)]]
 
-			# Create access signalling for registers which have signalling enabled
-			if (self.is_reg_write_indicate(reg) or self.is_reg_read_indicate(reg)):
-				self.create_access_signaller(block, reg)
+		self.write_loop_consts(values, gap)
 
 
-	def create_read_data_mux_instance(self, block):
+	def write_loop_consts(self, values, gap):
 		"""
-        Create instance of Read data multiplexor.
+		Write natural constants of "for generate" loop. "values" is list of
+		[name, value] pairs.
 		"""
-		path = os.path.join(ROOT_PATH, self.template_sources["data_mux_template_path"])
+		for [name, value] in values:
+			decl = LanDeclaration(name, value = value)
+			decl.type = "natural"
+			decl.specifier = "constant"
+			decl.gap = gap
+			decl.alignLeft = True
+			decl.alignRight = False
+			decl.alignLen = 20
+			decl.wrap = False
+			self.vhdlGen.write_decl(decl)
 
-		# Load data mux template
-		data_mux = self.vhdlGen.load_entity_template(path)
-		data_mux.isInstance = True
-		data_mux.value = (data_mux.name + "_"+ block.name + "_comp").lower()
-		
-		# FIll generic values
-		data_mux.generics["data_out_width"].value = self.wrdWidthBit
 
-		[low_addr, high_addr] = self.calc_blk_wrd_span(block, ["read"])
-		high_addr += self.wrdWidthByte
-		data_mux.generics["data_in_width"].value = (high_addr - low_addr) * 8;
+	def create_reg_array(self, block, reg):
+		"""
+		Create "for generate" loop over elements of register array with
+		single register instance and access signaller. If "isPresent"
+		property is set, the loop is conditioned by the parameter.
+		"""
+		name = reg.name.lower()
+		dim = get_reg_array_dim(reg)
+		gap = 4
 
-		data_mux_indices = self.calc_addr_indices(block)
-		data_mux_sel_width = data_mux_indices[0] - data_mux_indices[1] + 1 
-		data_mux.generics["sel_width"].value = data_mux_sel_width
+		self.vhdlGen.write_comment(reg.name.upper() + " register array",
+									gap = gap)
 
-		data_mux.generics["registered_out"].value = "registered_read".upper()
-		data_mux.generics["reset_polarity"].value = "reset_polarity".upper()
+		if (reg.isPresent != ""):
+			paramName = self.parameter_lookup(reg.isPresent)
+			self.vhdlGen.create_if_generate(name + "_present_gen_t",
+				paramName.upper(), "true", gap = gap)
+			gap += 4
 
-		# Connect ports
-		data_mux.ports["clk_sys"].value = "clk_sys"
-		data_mux.ports["res_n"].value = "res_n"
+		# Loop over array elements, constants of the loop are declared before
+		# "begin" of the loop.
+		self.vhdlGen.create_for_generate(name + "_gen", "i",
+											["0", str(dim - 1)], gap = gap)
+		self.create_reg_array_consts(block, reg, gap + 2)
+		self.vhdlGen.wr_line(" " * gap + "begin\n")
 
-		addr_indices = self.calc_addr_indices(block)
-		addr_str = "address(" + str(addr_indices[0]) + " downto " + str(addr_indices[1]) + ")"
-		data_mux.ports["data_selector"].value = addr_str
+		if (self.reg_has_access_type(reg, ["write"])):
+			self.create_reg_instance(block, reg, "i", gap + 4)
 
-		data_mux.ports["data_in"].value = "read_data_mux_in"
-		data_mux.ports["data_mask_n"].value = "read_data_mask_n"
-		data_mux.ports["data_out"].value = "r_data"
+		if (self.is_reg_write_indicate(reg) or self.is_reg_read_indicate(reg)):
+			self.create_access_signaller(block, reg, "i", gap + 4)
 
-		# Enable data loading
-		data_mux.ports["enable"].value = "read_mux_ena";
+		self.vhdlGen.commit_append_line(1)
+		self.vhdlGen.wr_line("\n")
 
-		self.vhdlGen.write_comment("Read data multiplexor", gap=4)
-		self.vhdlGen.format_entity_decl(data_mux)
-		self.vhdlGen.create_comp_instance(data_mux)
+		# Close generate determined by isPresent property. Append dummy
+		# drivers for case when parameter is false
+		if (reg.isPresent != ""):
+			self.vhdlGen.commit_append_line(1)
+			self.vhdlGen.wr_line("\n")
+
+			if (self.reg_has_access_type(reg, ["write"])):
+				self.vhdlGen.create_if_generate(name + "_present_gen_f",
+					paramName.upper(), "false", gap = 4)
 
+				rst_val = self.calc_reg_rstval_mask(reg)
+				self.vhdlGen.create_signal_connection(
+					(block.name + "_out." + reg.name).lower(),
+					"(OTHERS => " + rst_val + ")", gap = 8)
 
-	def create_read_data_mask_driver(self):
+				self.vhdlGen.commit_append_line(1)
+				self.vhdlGen.wr_line("\n")
+
+
+	def is_reg_table_slot(self, reg):
 		"""
-		Create driver for read data mask signal from byte enable inputs of memory
-		bus.
+		Check if register is implemented by table-driven register file.
+		Writable registers which are neither elements of register array
+		nor conditionally present are implemented by it.
 		"""
-		self.vhdlGen.write_comment("Read data mask - Byte enables", gap = 4)
-		self.vhdlGen.wr_line("    read_data_mask_n  <= \n")
+		return (self.regFileType == "table" and
+				self.reg_has_access_type(reg, ["write"]) and
+				get_reg_array_index(reg) == None and reg.isPresent == "" and
+				not has_reg_alias(reg))
 
-		for byte in range(self.wrdWidthByte - 1, -1, -1):
-			be_byte_str = "      " + "be({}) & ".format(byte) * 7 + "be({})".format(byte)
-			self.vhdlGen.wr_line(be_byte_str)
-			if (byte == 0):
-				self.vhdlGen.wr_line(";\n")
-			else:
-				self.vhdlGen.wr_line(" &\n")
 
-		self.vhdlGen.wr_line("\n")
+	def get_reg_table_shapes(self, block):
+		"""
+		Group registers of table-driven register file by their width.
+		Returns:
+			List of [width, registers] sorted by width, registers of each
+			width are sorted by address offset.
+		"""
+		shapes = {}
+		for reg in self.get_sorted_regs(block):
+			if (self.is_reg_table_slot(reg)):
+				shapes.setdefault(reg.size, []).append(reg)
 
+		return [[width, shapes[width]] for width in sorted(shapes)]
 
-	def create_reg_cond_generics(self, block, entity):
+
+	def get_reg_table_prefix(self, width):
 		"""
-		Add conditional generic definitions into entity declaration. Parameter
-		"isPresent" of each IP-XACT register is added as generic boolean input.
-		Parameter look-up is performed for each found parameter.
+		Get name prefix of tables and signals of register file of given width.
 		"""
-		for reg in block.register:
-			if (reg.isPresent != ""):
-				paramName = self.parameter_lookup(reg.isPresent)
-				entity.generics[paramName] = LanDeclaration(paramName, value = 0)
-				entity.generics[paramName].value = "true"
-				entity.generics[paramName].type = "boolean"
-				entity.generics[paramName].specifier = "constant"
+		return "reg_" + str(width)
 
 
-	def create_reg_block_template(self, block):
+	def format_natural_table(self, values):
 		"""
-		Load memory bus entity template, add ports for register inputs, outputs.
-		Create declaration of register block entity.
+		Format list of naturals as VHDL aggregate. Single element aggregate
+		must use named association.
 		"""
-		# Load memory bus template and create entity definition
-		path = os.path.join(ROOT_PATH, self.template_sources["mem_bus_template_path"])
-		entity = self.vhdlGen.load_entity_template(path)
-		entity.intType = "entity"
-		entity.isInstance = False		
-		entity.name = block.name.lower() + "_reg_map"
+		if (len(values) == 1):
+			return "(0 => " + str(values[0]) + ")"
+		return "(" + ", ".join([str(value) for value in values]) + ")"
 
-		# Add ports for register values
-		self.create_reg_ports(block, entity.ports)
 
-		# Add generics for conditionally defined components
-		self.create_reg_cond_generics(block, entity)
+	def create_reg_table_decls(self, block, signDict):
+		"""
+		Create constant tables of table-driven register file and vectors of
+		register values for each register width. Value of slot "i" lies on
+		bits ((i + 1) * width - 1 downto i * width) of the vectors.
+		"""
+		for [width, regs] in self.get_reg_table_shapes(block):
+			prefix = self.get_reg_table_prefix(width)
+			vect_width = len(regs) * width
 
-		# Format entity declarations to look nice
-		self.vhdlGen.format_decls(entity.ports, gap=2, alignLeft=True,
-					alignRight=False, alignLen=30, wrap=False)
-		self.vhdlGen.format_decls(entity.generics, gap=2, alignLeft=True,
-					alignRight=False, alignLen=30, wrap=False)
+			# Masks of all slots packed into single vector
+			tables = [["_data_mask", MASK_DATA], ["_reset_value", MASK_RSTVAL],
+					  ["_auto_clear", MASK_AUTOCLEAR]]
+			for [suffix, mask_ind] in tables:
+				value = 0
+				for (i, reg) in enumerate(regs):
+					value |= self.get_reg_masks(reg)[mask_ind] << (i * width)
 
-		self.vhdlGen.create_comp_instance(entity)
-		self.vhdlGen.commit_append_line(1)
+				name = prefix + suffix
+				signDict[name] = LanDeclaration(name,
+									value = "{:0{}b}".format(value, vect_width))
+				signDict[name].type = "std_logic"
+				signDict[name].bitWidth = vect_width
+				signDict[name].specifier = "constant"
 
-		return entity
+			# Word index and lowest byte enable of each slot
+			wrd_inds = [self.get_wrd_index(block, reg) - 1 for reg in regs]
+			be_inds = [reg.addressOffset % self.wrdWidthByte for reg in regs]
+			for [suffix, values] in [["_wrd_ind", wrd_inds],
+									 ["_be_ind", be_inds]]:
+				name = prefix + suffix
+				signDict[name] = LanDeclaration(name,
+									value = self.format_natural_table(values))
+				signDict[name].type = "natural_array_t(0 to {})".format(
+										len(regs) - 1)
+				signDict[name].specifier = "constant"
 
+			name = prefix + "_values"
+			signDict[name] = LanDeclaration(name, value = None)
+			signDict[name].type = "std_logic"
+			signDict[name].bitWidth = vect_width
+			signDict[name].specifier = "signal"
 
-	def create_write_reg_record_driver(self, block):
+
+	def create_reg_table_instance(self, block, width, reg, gap):
 		"""
-		Create driver for write registe record. Internal signal is connected
-		to output port.
+		Create register instance within "for generate" loop of table-driven
+		register file. Generics are selected from constant tables by the loop
+		variable.
 		"""
-		dest = block.name + "_out"
-		src = dest + "_i"
-		self.vhdlGen.create_signal_connection(dest, src, gap = 4)
-
+		prefix = self.get_reg_table_prefix(width)
+		slot = "((i + 1) * {} - 1 downto i * {})".format(width, width)
 
-	def create_psl_cover_point(self, block, reg, acc_type):
-		"""
+		path = os.path.join(ROOT_PATH, self.template_sources["reg_template_path"])
+		reg_inst = self.vhdlGen.load_entity_template(path)
+		reg_inst.isInstance = True
+		reg_inst.intType = "entity"
+		reg_inst.value = prefix + "_reg_comp"
+
+		reg_inst.generics["data_width"].value = width
+		reg_inst.generics["data_mask"].value = (prefix + "_data_mask").upper() + slot
+		reg_inst.generics["reset_polarity"].value = "reset_polarity".upper()
+		reg_inst.generics["reset_value"].value = (prefix + "_reset_value").upper() + slot
+		reg_inst.generics["auto_clear"].value = (prefix + "_auto_clear").upper() + slot
+
+		self.fill_reg_ports(block, reg, reg_inst, "i")
+		reg_inst.ports["reg_value"].value = prefix + "_values" + slot
+
+		self.vhdlGen.format_entity_decl(reg_inst, base_indent=gap)
+		self.vhdlGen.create_comp_instance(reg_inst)
+
+
+	def create_reg_table(self, block):
+		"""
+		Create table-driven register file. For each register width, single
+		"for generate" loop with register instance is created. Values of the
+		registers are then connected to output record.
+		"""
+		for [width, regs] in self.get_reg_table_shapes(block):
+			prefix = self.get_reg_table_prefix(width)
+
+			self.vhdlGen.write_comment("Register file of " + str(width) +
+				" bit registers", gap = 4)
+
+			self.vhdlGen.create_for_generate(prefix + "_gen", "i",
+				["0", str(len(regs) - 1)], gap = 4)
+
+			be_ind = (prefix + "_be_ind").upper() + "(i)"
+			self.write_loop_consts([
+				["WRD_IND", (prefix + "_wrd_ind").upper() + "(i)"],
+				["L_IND", be_ind + " * 8"],
+				["L_BE", be_ind]], 6)
+			self.vhdlGen.wr_line("    begin\n")
+
+			self.create_reg_table_instance(block, width, regs[0], 8)
+
+			self.vhdlGen.commit_append_line(1)
+			self.vhdlGen.wr_line("\n")
+
+			for (i, reg) in enumerate(regs):
+				self.vhdlGen.create_signal_connection(
+					self.calc_reg_record_item(block, reg, "_out_i."),
+					"{}_values({} downto {})".format(prefix,
+						(i + 1) * width - 1, i * width), gap = 4)
+			self.vhdlGen.wr_line("\n")
+
+
+	def get_block_reg_aliases(self, block):
+		"""
+		Get set / clear / toggle aliases of registers of a block (see
+		get_reg_aliases). Aliases are searched on first request for a block.
+		"""
+		aliases = self.blkRegAliases.get(block.name)
+		if (aliases == None):
+			aliases = get_reg_aliases(block, self.get_sorted_regs(block),
+						lambda reg: self.reg_has_access_type(reg, ["write"]),
+						self.wrdWidthByte,
+						lambda addr: self.get_regs_from_word(addr, block))
+			self.blkRegAliases[block.name] = aliases
+		return aliases
+
+
+	def get_reg_alias_list(self, block, reg):
+		"""
+		Get aliases of a register.
+		"""
+		return [alias for alias in self.get_block_reg_aliases(block)
+					if alias.reg is reg]
+
+
+	def create_reg_alias_decls(self, block, signDict):
+		"""
+		Create declarations of register aliases: select of each alias, chip
+		select and write data of each aliased register.
+		"""
+		for alias in self.get_block_reg_aliases(block):
+			name = "{}_{}_sel".format(alias.reg.name.lower(), alias.kind)
+			signDict[name] = LanDeclaration(name, value = None)
+			signDict[name].type = "std_logic"
+			signDict[name].specifier = "signal"
+			signDict[name].bitWidth = 1
+
+			for [suffix, width] in [["_cs", 1], ["_data_in", alias.reg.size]]:
+				name = alias.reg.name.lower() + suffix
+				signDict[name] = LanDeclaration(name, value = None)
+				signDict[name].type = "std_logic"
+				signDict[name].specifier = "signal"
+				signDict[name].bitWidth = width
+
+
+	def create_reg_alias_logic(self, block, reg):
+		"""
+		Create write logic of register aliases. Alias is selected by
+		comparison of word address, register instance is then selected and
+		written with register value where bits written with logic 1 are set,
+		cleared or toggled. Register without aliases is skipped.
+		"""
+		aliases = self.get_reg_alias_list(block, reg)
+		if (not aliases):
+			return
+
+		[addr_hind, addr_lind] = self.calc_addr_indices(block)
+		value = self.calc_reg_record_item(block, reg, "_out_i.")
+		l_ind = (reg.addressOffset * 8) % self.wrdWidthBit
+		w_data = "{}({} downto {})".format(self.get_bus_signal("w_data"),
+											l_ind + reg.size - 1, l_ind)
+		operators = {"set" : "{} or {}", "clr" : "{} and not {}",
+					 "tgl" : "{} xor {}"}
+
+		self.vhdlGen.write_comment(reg.name.upper() + " register aliases",
+			gap = 4)
+		for alias in aliases:
+			cond = "{} = '1'".format(self.get_bus_signal("cs"))
+			if (addr_hind >= addr_lind):
+				cond += " and {}({} downto {}) = {}".format(
+					self.get_bus_signal("address"), addr_hind, addr_lind,
+					self.vhdlGen.format_bit_string(
+						alias.addressOffset >> addr_lind,
+						addr_hind - addr_lind + 1))
+			self.vhdlGen.wr_line("    {}_{}_sel <= '1' when ({})\n".format(
+				reg.name.lower(), alias.kind, cond))
+			self.vhdlGen.wr_line("        else '0';\n")
+		self.vhdlGen.wr_line("\n")
+
+		sels = ["reg_sel({})".format(self.get_wrd_index(block, reg) - 1)]
+		sels += ["{}_{}_sel".format(reg.name.lower(), alias.kind)
+					for alias in aliases]
+		self.vhdlGen.create_signal_connection(reg.name.lower() + "_cs",
+			" or ".join(sels), gap = 4)
+		self.vhdlGen.wr_line("\n")
+
+		self.vhdlGen.wr_line("    {}_data_in <=\n".format(reg.name.lower()))
+		for alias in aliases:
+			self.vhdlGen.wr_line("        {}\n".format(
+				operators[alias.kind].format(value, w_data)))
+			self.vhdlGen.wr_line("            when ({}_{}_sel = '1') " \
+				"else\n".format(reg.name.lower(), alias.kind))
+		self.vhdlGen.wr_line("        {};\n".format(w_data))
+		self.vhdlGen.wr_line("\n")
+
+
+	def create_write_reg_instances(self, block):
+		"""
+		Create VHDL instance for each writable register in a memory block.
+		Register arrays are created as single "for generate" loop. Registers
+		of table-driven register file are created by create_reg_table.
+		"""
+		if (self.regFileType == "table"):
+			self.create_reg_table(block)
+
+		for i,reg in enumerate(self.get_sorted_regs(block)):
+
+			# Elements of register array are created by single loop
+			if (is_reg_array_tail(reg)):
+				continue
+
+			if (get_reg_array_index(reg) != None):
+				if (self.reg_has_access_type(reg, ["write"]) or
+					self.is_reg_write_indicate(reg) or
+					self.is_reg_read_indicate(reg)):
+					self.create_reg_array(block, reg)
+				continue
+
+			# Create register instances for writable registers
+			if (self.reg_has_access_type(reg, ["write"]) and
+				not self.is_reg_table_slot(reg)):
+				self.create_reg_alias_logic(block, reg)
+				self.create_reg_instance(block, reg)
+
+			# Create access signalling for registers which have signalling enabled
+			if (self.is_reg_write_indicate(reg) or self.is_reg_read_indicate(reg)):
+				self.create_access_signaller(block, reg)
+
+
+	def is_read_mux_compact(self, block):
+		"""
+		Check if read data multiplexor input of a block is compacted to words
+		with readable registers.
+		"""
+		return (self.readMuxCompact and
+				self.calc_blk_wrd_count(block, ["read"]) > 0)
+
+
+	def calc_read_mux_sel_width(self, block):
+		"""
+		Calculate width of read data multiplexor selector. Selector of
+		compacted multiplexor must also address one index beyond the last
+		word, which is used for addresses without readable registers.
+		"""
+		if (self.is_read_mux_compact(block)):
+			return self.calc_addr_width_from_size(
+						self.calc_blk_wrd_count(block, ["read"]) + 1)
+
+		return self.calc_wrd_address_width(block)
+
+
+	def calc_read_mux_in_width(self, block):
+		"""
+		Calculate width of read data multiplexor input.
+		"""
+		if (self.is_read_mux_compact(block)):
+			return self.calc_blk_wrd_count(block, ["read"]) * self.wrdWidthBit
+
+		[low_addr, high_addr] = self.calc_blk_wrd_span(block, ["read"])
+		high_addr += self.wrdWidthByte
+		return (high_addr - low_addr) * 8
+
+
+	def create_read_mux_sel_remap(self, block):
+		"""
+		Create remap of address to index of compacted read data multiplexor
+		input. Addresses without readable registers select index beyond the
+		last input, thus all zeroes are read.
+		"""
+		sel_width = self.calc_read_mux_sel_width(block)
+		addr_width = self.calc_wrd_address_width(block)
+		addr_indices = self.calc_addr_indices(block)
+
+		values = []
+		conditions = []
+		for (i, wrd_addr) in enumerate(self.get_used_words(block, ["read"])):
+			values.append(self.vhdlGen.format_bit_string(i, sel_width))
+			conditions.append(self.vhdlGen.format_bit_string(
+								int(wrd_addr / self.wrdWidthByte), addr_width))
+
+		values.append("(OTHERS => '1')")
+		conditions.append("others")
+
+		self.vhdlGen.write_comment("Read data multiplexor selector", gap = 4)
+		self.vhdlGen.create_with_select("read_mux_sel",
+			"{}({} downto {})".format(self.get_bus_signal("address"),
+				addr_indices[0], addr_indices[1]),
+			values, conditions, gap = 4)
+
+
+	def is_read_mux_tree(self, block):
+		"""
+		Check if read data multiplexor of a block is implemented as pipelined
+		multiplexor tree. Tree needs at least one bit of data selector.
+		"""
+		return ((self.readMuxType == "tree" or self.has_pipeline_stage("read"))
+				and self.calc_read_mux_sel_width(block) > 0)
+
+
+	def calc_read_mux_stages(self, block):
+		"""
+		Calculate number of pipeline stages of read data multiplexor. Tree
+		has at most one pipeline stage per level. "read" pipeline stage
+		requires at least one stage.
+		"""
+		if (not self.is_read_mux_tree(block)):
+			return 0
+
+		stages = 0
+		if (self.readMuxType == "tree"):
+			stages = int(self.readMuxStages)
+		if (self.has_pipeline_stage("read")):
+			stages = max(stages, 1)
+
+		return min(stages, self.calc_read_mux_sel_width(block))
+
+
+	def calc_read_latency(self, block):
+		"""
+		Calculate read latency of a block (in clock cycles) caused by pipeline
+		stages of bus signals and read data multiplexor. Output register of
+		read data ("REGISTERED_READ") is not included.
+		"""
+		return self.calc_bus_stages() + self.calc_read_mux_stages(block)
+
+
+	def calc_write_latency(self, block):
+		"""
+		Calculate write latency of a block (in clock cycles) caused by
+		pipeline stages of bus signals. Register is written one clock cycle
+		after this latency.
+		"""
+		return self.calc_bus_stages()
+
+
+	def create_read_data_mux_instance(self, block):
+		"""
+        Create instance of Read data multiplexor. Multiplexor tree is used
+        when configured by "readMuxType".
+		"""
+		if (self.is_read_mux_tree(block)):
+			templ_name = "data_mux_tree_template_path"
+		else:
+			templ_name = "data_mux_template_path"
+		path = os.path.join(ROOT_PATH, self.template_sources[templ_name])
+
+		# Load data mux template
+		data_mux = self.vhdlGen.load_entity_template(path)
+		data_mux.isInstance = True
+		data_mux.value = (data_mux.name + "_"+ block.name + "_comp").lower()
+		
+		# FIll generic values
+		data_mux.generics["data_out_width"].value = self.wrdWidthBit
+
+		data_mux.generics["data_in_width"].value = self.calc_read_mux_in_width(block)
+		data_mux.generics["sel_width"].value = self.calc_read_mux_sel_width(block)
+
+		if (self.is_read_mux_tree(block)):
+			data_mux.generics["pipeline_stages"].value = \
+				self.calc_read_mux_stages(block)
+
+		data_mux.generics["registered_out"].value = "registered_read".upper()
+		data_mux.generics["reset_polarity"].value = "reset_polarity".upper()
+
+		# Connect ports
+		data_mux.ports["clk_sys"].value = "clk_sys"
+		data_mux.ports["res_n"].value = "res_n"
+
+		if (self.is_read_mux_compact(block)):
+			data_mux.ports["data_selector"].value = "read_mux_sel"
+		else:
+			addr_indices = self.calc_addr_indices(block)
+			addr_str = self.get_bus_signal("address") + "(" + str(addr_indices[0]) + " downto " + str(addr_indices[1]) + ")"
+			data_mux.ports["data_selector"].value = addr_str
+
+		data_mux.ports["data_in"].value = "read_data_mux_in"
+		data_mux.ports["data_mask_n"].value = "read_data_mask_n"
+		data_mux.ports["data_out"].value = "r_data"
+
+		# Enable data loading
+		data_mux.ports["enable"].value = "read_mux_ena";
+
+		self.vhdlGen.write_comment("Read data multiplexor", gap=4)
+		self.vhdlGen.format_entity_decl(data_mux)
+		self.vhdlGen.create_comp_instance(data_mux)
+
+
+	def create_read_data_mask_driver(self):
+		"""
+		Create driver for read data mask signal from byte enable inputs of memory
+		bus.
+		"""
+		self.vhdlGen.write_comment("Read data mask - Byte enables", gap = 4)
+		self.vhdlGen.wr_line("    read_data_mask_n  <= \n")
+
+		for byte in range(self.wrdWidthByte - 1, -1, -1):
+			be = self.get_bus_signal("be")
+			be_byte_str = "      " + "{}({}) & ".format(be, byte) * 7 + \
+							"{}({})".format(be, byte)
+			self.vhdlGen.wr_line(be_byte_str)
+			if (byte == 0):
+				self.vhdlGen.wr_line(";\n")
+			else:
+				self.vhdlGen.wr_line(" &\n")
+
+		self.vhdlGen.wr_line("\n")
+
+
+	def create_reg_cond_generics(self, block, entity):
+		"""
+		Add conditional generic definitions into entity declaration. Parameter
+		"isPresent" of each IP-XACT register is added as generic boolean input.
+		Parameter look-up is performed for each found parameter.
+		"""
+		for reg in block.register:
+			if (reg.isPresent != ""):
+				paramName = self.parameter_lookup(reg.isPresent)
+				entity.generics[paramName] = LanDeclaration(paramName, value = 0)
+				entity.generics[paramName].value = "true"
+				entity.generics[paramName].type = "boolean"
+				entity.generics[paramName].specifier = "constant"
+
+
+	def create_reg_block_decl(self, block):
+		"""
+		Load memory bus entity template, add ports for register inputs, outputs.
+		Return declaration of register block entity.
+		"""
+		# Load memory bus template and create entity definition
+		path = os.path.join(ROOT_PATH, self.template_sources["mem_bus_template_path"])
+		entity = self.vhdlGen.load_entity_template(path)
+		entity.intType = "entity"
+		entity.isInstance = False		
+		entity.name = block.name.lower() + "_reg_map"
+
+		# Add ports for register values
+		self.create_reg_ports(block, entity.ports)
+
+		# Add generics for conditionally defined components
+		self.create_reg_cond_generics(block, entity)
+
+		return entity
+
+
+	def create_reg_block_template(self, block):
+		"""
+		Create declaration of register block entity and write it.
+		"""
+		entity = self.create_reg_block_decl(block)
+
+		# Format entity declarations to look nice
+		self.vhdlGen.format_decls(entity.ports, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
+		self.vhdlGen.format_decls(entity.generics, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
+
+		self.vhdlGen.create_comp_instance(entity)
+		self.vhdlGen.commit_append_line(1)
+
+		return entity
+
+
+	def get_block_shadow_groups(self, block):
+		"""
+		Get shadow register groups of a block (see get_shadow_groups). Groups
+		are searched on first request for a block.
+		"""
+		groups = self.blkShadowGroups.get(block.name)
+		if (groups == None):
+			groups = get_shadow_groups(block, self.get_sorted_regs(block),
+						lambda reg: self.reg_has_access_type(reg, ["write"]))
+			self.blkShadowGroups[block.name] = groups
+		return groups
+
+
+	def get_shadow_live_name(self, reg):
+		"""
+		Get name of signal with committed value of register of shadow group.
+		"""
+		return reg.name.lower() + "_live"
+
+
+	def create_shadow_decls(self, block, signDict):
+		"""
+		Create declarations of shadow register groups of a block: commit
+		strobe of each group and committed value of each register.
+		"""
+		for group in self.get_block_shadow_groups(block):
+			decl = LanDeclaration(group.name + "_commit", value = None)
+			decl.type = "std_logic"
+			decl.specifier = "signal"
+			decl.bitWidth = 1
+			signDict[decl.name] = decl
+
+			for reg in group.regs:
+				decl = LanDeclaration(self.get_shadow_live_name(reg),
+										value = None)
+				decl.type = "std_logic"
+				decl.specifier = "signal"
+				decl.bitWidth = reg.size
+				signDict[decl.name] = decl
+
+
+	def create_shadow_group(self, block, group):
+		"""
+		Create commit of shadow register group. Registers of the group serve
+		as shadow storage (reads return written values). Write to commit
+		register of the group sets commit strobe, upon which all registers
+		of the group are copied to committed values at once. Commit strobe is
+		registered, thus committed values contain value written to commit
+		register itself.
+		"""
+		reg_sel_index = self.get_wrd_index(block, group.commitReg) - 1
+		l_be_ind = group.commitReg.addressOffset % 4
+		h_be_ind = l_be_ind + int(group.commitReg.size / 8) - 1
+		be_str = " or ".join(["{}({})".format(self.get_bus_signal("be"), i)
+								for i in range(l_be_ind, h_be_ind + 1)])
+		commit = group.name + "_commit"
+
+		self.vhdlGen.write_comment("Shadow group {}: committed by write to " \
+			"{} register".format(group.name.upper(),
+								group.commitReg.name.upper()), gap = 4)
+		self.vhdlGen.wr_line("    {}_proc : process(res_n, clk_sys)\n".format(
+			commit))
+		self.vhdlGen.wr_line("    begin\n")
+		self.vhdlGen.wr_line("        if (res_n = RESET_POLARITY) then\n")
+		self.vhdlGen.wr_line("            {} <= '0';\n".format(commit))
+		for reg in group.regs:
+			self.vhdlGen.wr_line("            {} <= {};\n".format(
+				self.get_shadow_live_name(reg), self.calc_reg_rstval_mask(reg)))
+		self.vhdlGen.wr_line("        elsif (rising_edge(clk_sys)) then\n")
+		self.vhdlGen.wr_line("            {} <= {} and {} and reg_sel({}) " \
+			"and\n".format(commit, self.get_bus_signal("cs"),
+							self.get_bus_signal("write"), reg_sel_index))
+		self.vhdlGen.wr_line("                ({});\n".format(be_str))
+		self.vhdlGen.wr_line("            if ({} = '1') then\n".format(commit))
+		for reg in group.regs:
+			self.vhdlGen.wr_line("                {} <= {};\n".format(
+				self.get_shadow_live_name(reg),
+				self.calc_reg_record_item(block, reg, "_out_i.")))
+		self.vhdlGen.wr_line("            end if;\n")
+		self.vhdlGen.wr_line("        end if;\n")
+		self.vhdlGen.wr_line("    end process;\n")
+		self.vhdlGen.wr_line("\n")
+
+
+	def create_shadow_groups(self, block):
+		"""
+		Create commit of each shadow register group of a block.
+		"""
+		for group in self.get_block_shadow_groups(block):
+			self.create_shadow_group(block, group)
+
+
+	def create_write_reg_record_driver(self, block):
+		"""
+		Create driver for write registe record. Internal signal is connected
+		to output port. Registers of shadow groups are driven by their
+		committed values.
+		"""
+		dest = block.name + "_out"
+		src = dest + "_i"
+		groups = self.get_block_shadow_groups(block)
+		if (not groups):
+			self.vhdlGen.create_signal_connection(dest, src, gap = 4)
+			return
+
+		regs = [reg for group in groups for reg in group.regs]
+
+		# Sensitivity list wrapped to lines
+		sens = [src] + [self.get_shadow_live_name(reg) for reg in regs]
+		sens_lines = [[]]
+		for name in sens:
+			if (len(", ".join(sens_lines[-1] + [name])) > 50):
+				sens_lines.append([])
+			sens_lines[-1].append(name)
+		sens_str = ",\n        ".join([", ".join(line) for line in sens_lines])
+
+		self.vhdlGen.write_comment("Output record with committed values of " \
+			"shadow groups", gap = 4)
+		self.vhdlGen.wr_line("    {}_proc : process({})\n".format(dest,
+			sens_str))
+		self.vhdlGen.wr_line("    begin\n")
+		self.vhdlGen.wr_line("        {} <= {};\n".format(dest, src))
+		for reg in regs:
+			self.vhdlGen.wr_line("        {} <= {};\n".format(
+				self.calc_reg_record_item(block, reg, "_out."),
+				self.get_shadow_live_name(reg)))
+		self.vhdlGen.wr_line("    end process;\n")
+
+
+	def create_psl_cover_point(self, block, reg, acc_type):
+		"""
 		Create PSL cover point for write into a register.
 		"""
 		# Get index of memory word for the register
@@ -775,21 +1842,32 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		# Calcuate byte enable indices
 		l_be_ind = reg.addressOffset % 4
 		h_be_ind = l_be_ind + int(reg.size / 8) - 1
-		be_str = "("
-		for i in range(l_be_ind, h_be_ind + 1):
-			be_str += "be({}) = '1'".format(i)
-			if (i != h_be_ind):
-				be_str += " or "
-			else:
-				be_str += ")"
+		be_terms = ["{}({}) = '1'".format(self.get_bus_signal("be"), i)
+						for i in range(l_be_ind, h_be_ind + 1)]
+		be_str = "(" + " or ".join(be_terms) + ")"
 
 		self.vhdlGen.write_comment(" psl {}_{}_access_cov : cover (".format(
 			reg.name.lower(), acc_type), gap = 4, small=True)
-		self.vhdlGen.write_comment("    cs = '1' and {} = '1' " \
-			"and reg_sel({}) = '1' and ".format(acc_type, reg_sel_index),
+		self.vhdlGen.write_comment("    {} = '1' and {} = '1' " \
+			"and reg_sel({}) = '1' and ".format(self.get_bus_signal("cs"),
+			self.get_bus_signal(acc_type), reg_sel_index),
 			gap=4, small=True)
 
-		self.vhdlGen.write_comment("    {});".format(be_str), gap=4, small=True)
+		# Comment lines are split at 75 characters, byte enable terms which
+		# don't fit to single line are written one per line.
+		if (len("    {});".format(be_str)) <= 75):
+			self.vhdlGen.write_comment("    {});".format(be_str), gap=4,
+										small=True)
+		else:
+			for (i, term) in enumerate(be_terms):
+				line = "     " + term
+				if (i == 0):
+					line = "    (" + term
+				if (i == len(be_terms) - 1):
+					line += "));"
+				else:
+					line += " or"
+				self.vhdlGen.write_comment(line, gap=4, small=True)
 		self.vhdlGen.wr_nl()
 
 
@@ -799,6 +1877,7 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		generated block. Following points are created:
 			1. Write cover point for each writable register.
 			2. Read cover point for each readable register.
+		Register arrays are covered by cover points of their first element.
 		"""
 		# Add functional coverage comment
 		self.vhdlGen.write_comment("PSL functional coverage", gap = 4)
@@ -808,7 +1887,10 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 			"rising_edge(clk_sys);", gap = 4, small=True)
 
 		# Go through the registers
-		for i,reg in enumerate(sorted(block.register, key=lambda a: a.addressOffset)):
+		for i,reg in enumerate(self.get_sorted_regs(block)):
+
+			if (is_reg_array_tail(reg)):
+				continue
 
 			# Create write psl coverage for every writable register
 			if (self.reg_has_access_type(reg, ["write"])):
@@ -836,7 +1918,8 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 				condition="clear_read_data".upper(), value="false", gap = 4)
 
 		self.vhdlGen.create_signal_connection(result="read_mux_ena", 
-												driver="read and cs", gap=8)
+			driver="{} and {}".format(self.get_bus_signal("read"),
+										self.get_bus_signal("cs")), gap=8)
 
 		self.vhdlGen.commit_append_line(1)
 		self.vhdlGen.wr_line("\n")
@@ -892,6 +1975,9 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 
 		# Start architecture
 		self.vhdlGen.create_comp_instance(architecture)
+
+		# Create pipeline stages of bus signals
+		self.create_bus_pipeline_stages()
 		
 		# Create instance of write address generator
 		self.create_addr_decoder(block)
@@ -899,13 +1985,21 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		# Create instance of registers
 		self.create_write_reg_instances(block)
 
+		# Create commit of shadow register groups
+		self.create_shadow_groups(block)
+
 		# Create driver for enable signal for read data multiplexor
 		self.create_read_data_mux_ena()
 
+		# Create remap of address for compacted read data multiplexor
+		if (self.is_read_mux_compact(block)):
+			self.create_read_mux_sel_remap(block)
+
 		# Create Data multiplexor for data reads
 		self.create_read_data_mux_instance(block)
 
 		# Create Driver for read data signal
+		self.create_reg_array_rd_data(block)
 		self.create_read_data_mux_in(block)
 		self.create_read_data_mask_driver()
 
@@ -920,37 +2014,1274 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		self.vhdlGen.commit_append_line(1)
 
 
-	def create_output_reg_record(self, block):
+	def create_mem_block_template(self, block):
 		"""
-		Create VHDL record for writable registers from IP-XACT memory block object.
-		If register write should be indicated, additional <reg_name>_write signal
-		is added.
-		If register read should be indicated, additional <reg_name>_read signal is
-		added.
+		Load memory bus entity template and create declaration of memory
+		block entity.
 		"""
-		outDecls = []
-		outName = block.name + "_out_t"
+		path = os.path.join(ROOT_PATH, self.template_sources["mem_bus_template_path"])
+		entity = self.vhdlGen.load_entity_template(path)
+		entity.intType = "entity"
+		entity.isInstance = False
+		entity.name = block.name.lower() + "_mem_map"
 
-		# Create the declarations
-		for i,reg in enumerate(sorted(block.register, key=lambda a: a.addressOffset)):
+		# Format entity declarations to look nice
+		self.vhdlGen.format_decls(entity.ports, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
+		self.vhdlGen.format_decls(entity.generics, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
 
-			if ("write" in reg.access):
-				outDecls.append(LanDeclaration(reg.name, value=""))
-				outDecls[-1].type = "std_logic_vector"
-				outDecls[-1].bitWidth = reg.size
-				outDecls[-1].specifier = ""
+		self.vhdlGen.create_comp_instance(entity)
+		self.vhdlGen.commit_append_line(1)
+
+		return entity
+
+
+	def create_mem_ram_instance(self, block):
+		"""
+		Create instance of RAM which implements memory block. Read of RAM is
+		registered when "REGISTERED_READ" generic of memory block is true.
+		"""
+		path = os.path.join(ROOT_PATH, self.template_sources["mem_ram_template_path"])
+		mem_ram = self.vhdlGen.load_entity_template(path)
+		mem_ram.isInstance = True
+		mem_ram.value = (mem_ram.name + "_" + block.name + "_comp").lower()
+
+		# Fill generic values
+		mem_ram.generics["data_width"].value = self.wrdWidthBit
+		mem_ram.generics["address_width"].value = self.calc_wrd_address_width(block)
+		mem_ram.generics["registered_read"].value = "registered_read".upper()
+		mem_ram.generics["clear_read_data"].value = "clear_read_data".upper()
+
+		# Connect ports
+		addr_indices = self.calc_addr_indices(block)
+		mem_ram.ports["clk_sys"].value = "clk_sys"
+		mem_ram.ports["address"].value = "address({} downto {})".format(
+			addr_indices[0], addr_indices[1])
+		mem_ram.ports["w_data"].value = "w_data"
+		mem_ram.ports["r_data"].value = "r_data"
+		mem_ram.ports["cs"].value = "cs"
+		mem_ram.ports["read"].value = "read"
+		mem_ram.ports["write"].value = "write"
+		mem_ram.ports["be"].value = "be"
+
+		self.vhdlGen.write_comment("Memory", gap=4)
+		self.vhdlGen.format_entity_decl(mem_ram)
+		self.vhdlGen.create_comp_instance(mem_ram)
+
+
+	def write_mem_block(self, block):
+		"""
+		Create memory block in VHDL from IP-XACT memory block object with
+		"memory" usage. Memory block has the same interface as register block
+		and is implemented by RAM.
+		"""
+
+		# Write file introduction
+		self.vhdlGen.wr_nl()
+
+		self.vhdlGen.write_comment("Memory implementation of: " +
+				block.name, gap = 0)
+		self.vhdlGen.write_gen_note()
+		self.vhdlGen.wr_nl()
+
+		self.vhdlGen.create_includes("ieee", ["std_logic_1164.all"])
+		self.vhdlGen.wr_nl()
+
+		self.vhdlGen.create_includes("work", ["cmn_reg_map_pkg.all"])
+
+		# Create entity definition
+		entity = self.create_mem_block_template(block)
+
+		# Create architecture of memory block
+		architecture = LanDeclaration("rtl", entity.name)
+		architecture.intType = "architecture"
+		architecture.ports = {}
+
+		# Start architecture
+		self.vhdlGen.create_comp_instance(architecture)
+
+		# Create instance of RAM
+		self.create_mem_ram_instance(block)
+
+		self.vhdlGen.wr_line("\n")
+		self.vhdlGen.commit_append_line(1)
+
+
+	def is_cdc_block(self, block):
+		"""
+		Check if clock domain crossing variant of a register block is
+		generated.
+		"""
+		return (block.usage == "register" and
+				block.name.lower() in self.cdcBlocks)
+
+
+	def get_cdc_name(self, block):
+		"""
+		Get name of clock domain crossing variant of register block entity.
+		"""
+		return block.name.lower() + "_reg_map_cdc"
+
+
+	def is_cdc_read_transferred(self, block):
+		"""
+		Check if reads of a block are transferred to core clock domain. Only
+		blocks with read indication need reads in core clock domain.
+		"""
+		for reg in block.register:
+			if (self.is_reg_read_indicate(reg)):
+				return True
+		return False
+
+
+	def calc_cdc_write_latency(self, block):
+		"""
+		Calculate latency of write into register in core clock domain.
+		Returns:
+			[bus_cycles, core_cycles] - Write reaches registers within sum of
+				given bus and core clock cycles.
+		"""
+		return [1, 4 + self.calc_write_latency(block)]
+
+
+	def calc_cdc_snapshot_age(self, block):
+		"""
+		Calculate maximal age of read snapshot of input record.
+		Returns:
+			[bus_cycles, core_cycles] - Read value is at most sum of given bus
+				and core clock cycles old.
+		"""
+		return [8, 4]
+
+
+	def create_cdc_clock_ports(self, block, signDict, prefix=""):
+		"""
+		Create clock and reset ports of core clock domain of a block.
+		"""
+		for name in ["clk_core", "res_core_n"]:
+			port = LanDeclaration(prefix + name, value=None)
+			port.direction = "in"
+			port.type = "std_logic"
+			port.bitWidth = 1
+			port.specifier = "signal"
+			signDict[port.name] = port
+
+
+	def create_cdc_full_port(self, signDict, name="full"):
+		"""
+		Create output port which indicates that clock domain crossing variant
+		of register block (or any such block of top level entity) can't take
+		further accesses.
+		"""
+		port = LanDeclaration(name, value=None)
+		port.direction = "out"
+		port.type = "std_logic"
+		port.bitWidth = 1
+		port.specifier = "signal"
+		signDict[port.name] = port
+
+
+	def calc_cdc_full_margin(self):
+		"""
+		Calculate number of free entries of access FIFO at which clock domain
+		crossing variant of register block indicates "full". Accesses issued
+		before "full" is seen are still in decode stages of top level entity.
+		"""
+		return self.topDecodeStages
+
+
+	def create_cdc_entity_decl(self, block):
+		"""
+		Create declaration of clock domain crossing variant of register block
+		entity. It has ports of register block, clock and reset of core clock
+		domain and "full" output.
+		"""
+		entity = self.create_reg_block_decl(block)
+		entity.name = self.get_cdc_name(block)
+		ports = {}
+		for (name, port) in entity.ports.items():
+			ports[name] = port
+			if (name == "res_n"):
+				self.create_cdc_clock_ports(block, ports)
+			if (name == "be"):
+				self.create_cdc_full_port(ports)
+		entity.ports = ports
+		return entity
+
+
+	def create_cdc_decls(self, block, signDict):
+		"""
+		Create declarations of architecture of clock domain crossing variant of
+		register block: accesses transferred via FIFO, memory bus of core
+		clock domain and snapshot of input record.
+		"""
+		depth = max(self.cdcFifoDepth, 4, self.calc_cdc_full_margin() + 1)
+		consts = [["cdc_fifo_depth_log2", self.calc_addr_width_from_size(depth)],
+				  ["cdc_full_margin", self.calc_cdc_full_margin()],
+				  ["access_width", "ADDRESS_WIDTH + DATA_WIDTH * 9 / 8 + 2"]]
+		for [name, value] in consts:
+			decl = LanDeclaration(name, value = value)
+			decl.type = "natural"
+			decl.specifier = "constant"
+			signDict[name] = decl
+
+		signals = [["wr_access", ["ACCESS_WIDTH - 1", "0"]],
+				   ["rd_access", ["ACCESS_WIDTH - 1", "0"]],
+				   ["push", None],
+				   ["fifo_full", None],
+				   ["core_valid", None]]
+		signals += [["core_" + name, bounds]
+						for [name, bounds] in self.busSignals]
+		signals += [["snap_req", None],
+					["snap_ack", None],
+					["snap_req_sync", ["1", "0"]],
+					["snap_ack_sync", ["1", "0"]],
+					["snap_capture", None],
+					["snap_take", None]]
+
+		for [name, bounds] in signals:
+			decl = LanDeclaration(name, value = None)
+			decl.type = "std_logic"
+			decl.specifier = "signal"
+			decl.bitWidth = 1
+			if (bounds != None):
+				[decl.upBound, decl.lowBound] = bounds
+			signDict[name] = decl
+
+		for name in ["bus_in", "snap_data"]:
+			decl = LanDeclaration(name, value = None)
+			decl.type = block.name + "_in_t"
+			decl.bitWidth = 0
+			decl.specifier = "signal"
+			signDict[name] = decl
+
+
+	def create_cdc_block_instance(self, block, inst_name, ports):
+		"""
+		Create instance of register block within clock domain crossing
+		variant. Ports are connected to signals of the same name unless given
+		in "ports" dictionary (port -> signal).
+		"""
+		inst = self.create_reg_block_decl(block)
+		inst.isInstance = True
+		inst.name = "entity work." + block.name.lower() + "_reg_map"
+		inst.value = inst_name
+
+		for (name, generic) in inst.generics.items():
+			generic.value = name.upper()
+
+		for (name, port) in inst.ports.items():
+			port.value = ports.get(name, name)
+
+		self.vhdlGen.format_entity_decl(inst)
+		self.vhdlGen.create_comp_instance(inst)
+
+
+	def create_cdc_access_fifo(self, block):
+		"""
+		Create transfer of accesses from bus clock domain to core clock
+		domain via asynchronous FIFO. Writes are always transferred, reads
+		only when block has read indication. "full" is set by almost full
+		FIFO, so that accesses already issued in decode stages of top level
+		entity still fit into it.
+		"""
+		self.vhdlGen.write_comment("Transfer of accesses to core clock " \
+			"domain", gap = 4)
+		if (self.is_cdc_read_transferred(block)):
+			self.vhdlGen.create_signal_connection("push",
+				"cs and (write or read)", gap = 4)
+		else:
+			self.vhdlGen.create_signal_connection("push", "cs and write",
+				gap = 4)
+		self.vhdlGen.create_signal_connection("wr_access",
+			"read & write & be & w_data & address", gap = 4)
+
+		fifo_path = os.path.join(ROOT_PATH,
+							self.template_sources["cdc_fifo_template_path"])
+		fifo = self.vhdlGen.load_entity_template(fifo_path)
+		fifo.isInstance = True
+		fifo.intType = "entity"
+		fifo.value = "cdc_fifo_comp"
+		fifo.generics["data_width"].value = "ACCESS_WIDTH"
+		fifo.generics["depth_log2"].value = "CDC_FIFO_DEPTH_LOG2"
+		fifo.generics["afull_margin"].value = "CDC_FULL_MARGIN"
+		fifo.generics["reset_polarity"].value = "RESET_POLARITY"
+
+		connections = {"wr_clk" : "clk_sys", "wr_res_n" : "res_n",
+					   "wr_data" : "wr_access", "wr_en" : "push",
+					   "full" : "fifo_full", "almost_full" : "full",
+					   "rd_clk" : "clk_core",
+					   "rd_res_n" : "res_core_n", "rd_data" : "rd_access",
+					   "rd_valid" : "core_valid", "rd_en" : "core_valid"}
+		for (name, port) in fifo.ports.items():
+			port.value = connections[name]
+
+		self.vhdlGen.format_entity_decl(fifo)
+		self.vhdlGen.create_comp_instance(fifo)
+
+		self.vhdlGen.write_comment("Memory bus of core clock domain", gap = 4)
+		self.vhdlGen.create_signal_connection("core_address",
+			"rd_access(ADDRESS_WIDTH - 1 downto 0)", gap = 4)
+		self.vhdlGen.create_signal_connection("core_w_data",
+			"rd_access(ADDRESS_WIDTH + DATA_WIDTH - 1 downto ADDRESS_WIDTH)",
+			gap = 4)
+		self.vhdlGen.create_signal_connection("core_be",
+			"rd_access(ACCESS_WIDTH - 3 downto ADDRESS_WIDTH + DATA_WIDTH)",
+			gap = 4)
+		self.vhdlGen.create_signal_connection("core_cs", "core_valid", gap = 4)
+		self.vhdlGen.create_signal_connection("core_write",
+			"core_valid and rd_access(ACCESS_WIDTH - 2)", gap = 4)
+		self.vhdlGen.create_signal_connection("core_read",
+			"core_valid and rd_access(ACCESS_WIDTH - 1)", gap = 4)
+		self.vhdlGen.wr_line("\n")
+
+		self.vhdlGen.wr_line("    assert not (push = '1' and fifo_full = '1' and " \
+			"rising_edge(clk_sys))\n")
+		self.vhdlGen.wr_line("        report \"Access to {} lost, CDC FIFO is " \
+			"full!\"\n".format(block.name))
+		self.vhdlGen.wr_line("        severity error;\n")
+		self.vhdlGen.wr_line("\n")
+
+
+	def create_cdc_snapshot(self, block):
+		"""
+		Create transfer of snapshots of input record from core clock domain to
+		bus clock domain. Snapshot is requested by toggle of "snap_req" and
+		acknowledged by toggle of "snap_ack", new snapshot is requested as
+		soon as previous one is taken.
+		"""
+		in_port = block.name.lower() + "_in"
+
+		self.vhdlGen.write_comment("Snapshot of input record: bus clock " \
+			"domain", gap = 4)
+		self.vhdlGen.create_signal_connection("snap_take",
+			"not (snap_ack_sync(1) xor snap_req)", gap = 4)
+		self.vhdlGen.wr_line("\n")
+		self.vhdlGen.wr_line("    snap_req_proc : process(res_n, clk_sys)\n")
+		self.vhdlGen.wr_line("    begin\n")
+		self.vhdlGen.wr_line("        if (res_n = RESET_POLARITY) then\n")
+		self.vhdlGen.wr_line("            snap_req <= '0';\n")
+		self.vhdlGen.wr_line("            snap_ack_sync <= (OTHERS => '0');\n")
+		self.vhdlGen.wr_line("        elsif (rising_edge(clk_sys)) then\n")
+		self.vhdlGen.wr_line("            snap_ack_sync <= snap_ack_sync(0) & " \
+			"snap_ack;\n")
+		self.vhdlGen.wr_line("            if (snap_take = '1') then\n")
+		self.vhdlGen.wr_line("                snap_req <= not snap_req;\n")
+		self.vhdlGen.wr_line("            end if;\n")
+		self.vhdlGen.wr_line("        end if;\n")
+		self.vhdlGen.wr_line("    end process;\n")
+		self.vhdlGen.wr_line("\n")
+		self.vhdlGen.wr_line("    bus_in_proc : process(clk_sys)\n")
+		self.vhdlGen.wr_line("    begin\n")
+		self.vhdlGen.wr_line("        if (rising_edge(clk_sys)) then\n")
+		self.vhdlGen.wr_line("            if (snap_take = '1') then\n")
+		self.vhdlGen.wr_line("                bus_in <= snap_data;\n")
+		self.vhdlGen.wr_line("            end if;\n")
+		self.vhdlGen.wr_line("        end if;\n")
+		self.vhdlGen.wr_line("    end process;\n")
+		self.vhdlGen.wr_line("\n")
+
+		self.vhdlGen.write_comment("Snapshot of input record: core clock " \
+			"domain", gap = 4)
+		self.vhdlGen.create_signal_connection("snap_capture",
+			"snap_req_sync(1) xor snap_ack", gap = 4)
+		self.vhdlGen.wr_line("\n")
+		self.vhdlGen.wr_line("    snap_ack_proc : process(res_core_n, clk_core)\n")
+		self.vhdlGen.wr_line("    begin\n")
+		self.vhdlGen.wr_line("        if (res_core_n = RESET_POLARITY) then\n")
+		self.vhdlGen.wr_line("            snap_ack <= '0';\n")
+		self.vhdlGen.wr_line("            snap_req_sync <= (OTHERS => '0');\n")
+		self.vhdlGen.wr_line("        elsif (rising_edge(clk_core)) then\n")
+		self.vhdlGen.wr_line("            snap_req_sync <= snap_req_sync(0) & " \
+			"snap_req;\n")
+		self.vhdlGen.wr_line("            if (snap_capture = '1') then\n")
+		self.vhdlGen.wr_line("                snap_ack <= snap_req_sync(1);\n")
+		self.vhdlGen.wr_line("            end if;\n")
+		self.vhdlGen.wr_line("        end if;\n")
+		self.vhdlGen.wr_line("    end process;\n")
+		self.vhdlGen.wr_line("\n")
+		self.vhdlGen.wr_line("    snap_data_proc : process(clk_core)\n")
+		self.vhdlGen.wr_line("    begin\n")
+		self.vhdlGen.wr_line("        if (rising_edge(clk_core)) then\n")
+		self.vhdlGen.wr_line("            if (snap_capture = '1') then\n")
+		self.vhdlGen.wr_line("                snap_data <= {};\n".format(in_port))
+		self.vhdlGen.wr_line("            end if;\n")
+		self.vhdlGen.wr_line("        end if;\n")
+		self.vhdlGen.wr_line("    end process;\n")
+		self.vhdlGen.wr_line("\n")
+
+
+	def write_reg_block_cdc(self, block):
+		"""
+		Create clock domain crossing variant of register block. Register block
+		is instantiated twice:
+			Bus clock domain  - Shadow which answers reads with the same latency
+								as register block. Read-write registers are
+								written directly, other read values are taken
+								from snapshot of input record.
+			Core clock domain - Drives output record. Accesses are transferred
+								via asynchronous FIFO, thus each write (and
+								read strobe) takes effect exactly once.
+		Bus master must hold accesses while "full" is set. Snapshots of input
+		record are transferred to bus clock domain by toggle handshake.
+		"""
+		self.vhdlGen.wr_nl()
+
+		[wr_bus, wr_core] = self.calc_cdc_write_latency(block)
+		[age_bus, age_core] = self.calc_cdc_snapshot_age(block)
+		self.vhdlGen.write_comment("Clock domain crossing variant of: " +
+				block.name, gap = 0)
+		self.vhdlGen.write_comment("Write latency: {} clk_sys + {} clk_core, " \
+			"read snapshot age: up to {} clk_sys + {} clk_core".format(
+				wr_bus, wr_core, age_bus, age_core), gap = 0)
+		self.vhdlGen.write_comment("Accesses must be held while \"full\" " \
+			"is set", gap = 0)
+		self.vhdlGen.write_gen_note()
+		self.vhdlGen.wr_nl()
+
+		self.vhdlGen.create_includes("ieee", ["std_logic_1164.all"])
+		self.vhdlGen.wr_nl()
+
+		wrk_pkgs = [self.memMap.name.lower() + "_pkg.all", "cmn_reg_map_pkg.all"]
+		self.vhdlGen.create_includes("work", wrk_pkgs)
+
+		entity = self.create_cdc_entity_decl(block)
+		self.vhdlGen.format_decls(entity.ports, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
+		self.vhdlGen.format_decls(entity.generics, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
+		self.vhdlGen.create_comp_instance(entity)
+		self.vhdlGen.commit_append_line(1)
+
+		architecture = LanDeclaration("rtl", entity.name)
+		architecture.intType = "architecture"
+		intSignals = {}
+		architecture.ports = intSignals
+		self.create_cdc_decls(block, intSignals)
+
+		self.vhdlGen.create_comp_instance(architecture)
+
+		self.vhdlGen.write_comment("Register block in bus clock domain", gap = 4)
+		self.create_cdc_block_instance(block, "bus_comp",
+			{block.name + "_out" : "open", block.name + "_in" : "bus_in"})
+
+		self.create_cdc_access_fifo(block)
+
+		ports = {"clk_sys" : "clk_core", "res_n" : "res_core_n",
+				 "r_data" : "open"}
+		for [name, bounds] in self.busSignals:
+			ports[name] = "core_" + name
+
+		self.vhdlGen.write_comment("Register block in core clock domain",
+			gap = 4)
+		self.create_cdc_block_instance(block, "core_comp", ports)
+
+		self.create_cdc_snapshot(block)
+
+		self.vhdlGen.commit_append_line(1)
+
+
+	def get_top_blocks(self):
+		"""
+		Get blocks of memory map which are instantiated within top level
+		entity of memory map.
+		"""
+		return [block for block in self.memMap.addressBlock
+				if (block.usage == "register" or block.usage == "memory")]
+
+
+	def get_top_cdc_blocks(self):
+		"""
+		Get blocks of top level entity which are instantiated as clock domain
+		crossing variant.
+		"""
+		return [block for block in self.get_top_blocks()
+				if self.is_cdc_block(block)]
+
+
+	def calc_block_read_latency(self, block):
+		"""
+		Calculate clock cycles from read on memory bus of a block to valid
+		read data of the block, REGISTERED_READ included.
+		"""
+		latency = 1 if (self.registered_read) else 0
+		if (block.usage == "register"):
+			latency += self.calc_read_latency(block)
+		return latency
+
+
+	def calc_max_block_read_latency(self):
+		"""
+		Calculate read latency of the slowest block. Read data of all blocks
+		are delayed to this latency before they are merged.
+		"""
+		return max([self.calc_block_read_latency(block)
+					for block in self.get_top_blocks()] + [0])
+
+
+	def calc_top_read_latency(self):
+		"""
+		Calculate clock cycles from read on memory bus of top level entity to
+		valid read data: decode stages, the slowest block and merge stages.
+		"""
+		return self.topDecodeStages + self.calc_max_block_read_latency() + \
+				self.topMergeStages
+
+
+	def calc_front_end_read_latency(self):
+		"""
+		Calculate read latency of bus front end (read latency of top level
+		entity).
+		"""
+		return self.calc_top_read_latency()
+
+
+	def calc_front_end_outstanding(self):
+		"""
+		Calculate number of outstanding reads of bus front end.
+		"""
+		if (self.maxOutstandingReads > 0):
+			return self.maxOutstandingReads
+		return self.calc_front_end_read_latency() + 2
+
+
+	def calc_mem_map_addr_width(self):
+		"""
+		Calculate width of byte address which covers all blocks of memory
+		map.
+		"""
+		high_addr = max([block.baseAddress + block.range
+						for block in self.get_top_blocks()] + [2])
+		return self.calc_addr_width_from_size(high_addr)
+
+
+	def get_top_name(self):
+		"""
+		Get name of top level entity of memory map.
+		"""
+		return self.memMap.name.lower() + "_top"
+
+
+	def get_top_bus_signal(self, name):
+		"""
+		Get name of bus signal (or block select) of top level entity after
+		decode stages.
+		"""
+		if (self.topDecodeStages == 0):
+			return name
+		return name + "_q" + str(self.topDecodeStages)
+
+
+	def calc_block_sel_bits(self, block):
+		"""
+		Calculate number of low address bits within a block when block is
+		naturally aligned (range is power of 2 and base address is multiple of
+		range). Such block is selected only by upper address bits. Returns
+		None for blocks which are not aligned.
+		"""
+		bits = self.calc_addr_width_from_size(max(block.range, 2))
+		if (block.range != 2 ** bits or block.baseAddress % block.range != 0 or
+			bits >= self.calc_mem_map_addr_width()):
+			return None
+		return bits
+
+
+	def calc_merge_tree(self, inputs):
+		"""
+		Calculate OR-tree of read data merge. Inputs are merged in groups of
+		"topMergeFanIn" per level. Merge stages are spread evenly over levels
+		of the tree, stages beyond number of levels delay output of the tree.
+		Returns:
+			[levels, delays] - levels is list of [registered, nodes] where each
+				node is [name, inputs]. delays is list of names of output delay
+				registers.
+		"""
+		fan_in = max(self.topMergeFanIn, 2)
+		level_cnt = 0
+		cnt = len(inputs)
+		while (True):
+			cnt = math.ceil(cnt / fan_in)
+			level_cnt += 1
+			if (cnt <= 1):
+				break
+
+		reg_cnt = min(self.topMergeStages, level_cnt)
+		reg_levels = [math.ceil((i + 1) * level_cnt / reg_cnt)
+						for i in range(reg_cnt)]
+
+		levels = []
+		for level in range(1, level_cnt + 1):
+			nodes = []
+			for i in range(0, len(inputs), fan_in):
+				nodes.append(["r_data_l{}_{}".format(level, int(i / fan_in)),
+								inputs[i:i + fan_in]])
+			levels.append([level in reg_levels, nodes])
+			inputs = [node[0] for node in nodes]
+
+		delays = ["r_data_m" + str(i + 1)
+					for i in range(self.topMergeStages - reg_cnt)]
+
+		return [levels, delays]
+
+
+	def create_top_entity_decl(self):
+		"""
+		Create declaration of top level entity of memory map: memory bus
+		ports, record ports of register blocks and isPresent parameters of
+		registers as generics. With clock domain crossing blocks, "full"
+		output indicates that accesses must be held.
+		"""
+		path = os.path.join(ROOT_PATH, self.template_sources["mem_bus_template_path"])
+		entity = self.vhdlGen.load_entity_template(path)
+		entity.name = self.get_top_name()
+		entity.intType = "entity"
+		entity.isInstance = False
+
+		del entity.generics["registered_read"]
+		del entity.generics["clear_read_data"]
+		entity.generics["data_width"].value = self.wrdWidthBit
+		entity.generics["address_width"].value = self.calc_mem_map_addr_width()
+
+		entity.ports["r_data"].direction = "out"
+		if (self.get_top_cdc_blocks()):
+			self.create_cdc_full_port(entity.ports)
+
+		for block in self.get_top_blocks():
+			if (block.usage == "register"):
+				self.create_reg_ports(block, entity.ports)
+				self.create_reg_cond_generics(block, entity)
+			if (self.is_cdc_block(block)):
+				self.create_cdc_clock_ports(block, entity.ports,
+											block.name.lower() + "_")
+
+		return entity
+
+
+	def create_top_decls(self, signDict):
+		"""
+		Create declarations of architecture of top level entity: read latency,
+		block select and bus signals of decode stages, bus signals of each
+		block and nodes of read data merge tree.
+		"""
+		decl = LanDeclaration("read_latency",
+								value = self.calc_top_read_latency())
+		decl.type = "natural"
+		decl.specifier = "constant"
+		signDict[decl.name] = decl
+
+		blocks = self.get_top_blocks()
+		signals = []
+		for stage in range(0, self.topDecodeStages + 1):
+			suffix = "" if (stage == 0) else "_q" + str(stage)
+			signals.append(["dec_sel" + suffix,
+							[str(max(len(blocks), 1) - 1), "0"]])
+			if (stage != 0):
+				signals.extend([[name + suffix, bounds]
+								for [name, bounds] in self.busSignals])
+
+		max_latency = self.calc_max_block_read_latency()
+		for block in blocks:
+			delay = max_latency - self.calc_block_read_latency(block)
+			prefix = block.name.lower() + "_"
+			signals.extend([[prefix + "cs", None],
+							[prefix + "address", ["ADDRESS_WIDTH - 1", "0"]],
+							[prefix + "be", ["DATA_WIDTH / 8 - 1", "0"]],
+							[prefix + "r_data", ["DATA_WIDTH - 1", "0"]]])
+			for i in range(1, delay + 1):
+				signals.append([prefix + "r_data_q" + str(i),
+								["DATA_WIDTH - 1", "0"]])
+			if (self.is_cdc_block(block)):
+				signals.append([prefix + "full", None])
+
+		[levels, delays] = self.calc_merge_tree(
+			[self.get_block_read_data(block) for block in blocks])
+		for [registered, nodes] in levels:
+			for [name, inputs] in nodes:
+				signals.append([name, ["DATA_WIDTH - 1", "0"]])
+		for name in delays:
+			signals.append([name, ["DATA_WIDTH - 1", "0"]])
+
+		for [name, bounds] in signals:
+			decl = LanDeclaration(name, value = None)
+			decl.type = "std_logic"
+			decl.specifier = "signal"
+			decl.bitWidth = 1
+			if (bounds != None):
+				[decl.upBound, decl.lowBound] = bounds
+			signDict[name] = decl
+
+
+	def create_block_select(self, index, block):
+		"""
+		Create one-hot select of a block from address of memory bus. Aligned
+		blocks are selected by upper address bits, other blocks by address
+		range.
+		"""
+		bits = self.calc_block_sel_bits(block)
+		line = "    dec_sel({}) <= '1' when (".format(index)
+
+		if (bits != None):
+			self.vhdlGen.wr_line(line + "unsigned(address(ADDRESS_WIDTH - 1 " \
+				"downto {})) = {}) else\n".format(bits,
+					int(block.baseAddress / block.range)))
+		else:
+			self.vhdlGen.wr_line(line + "unsigned(address) >= {} and\n".format(
+				block.baseAddress))
+			self.vhdlGen.wr_line(" " * len(line) + "unsigned(address) < {}) " \
+				"else\n".format(block.baseAddress + block.range))
+		self.vhdlGen.wr_line(" " * (len(line) - 10) + "'0';\n")
+
+
+	def create_top_decode(self):
+		"""
+		Create one-hot block select and its decode stages. Bus signals are
+		delayed together with block select.
+		"""
+		blocks = self.get_top_blocks()
+
+		self.vhdlGen.write_comment("One-hot block select", gap = 4)
+		if (not blocks):
+			self.vhdlGen.create_signal_connection("dec_sel(0)", "'0'", gap = 4)
+		for (i, block) in enumerate(blocks):
+			self.create_block_select(i, block)
+		self.vhdlGen.wr_line("\n")
+
+		src_suffix = ""
+		for stage in range(1, self.topDecodeStages + 1):
+			suffix = "_q" + str(stage)
+			names = [["dec_sel", True]] + [[name, bounds != None]
+							for [name, bounds] in self.busSignals]
+
+			self.vhdlGen.write_comment("Decode stage " + str(stage), gap = 4)
+			self.vhdlGen.wr_line("    decode{}_proc : process(res_n, clk_sys)\n".format(
+				suffix))
+			self.vhdlGen.wr_line("    begin\n")
+			self.vhdlGen.wr_line("        if (res_n = RESET_POLARITY) then\n")
+			for [name, is_vector] in names:
+				rst_val = "(OTHERS => '0')" if (is_vector) else "'0'"
+				self.vhdlGen.wr_line("            {} <= {};\n".format(
+					name + suffix, rst_val))
+			self.vhdlGen.wr_line("        elsif (rising_edge(clk_sys)) then\n")
+			for [name, is_vector] in names:
+				self.vhdlGen.wr_line("            {} <= {};\n".format(
+					name + suffix, name + src_suffix))
+			self.vhdlGen.wr_line("        end if;\n")
+			self.vhdlGen.wr_line("    end process;\n")
+			self.vhdlGen.wr_line("\n")
+			src_suffix = suffix
+
+
+	def create_block_decode(self, index, block):
+		"""
+		Create bus signals of a block from decoded bus. Chip select and byte
+		enables of block which is not selected are zero so that blocks which
+		are not read return zeroes. Address of a block is offset from its
+		base.
+		"""
+		prefix = block.name.lower() + "_"
+		sel = "{}({}) = '1'".format(self.get_top_bus_signal("dec_sel"), index)
+		address = self.get_top_bus_signal("address")
+
+		self.vhdlGen.write_comment(block.name + " bus signals", gap = 4)
+		self.vhdlGen.create_signal_connection(prefix + "cs",
+			"{} when ({}) else '0'".format(self.get_top_bus_signal("cs"), sel),
+			gap = 4)
+		self.vhdlGen.create_signal_connection(prefix + "be",
+			"{} when ({}) else (OTHERS => '0')".format(
+				self.get_top_bus_signal("be"), sel), gap = 4)
+
+		if (self.calc_block_sel_bits(block) != None):
+			self.vhdlGen.create_signal_connection(prefix + "address",
+				"std_logic_vector(unsigned({}) and to_unsigned({}, " \
+				"ADDRESS_WIDTH))".format(address, block.range - 1), gap = 4)
+		else:
+			self.vhdlGen.create_signal_connection(prefix + "address",
+				"std_logic_vector(unsigned({}) - {})".format(address,
+					block.baseAddress), gap = 4)
+
+
+	def create_block_instance(self, block):
+		"""
+		Create instance of register or memory block entity within top level
+		entity.
+		"""
+		prefix = block.name.lower() + "_"
+		path = os.path.join(ROOT_PATH, self.template_sources["mem_bus_template_path"])
+		inst = self.vhdlGen.load_entity_template(path)
+		inst.isInstance = True
+		inst.intType = "entity"
+
+		if (self.is_cdc_block(block)):
+			inst.name = "entity work." + self.get_cdc_name(block)
+			self.create_cdc_clock_ports(block, inst.ports)
+			self.create_cdc_full_port(inst.ports)
+			self.create_reg_ports(block, inst.ports)
+			self.create_reg_cond_generics(block, inst)
+		elif (block.usage == "register"):
+			inst.name = "entity work." + prefix + "reg_map"
+			self.create_reg_ports(block, inst.ports)
+			self.create_reg_cond_generics(block, inst)
+		else:
+			inst.name = "entity work." + prefix + "mem_map"
+		inst.value = prefix + "comp"
+
+		for (name, generic) in inst.generics.items():
+			generic.value = name.upper()
+		inst.generics["registered_read"].value = str(self.registered_read).lower()
+		inst.generics["clear_read_data"].value = "true"
+
+		for (name, port) in inst.ports.items():
+			port.value = name
+		for name in ["w_data", "read", "write"]:
+			inst.ports[name].value = self.get_top_bus_signal(name)
+		for name in ["address", "r_data", "cs", "be", "clk_core", "res_core_n",
+					 "full"]:
+			if (name in inst.ports):
+				inst.ports[name].value = prefix + name
+		for name in ["out", "in"]:
+			if ((block.name + "_" + name) in inst.ports):
+				inst.ports[block.name + "_" + name].value = prefix + name
+
+		self.vhdlGen.format_entity_decl(inst)
+		self.vhdlGen.create_comp_instance(inst)
+
+
+	def create_block_read_delay(self, block):
+		"""
+		Create delay of read data of a block to read latency of the slowest
+		block.
+		"""
+		prefix = block.name.lower() + "_"
+		delay = self.calc_max_block_read_latency() - \
+					self.calc_block_read_latency(block)
+		if (delay == 0):
+			return
+
+		self.vhdlGen.write_comment(block.name + " read data delay", gap = 4)
+		self.vhdlGen.wr_line("    {}r_data_proc : process(res_n, clk_sys)\n".format(
+			prefix))
+		self.vhdlGen.wr_line("    begin\n")
+		self.vhdlGen.wr_line("        if (res_n = RESET_POLARITY) then\n")
+		for i in range(1, delay + 1):
+			self.vhdlGen.wr_line("            {}r_data_q{} <= (OTHERS => " \
+				"'0');\n".format(prefix, i))
+		self.vhdlGen.wr_line("        elsif (rising_edge(clk_sys)) then\n")
+		src = prefix + "r_data"
+		for i in range(1, delay + 1):
+			self.vhdlGen.wr_line("            {}r_data_q{} <= {};\n".format(
+				prefix, i, src))
+			src = prefix + "r_data_q" + str(i)
+		self.vhdlGen.wr_line("        end if;\n")
+		self.vhdlGen.wr_line("    end process;\n")
+		self.vhdlGen.wr_line("\n")
+
+
+	def get_block_read_data(self, block):
+		"""
+		Get read data signal of a block delayed to read latency of the
+		slowest block.
+		"""
+		delay = self.calc_max_block_read_latency() - \
+					self.calc_block_read_latency(block)
+		if (delay == 0):
+			return block.name.lower() + "_r_data"
+		return block.name.lower() + "_r_data_q" + str(delay)
+
+
+	def write_merge_node(self, name, inputs, gap):
+		"""
+		Write OR of inputs of read data merge node.
+		"""
+		line = " " * gap + name + " <= "
+		self.vhdlGen.wr_line(line + (" or\n" + " " * len(line)).join(inputs) +
+								";\n")
+
+
+	def create_read_data_merge(self):
+		"""
+		Create OR-tree merge of read data of all blocks. Blocks which are not
+		read return zeroes, thus read data are merged by OR.
+		"""
+		self.vhdlGen.write_comment("Read data merge", gap = 4)
+		blocks = self.get_top_blocks()
+		if (not blocks):
+			self.vhdlGen.create_signal_connection("r_data", "(OTHERS => '0')",
+													gap = 4)
+			return
+
+		[levels, delays] = self.calc_merge_tree(
+			[self.get_block_read_data(block) for block in blocks])
+
+		for (i, [registered, nodes]) in enumerate(levels):
+			if (not registered):
+				for [name, inputs] in nodes:
+					self.write_merge_node(name, inputs, 4)
+				self.vhdlGen.wr_line("\n")
+				continue
+
+			self.vhdlGen.wr_line("    r_data_l{}_proc : process(res_n, " \
+				"clk_sys)\n".format(i + 1))
+			self.vhdlGen.wr_line("    begin\n")
+			self.vhdlGen.wr_line("        if (res_n = RESET_POLARITY) then\n")
+			for [name, inputs] in nodes:
+				self.vhdlGen.wr_line("            {} <= (OTHERS => '0');\n".format(
+					name))
+			self.vhdlGen.wr_line("        elsif (rising_edge(clk_sys)) then\n")
+			for [name, inputs] in nodes:
+				self.write_merge_node(name, inputs, 12)
+			self.vhdlGen.wr_line("        end if;\n")
+			self.vhdlGen.wr_line("    end process;\n")
+			self.vhdlGen.wr_line("\n")
+
+		src = levels[-1][1][0][0]
+		if (delays):
+			self.vhdlGen.wr_line("    r_data_m_proc : process(res_n, clk_sys)\n")
+			self.vhdlGen.wr_line("    begin\n")
+			self.vhdlGen.wr_line("        if (res_n = RESET_POLARITY) then\n")
+			for name in delays:
+				self.vhdlGen.wr_line("            {} <= (OTHERS => '0');\n".format(
+					name))
+			self.vhdlGen.wr_line("        elsif (rising_edge(clk_sys)) then\n")
+			for name in delays:
+				self.vhdlGen.wr_line("            {} <= {};\n".format(name, src))
+				src = name
+			self.vhdlGen.wr_line("        end if;\n")
+			self.vhdlGen.wr_line("    end process;\n")
+			self.vhdlGen.wr_line("\n")
+
+		self.vhdlGen.create_signal_connection("r_data", src, gap = 4)
+		self.vhdlGen.wr_line("\n")
+
+
+	def create_top_full(self):
+		"""
+		Create "full" of top level entity: any clock domain crossing block
+		can't take further accesses.
+		"""
+		blocks = self.get_top_cdc_blocks()
+		if (not blocks):
+			return
+
+		self.vhdlGen.write_comment("Accesses held by clock domain crossing " \
+			"blocks", gap = 4)
+		self.write_merge_node("full", [block.name.lower() + "_full"
+							for block in blocks], 4)
+		self.vhdlGen.wr_line("\n")
+
+
+	def write_mem_map_top(self):
+		"""
+		Create top level entity of memory map. Memory bus is decoded to all
+		register and memory blocks of the memory map by one-hot block select
+		with "topDecodeStages" register stages. Read data of blocks are merged
+		by OR-tree with "topMergeStages" register stages. "full" of clock
+		domain crossing blocks are merged to "full" output.
+		"""
+		self.vhdlGen.wr_nl()
+
+		self.vhdlGen.write_comment("Top level of: " + self.memMap.name, gap = 0)
+		self.vhdlGen.write_gen_note()
+		self.vhdlGen.wr_nl()
+
+		self.vhdlGen.create_includes("ieee", ["std_logic_1164.all",
+												"numeric_std.all"])
+		self.vhdlGen.wr_nl()
+
+		wrk_pkgs = [self.memMap.name.lower() + "_pkg.all", "cmn_reg_map_pkg.all"]
+		self.vhdlGen.create_includes("work", wrk_pkgs)
+
+		entity = self.create_top_entity_decl()
+		self.vhdlGen.format_decls(entity.ports, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
+		self.vhdlGen.format_decls(entity.generics, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
+		self.vhdlGen.create_comp_instance(entity)
+		self.vhdlGen.commit_append_line(1)
+
+		architecture = LanDeclaration("rtl", entity.name)
+		architecture.intType = "architecture"
+		intSignals = {}
+		architecture.ports = intSignals
+		self.create_top_decls(intSignals)
+
+		self.vhdlGen.create_comp_instance(architecture)
+
+		self.create_top_decode()
+
+		for (i, block) in enumerate(self.get_top_blocks()):
+			self.create_block_decode(i, block)
+			self.create_block_instance(block)
+			self.create_block_read_delay(block)
+
+		self.create_read_data_merge()
+		self.create_top_full()
+
+		self.vhdlGen.commit_append_line(1)
+
+
+	def get_front_end_name(self):
+		"""
+		Get name of bus front end entity of memory map.
+		"""
+		return (self.memMap.name + "_" + self.busFrontEnd).lower()
+
+
+	def load_front_end_template(self):
+		"""
+		Load entity template of bus front end.
+		"""
+		template = self.frontEndTemplates[self.busFrontEnd]
+		path = os.path.join(ROOT_PATH, self.template_sources[template])
+		return self.vhdlGen.load_entity_template(path)
+
+
+	def is_mem_bus_port(self, name):
+		"""
+		Check if port of bus front end template belongs to memory bus.
+		"""
+		if (name == "r_data" or name == "full"):
+			return True
+		for [bus_name, bounds] in self.busSignals:
+			if (name == bus_name):
+				return True
+		return False
+
+
+	def create_front_end_entity(self, slave):
+		"""
+		Create entity declaration of bus front end. Bus ports and generics
+		are taken from bus slave template, generics have defaults given by
+		memory map. Register blocks have their record ports, isPresent
+		parameters of registers are generics.
+		"""
+		entity = LanDeclaration(self.get_front_end_name(), value = None)
+		entity.intType = "entity"
+		entity.isInstance = False
+		entity.generics = {}
+		entity.ports = {}
+
+		defaults = {"data_width" : self.wrdWidthBit,
+					"address_width" : self.calc_mem_map_addr_width(),
+					"id_width" : self.axiIdWidth,
+					"fifo_depth" : self.calc_front_end_outstanding(),
+					"max_outstanding" : self.calc_front_end_outstanding()}
+
+		for (name, generic) in slave.generics.items():
+			if (name == "read_latency"):
+				continue
+			entity.generics[name] = generic.copy()
+			if (name in defaults):
+				entity.generics[name].value = defaults[name]
+
+		for (name, port) in slave.ports.items():
+			if (not self.is_mem_bus_port(name)):
+				entity.ports[name] = port.copy()
+
+		for block in self.get_top_blocks():
+			if (block.usage == "register"):
+				self.create_reg_ports(block, entity.ports)
+				self.create_reg_cond_generics(block, entity)
+			if (self.is_cdc_block(block)):
+				self.create_cdc_clock_ports(block, entity.ports,
+											block.name.lower() + "_")
+
+		self.vhdlGen.format_decls(entity.ports, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
+		self.vhdlGen.format_decls(entity.generics, gap=2, alignLeft=True,
+					alignRight=False, alignLen=30, wrap=False)
+
+		self.vhdlGen.create_comp_instance(entity)
+		self.vhdlGen.commit_append_line(1)
+
+		return entity
+
+
+	def create_front_end_decls(self, signDict):
+		"""
+		Create declarations of architecture of bus front end: read latency
+		and memory bus between bus slave and top level entity.
+		"""
+		decl = LanDeclaration("read_latency",
+								value = self.calc_front_end_read_latency())
+		decl.type = "natural"
+		decl.specifier = "constant"
+		signDict[decl.name] = decl
+
+		signals = self.busSignals + [["r_data", ["DATA_WIDTH - 1", "0"]],
+									 ["full", None]]
+		for [name, bounds] in signals:
+			decl = LanDeclaration(name, value = None)
+			decl.type = "std_logic"
+			decl.specifier = "signal"
+			decl.bitWidth = 1
+			if (bounds != None):
+				[decl.upBound, decl.lowBound] = bounds
+			signDict[name] = decl
+
+
+	def create_front_end_slave(self, slave):
+		"""
+		Create instance of bus slave of bus front end. All ports are
+		connected to signals of the same name.
+		"""
+		slave.isInstance = True
+		slave.intType = "entity"
+		slave.value = slave.name + "_comp"
+
+		for (name, generic) in slave.generics.items():
+			generic.value = name.upper()
+
+		for (name, port) in slave.ports.items():
+			port.value = name
+
+		self.vhdlGen.write_comment("Bus slave", gap = 4)
+		self.vhdlGen.format_entity_decl(slave)
+		self.vhdlGen.create_comp_instance(slave)
+
+
+	def create_top_instance(self):
+		"""
+		Create instance of top level entity of memory map within bus front
+		end. All ports are connected to signals of the same name.
+		"""
+		inst = self.create_top_entity_decl()
+		inst.name = "entity work." + inst.name
+		inst.value = "top_comp"
+		inst.isInstance = True
+
+		for (name, generic) in inst.generics.items():
+			generic.value = name.upper()
+
+		for (name, port) in inst.ports.items():
+			port.value = name.lower()
+
+		self.vhdlGen.write_comment("Top level of memory map", gap = 4)
+		self.vhdlGen.format_entity_decl(inst)
+		self.vhdlGen.create_comp_instance(inst)
+
+
+	def write_mem_map_front_end(self):
+		"""
+		Create bus front end of memory map. Bus slave drives memory bus of
+		top level entity of the memory map.
+		"""
+		self.vhdlGen.wr_nl()
+
+		self.vhdlGen.write_comment("Bus front end (" + self.busFrontEnd +
+				") of: " + self.memMap.name, gap = 0)
+		self.vhdlGen.write_gen_note()
+		self.vhdlGen.wr_nl()
+
+		self.vhdlGen.create_includes("ieee", ["std_logic_1164.all",
+												"numeric_std.all"])
+		self.vhdlGen.wr_nl()
+
+		wrk_pkgs = [self.memMap.name.lower() + "_pkg.all", "cmn_reg_map_pkg.all"]
+		self.vhdlGen.create_includes("work", wrk_pkgs)
+
+		slave = self.load_front_end_template()
+		entity = self.create_front_end_entity(slave)
+
+		architecture = LanDeclaration("rtl", entity.name)
+		architecture.intType = "architecture"
+		intSignals = {}
+		architecture.ports = intSignals
+		self.create_front_end_decls(intSignals)
+
+		self.vhdlGen.create_comp_instance(architecture)
+
+		self.create_front_end_slave(slave)
+		self.create_top_instance()
+
+		# Without clock domain crossing blocks, accesses are never held
+		if (not self.get_top_cdc_blocks()):
+			self.vhdlGen.create_signal_connection("full", "'0'", gap = 4)
+			self.vhdlGen.wr_line("\n")
+
+		self.vhdlGen.commit_append_line(1)
+
+
+	def get_reg_array_type(self, block, reg):
+		"""
+		Get name of VHDL array type of register array.
+		"""
+		return block.name + "_" + reg.name + "_arr_t"
+
+
+	def create_reg_record_decl(self, block, reg, suffix="", bitWidth=None):
+		"""
+		Create declaration of register item within input / output record.
+		Register value is declared when "bitWidth" is not given. Register
+		arrays are declared as array type (value) or vector with bit for
+		each element (access signalling).
+		"""
+		decl = LanDeclaration(reg.name + suffix, value="")
+		decl.specifier = ""
+		dim = get_reg_array_dim(reg)
+
+		if (bitWidth == None and dim > 0):
+			decl.type = self.get_reg_array_type(block, reg)
+			decl.bitWidth = 0
+		elif (dim > 0):
+			decl.type = "std_logic_vector"
+			decl.bitWidth = dim
+			decl.upBound = str(dim - 1)
+			decl.lowBound = "0"
+		else:
+			decl.type = "std_logic" if (bitWidth == 1) else "std_logic_vector"
+			decl.bitWidth = reg.size if (bitWidth == None) else bitWidth
+
+		return decl
+
+
+	def create_reg_array_types(self, block):
+		"""
+		Create VHDL array types of register arrays present in input or output
+		record of a block. Returns True if any array type was created.
+		"""
+		created = False
+		for reg in self.get_sorted_regs(block):
+			if (get_reg_array_index(reg) != 0):
+				continue
+
+			if (self.reg_has_access_type(reg, ["write"]) or
+				self.reg_has_access_type(reg, ["read"])):
+				self.vhdlGen.create_array_type(
+					self.get_reg_array_type(block, reg),
+					get_reg_array_dim(reg), reg.size, gap = 2)
+				created = True
+
+		return created
+
+
+	def create_output_reg_record(self, block):
+		"""
+		Create VHDL record for writable registers from IP-XACT memory block object.
+		If register write should be indicated, additional <reg_name>_write signal
+		is added.
+		If register read should be indicated, additional <reg_name>_read signal is
+		added.
+		"""
+		outDecls = []
+		outName = block.name + "_out_t"
+
+		# Create the declarations, register array is declared only once
+		for i,reg in enumerate(self.get_sorted_regs(block)):
+
+			if (is_reg_array_tail(reg)):
+				continue
+
+			if (self.reg_has_access_type(reg, ["write"])):
+				outDecls.append(self.create_reg_record_decl(block, reg))
 
 			if (self.is_reg_write_indicate(reg)):
-				outDecls.append(LanDeclaration(reg.name + "_update", value=""))
-				outDecls[-1].type = "std_logic"
-				outDecls[-1].bitWidth = 1
-				outDecls[-1].specifier = ""
+				outDecls.append(self.create_reg_record_decl(block, reg,
+															"_update", 1))
 
 			if (self.is_reg_read_indicate(reg)):
-				outDecls.append(LanDeclaration(reg.name + "_read", value=""))
-				outDecls[-1].type = "std_logic"
-				outDecls[-1].bitWidth = 1
-				outDecls[-1].specifier = ""
+				outDecls.append(self.create_reg_record_decl(block, reg,
+															"_read", 1))
 
 		# Format the declaration
 		self.vhdlGen.format_decls(outDecls, gap=2, alignLeft=True,
@@ -967,15 +3298,16 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		inDecls = []
 		inName = block.name + "_in_t"
 
-		for i,reg in enumerate(sorted(block.register, key=lambda a: a.addressOffset)):
+		for i,reg in enumerate(self.get_sorted_regs(block)):
+
+			if (is_reg_array_tail(reg)):
+				continue
 
 			# All registers with read, but not read-write, since read-write is register
 			# whose value is written and the same value is read back
-			if (("read" in reg.access) and (reg.access != "read-write")):
-				inDecls.append(LanDeclaration(reg.name, value=""))
-				inDecls[-1].type = "std_logic_vector"
-				inDecls[-1].bitWidth = reg.size
-				inDecls[-1].specifier = ""
+			if (self.reg_has_access_type(reg, ["read"]) and
+				not self.reg_is_access_type(reg, ["read-write"])):
+				inDecls.append(self.create_reg_record_decl(block, reg))
 
 		# Format the declaration
 		self.vhdlGen.format_decls(inDecls, gap=2, alignLeft=True,
@@ -984,6 +3316,33 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		self.vhdlGen.create_structure(inName, inDecls, gap = 2)
 
 
+	def create_latency_decls(self, block):
+		"""
+		Create constants with read and write latency of a block, so that bus
+		adapters can account for pipeline stages of the register block.
+		"""
+		decl = LanDeclaration(block.name + "_read_latency",
+								value=self.calc_read_latency(block))
+		decl.type = "natural"
+		decl.specifier = "constant"
+		decl.gap = 0
+		decl.alignLeft = True
+		decl.alignRight = False
+		decl.alignLen = 30
+		decl.wrap = False
+
+		self.vhdlGen.write_comment("Read latency of " + block.name +
+			" (added to REGISTERED_READ)", gap = 2, small=True)
+		self.vhdlGen.write_decl(decl)
+
+		decl = decl.copy()
+		decl.name = block.name + "_write_latency"
+		decl.value = self.calc_write_latency(block)
+		self.vhdlGen.write_comment("Write latency of " + block.name,
+			gap = 2, small=True)
+		self.vhdlGen.write_decl(decl)
+
+
 	def create_mem_block_records(self, block):
 		"""
 		Create VHDL records for register module input/outputs. Each writable
@@ -992,6 +3351,9 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		"""
 		self.vhdlGen.wr_nl()
 
+		if (self.create_reg_array_types(block)):
+			self.vhdlGen.wr_nl()
+
 		self.create_output_reg_record(block)
 
 		self.vhdlGen.wr_nl()
@@ -1000,6 +3362,94 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		self.create_input_reg_record(block)
 
 		self.vhdlGen.wr_nl()
+		self.vhdlGen.wr_nl()
+
+		self.create_latency_decls(block)
+
+		self.vhdlGen.wr_nl()
+
+
+	def create_block_report(self, block):
+		"""
+		Create generation report of a register block. Returns list of lines.
+		"""
+		dec_type = self.get_addr_dec_type(block)
+		lines = []
+		lines.append("Block {}:\n".format(block.name))
+		lines.append("    Words used / decoded   : {} / {} ({:.0f} %)\n".format(
+			self.calc_blk_wrd_count(block),
+			2 ** self.calc_wrd_address_width(block),
+			self.calc_blk_occupancy(block) * 100))
+		lines.append("    Address decoder        : {}\n".format(dec_type))
+		lines.append("    Address decoder LUTs   : ~{} (compare ~{}, dense ~{})\n".format(
+			self.calc_addr_dec_luts(block, dec_type),
+			self.calc_addr_dec_luts(block, "compare"),
+			self.calc_addr_dec_luts(block, "dense")))
+		lines.append("    Pipeline stages        : {}\n".format(
+			", ".join(self.pipeline) if self.pipeline else "none"))
+		lines.append("    Read latency           : {} (+1 with REGISTERED_READ)\n".format(
+			self.calc_read_latency(block)))
+		lines.append("    Write latency          : {}\n".format(
+			self.calc_write_latency(block)))
+
+		if (self.is_cdc_block(block)):
+			lines.append("    Clock domain crossing  : write {} clk_sys + {} " \
+				"clk_core, read snapshot age up to {} clk_sys + {} " \
+				"clk_core\n".format(*(self.calc_cdc_write_latency(block) +
+										self.calc_cdc_snapshot_age(block))))
+
+		if (self.regFileType == "table"):
+			shapes = self.get_reg_table_shapes(block)
+			lines.append("    Register file (table)  : {} registers in {} " \
+				"loops\n".format(sum([len(regs) for [w, regs] in shapes]),
+								len(shapes)))
+
+		for alias in self.get_block_reg_aliases(block):
+			lines.append("    Register alias         : {} {} at {}\n".format(
+				alias.reg.name.upper(), alias.kind.upper(),
+				hex(alias.addressOffset)))
+
+		for group in self.get_block_shadow_groups(block):
+			lines.append("    Shadow group           : {} ({} committed by " \
+				"{}, +1 write latency)\n".format(group.name.upper(),
+					", ".join([reg.name.upper() for reg in group.regs]),
+					group.commitReg.name.upper()))
+		return lines
+
+
+	def create_reg_map_report(self):
+		"""
+		Create generation report of register map. Contains implementation
+		choices and estimated resources of each register block. Returns list
+		of lines.
+		"""
+		lines = ["Register map generation report: {}\n".format(self.memMap.name),
+				 "LUT counts are rough estimates for {}-input LUTs.\n".format(
+					self.lutInputs)]
+
+		if (self.writeTop or self.busFrontEnd != "none"):
+			lines.append("Top level: {} decode stages, {} merge stages " \
+				"(read latency {})\n".format(self.topDecodeStages,
+					self.topMergeStages, self.calc_top_read_latency()))
+
+		if (self.busFrontEnd != "none"):
+			lines.append("Bus front end: {} (read latency {}, outstanding " \
+				"reads {})\n".format(self.busFrontEnd,
+					self.calc_front_end_read_latency(),
+					self.calc_front_end_outstanding()))
+
+		for block in self.memMap.addressBlock:
+			if (block.usage == "register"):
+				lines.append("\n")
+				lines.extend(self.create_block_report(block))
+
+			elif (block.usage == "memory"):
+				lines.append("\n")
+				lines.append("Block {}:\n".format(block.name))
+				lines.append("    Memory (RAM) words     : {}\n".format(
+					2 ** self.calc_wrd_address_width(block)))
+
+		return lines
 
 
 	def write_reg_map_pkg(self):
@@ -30,9 +30,12 @@
 ##
 ##	Revision history:
 ##		25.01.2018	First implementation
+##		16.10.2026	Copy of declaration with its ports and generics
 ##
 ################################################################################
 
+import copy
+
 from abc import ABCMeta, abstractmethod
 
 class LanDeclaration(metaclass=ABCMeta):
@@ -123,4 +126,15 @@ class LanDeclaration(metaclass=ABCMeta):
 			self.bitIndex = bitIndex
 		if (intType != None):
 			self.intType = intType
-	
+
+
+	def copy(self):
+		"""
+		Create copy of the declaration. Ports and generics are copied too, so
+		the copy can be modified without affecting the original declaration.
+		"""
+		decl = copy.copy(self)
+		decl.ports = {name : port.copy() for (name, port) in self.ports.items()}
+		decl.generics = {name : generic.copy() for (name, generic)
+							in self.generics.items()}
+		return decl
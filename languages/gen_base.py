@@ -31,37 +31,63 @@
 ##
 ##	Revision history:
 ##		25.01.2018	First implementation
+##		16.10.2026	Append stack with O(1) push / pop. Output passed to
+##					pluggable sink.
 ##
 ################################################################################
 
 from abc import ABCMeta, abstractmethod
 
+from pyXact_generator.languages.output_sink import *
+
 class BaseGenerator(metaclass=ABCMeta):
 	
-	# Generator output
-	out = None
+	# Generator output sink (MemorySink, FileSink or ChunkedSink)
+	sink = None
 	
 	# Comment sign for particular language generator
 	commentSign = None
 	
 	# Simple stack implementation for adding language constructs which require
 	# ending parts such as structures, entities, HTML tags ...
-	# Reffered to as append_stack
+	# Reffered to as append_stack. Top of the stack is the last item.
 	appendText = None
 	
 	def __init__(self):
-		self.out = []
+		self.sink = MemorySink()
 		self.appendText = []
 		self.commentSign = "#"
 	
 	
+	def set_sink(self, sink):
+		"""
+		Set output sink of the generator. Lines which were not written to the
+		output yet are passed to the new sink.
+		Arguments:
+			sink		 Output sink
+		"""
+		pending = self.sink.take_pending()
+		self.sink = sink
+		for line in pending:
+			self.sink.write(line)
+
+
+	def flush_output(self, of=None):
+		"""
+		Write all pending generator output into the output file.
+		Arguments:
+			of			 Output file (used by memory sink)
+		"""
+		self.sink.flush(of)
+
+
 	def wr_line(self, line):
 		"""
 		Write single line to the generator output.
 		Arguments:
 			line		 Line to write into the output source code
 		"""
-		self.out.append(line)
+		self.sink.write(line)
 
 
 	def append_line(self, line):
@@ -70,7 +96,7 @@ class BaseGenerator(metaclass=ABCMeta):
 		Arguments:
 			line		 Line to write into the output source code
 		"""
-		self.appendText.insert(0, line)
+		self.appendText.append(line)
 	
 	
 	def wr_nl(self):
@@ -88,8 +114,7 @@ class BaseGenerator(metaclass=ABCMeta):
 			count		 Number of items to pop
 		"""
 		for i in range(0, min(count, len(self.appendText))):
-			self.wr_line(self.appendText[0])
-			self.appendText.pop(0)
+			self.wr_line(self.appendText.pop())
 	
 	
 	def commit_append_lines_all(self):
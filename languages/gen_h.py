@@ -31,6 +31,8 @@
 ##	
 ##	Revision history:
 ##		25.01.2018	First Implementation
+##		16.10.2026	Defines and static assertions
+##		16.10.2026	Fixed includes
 ##
 ################################################################################
 
@@ -325,6 +327,31 @@ class HeaderGenerator(LanBaseGenerator):
 		self.append_line("#endif\n")
 	
 	
+	def create_define(self, name, value, alignLen=48):
+		""" 
+		Create C preprocessor define with value aligned to given column:
+			#define name value
+		Arguments:
+			name		Define name
+			value		Define value (string)
+			alignLen	Column where value starts
+		"""
+		self.__wr_line("{:<{}} {}\n".format("#define " + name, alignLen - 1,
+							value))
+
+
+	def create_static_assert(self, condition, message):
+		""" 
+		Create compile-time assertion (C11):
+			_Static_assert(condition, "message");
+		Arguments:
+			condition	Constant expression which must be true
+			message		Message reported when condition is false
+		"""
+		self.__wr_line("_Static_assert({},\n".format(condition))
+		self.__wr_line("\t\"{}\");\n".format(message))
+
+
 	def create_includes(self, includeList):
 		""" 
 		Create C header includes.
@@ -332,7 +359,7 @@ class HeaderGenerator(LanBaseGenerator):
 			includeList		List of C includes
 		"""
 		for include in includeList:
-			self.__wr_line("#include {}\n")
+			self.__wr_line("#include {}\n".format(include))
 			
 			
 
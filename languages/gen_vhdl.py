@@ -30,6 +30,10 @@
 ##	
 ##	Revision history:
 ##		16.01.2018	Implemented the script
+##		16.10.2026	Cache of parsed entity templates, precompiled patterns
+##		16.10.2026	Formatting of integer masks to bit strings
+##		16.10.2026	Fixed with/select statement
+##		16.10.2026	Array types, fixed for generate statement
 ##
 ################################################################################
 
@@ -47,6 +51,23 @@ from pyXact_generator.languages.gen_lan_base import LanBaseGenerator
 
 from pyXact_generator.languages.declaration import LanDeclaration
 
+# Words and numbers within VHDL line
+word_re = re.compile(r"[\w]+")
+
+# Range of std_logic_vector (only downto is supported)
+stdv_range_re = re.compile(r"\([ ]*.+ downto .*[ ]*\)")
+
+# Entity name parser
+entity_re = re.compile(r"^[ ]*entity[ ]*[\w]+[ ]*is$")
+
+# Architecture parser
+architecture_re = re.compile(
+					r"^[ ]*architecture[ ]+[\w]+[ ]+of[ ]+[\w]+[ ]+is[ ]*$")
+
+# Process-wide cache of parsed entity templates:
+#	absolute path -> [modification time, entity declaration]
+entity_template_cache = {}
+
 class VhdlGenerator(LanBaseGenerator):
 	
 	
@@ -168,6 +189,14 @@ class VhdlGenerator(LanBaseGenerator):
 		return strVal
 
 
+	def format_bit_string(self, value, bitWidth):
+		"""
+		Format integer value as VHDL bit string literal of given width, e.g.
+		"00101100". Bit 0 of the value is the rightmost character.
+		"""
+		return '"' + '{:0{}b}'.format(value, bitWidth)[-bitWidth:] + '"'
+
+
 	def format_str_std_log_decl_val(self, decl):
 		"""
 		Format value of std_logic or std_logic_vector declaration given as
@@ -393,6 +422,19 @@ class VhdlGenerator(LanBaseGenerator):
 		return True
 
 
+	def create_array_type(self, name, length, bitWidth, gap=0):
+		"""
+		Create VHDL array type of std_logic_vectors.
+		Arguments:
+			name		Name of the array type
+			length		Number of array elements
+			bitWidth	Width of single element
+		"""
+		self.__wr_line(" " * gap + "type {} is array (0 to {}) of " \
+			"std_logic_vector({} downto 0);\n".format(name, length - 1,
+														bitWidth - 1))
+
+
 	def create_enum(self, name, decls):
 		""" 
 		Create VHDL enum.
@@ -550,23 +592,28 @@ class VhdlGenerator(LanBaseGenerator):
 		"""
 		Create "with/select" VHDL statement
 		Arguments:
-			TODO
+			result		Signal driven by the statement
+			selector	Selector expression
+			values		List of values assigned to the result
+			conditions	List of selector choices for each value
+			gap			Indent of the statement
 		"""
-		line = " " * gap + "with " + selector + " select " + result + " <=\n"
-		self.__wr_line(initLine)
-
 		if (not(len(values) == len(conditions))):
 			print("values and conditions must have equal lengths")
 			return;
 
-		for (value, condition) in (values, conditions):
+		self.__wr_line(" " * gap + "with " + selector + " select " + result +
+						" <=\n")
+
+		for (i, (value, condition)) in enumerate(zip(values, conditions)):
 			line = " " * (gap + 4) + value + " when " + condition
 
 			# Append "," for all but last line where ";" is used
-			if (value == values[-1]):
-				line.append(";\n")
+			if (i == len(values) - 1):
+				line += ";\n"
 			else:
-				line.append(",\n")
+				line += ",\n"
+			self.__wr_line(line)
 
 		self.__wr_line("\n")
 
@@ -595,7 +642,7 @@ class VhdlGenerator(LanBaseGenerator):
 			print("'For generate' statement should have exactly two indices")
 
 		line = " " * gap + name + " : for " + var + " in " + indices[0]
-		line.append(" to " + indices[1] + " generate\n")
+		line += " to " + indices[1] + " generate\n"
 		self.__wr_line(line)
 		self.append_line(" " * gap + "end generate " + name + ";\n")
 
@@ -638,8 +685,7 @@ class VhdlGenerator(LanBaseGenerator):
 		#decl.doIndent = True
 
 		# Find all separated words and numbers
-		cmn_re = re.compile("[\w]+")
-		wrds = cmn_re.findall(line)
+		wrds = word_re.findall(line)
 
 		# Allow only signal and constant prefixes
 		if (len(wrds) > 2 and 
@@ -672,8 +718,7 @@ class VhdlGenerator(LanBaseGenerator):
 		#print(decl.type)
 		#print("\n")
 		if (decl.type == "std_logic_vector"):
-			stdv_re = re.compile("\([ ]*.+ downto .*[ ]*\)")
-			rng_spec = stdv_re.findall(line)
+			rng_spec = stdv_range_re.findall(line)
 			
 			# Skip vectors without range (e.g. generics)
 			if (len(rng_spec) == 0):
@@ -695,46 +740,34 @@ class VhdlGenerator(LanBaseGenerator):
 		return decl
 
 
-	def load_entity_template(self, path):
+	def parse_entity_template(self, path):
 		"""
-		Load entity template from VHDL file. Recognizes: entity name,
+		Parse entity template from VHDL file. Recognizes: entity name,
 		Entity ports, generics. Note that on each generic "constant"
 		must be explicitly specified. On each port "signal" must be
 		explicitly specified. Direction must be specified on each signal!
-        Parsing stops upon "architecture" definition start.
-		Return declaration object of parsed entity. 
-		Arguments:
-			TODO
+		Parsing stops upon "architecture" definition start.
+		Return declaration object of parsed entity.
 		"""
-		if (not(path.endswith(".vhd"))):
-			print("Only VHDL files are supported for parsing!")
-			return
-
 		fd = open(path)
 
-		# Entity name parser
-		ent_re = re.compile("^[ ]*entity[ ]*[\w]+[ ]*is$")
-		
-		# Architecture parser
-		# Upon start of architecture parsing is finished, otherwise internal
-		# signals would be parsed too!
-		architecture_re = re.compile("^[ ]*architecture[ ]+[\w]+[ ]+of[ ]+[\w]+[ ]+is[ ]*$")
- 	
 		entity = LanDeclaration("name", value="")
 		entity.intType = "entity"
 
 		for line in fd:
 			line = line.lower()
 
-			# Finish when architecture starts
+			# Finish when architecture starts. Upon start of architecture
+			# parsing is finished, otherwise internal signals would be
+			# parsed too!
 			arch_res = architecture_re.match(line)
 			if (arch_res):
 				break
 
 			# Get name of entity
-			ent_res = ent_re.match(line)
+			ent_res = entity_re.match(line)
 			if (ent_res):
-				mtch = re.compile("[\w]+").findall(line)
+				mtch = word_re.findall(line)
 				entity.name = mtch[1]
 			
 			# Parse ports or generics
@@ -751,3 +784,27 @@ class VhdlGenerator(LanBaseGenerator):
 		fd.close()
 		return entity
 
+
+	def load_entity_template(self, path):
+		"""
+		Load entity template from VHDL file (see parse_entity_template).
+		Each template is parsed only once per process and kept in a cache
+		until the file is modified. Copy of cached entity is returned, so
+		that caller can connect its ports and generics.
+		Arguments:
+			path	Path to VHDL file with entity template
+		"""
+		if (not(path.endswith(".vhd"))):
+			print("Only VHDL files are supported for parsing!")
+			return
+
+		abs_path = os.path.abspath(path)
+		mtime = os.path.getmtime(abs_path)
+
+		cached = entity_template_cache.get(abs_path)
+		if (cached == None or cached[0] != mtime):
+			cached = [mtime, self.parse_entity_template(abs_path)]
+			entity_template_cache[abs_path] = cached
+
+		return cached[1].copy()
+
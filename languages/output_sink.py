@@ -0,0 +1,163 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Output sinks of generators. Sink receives lines written by generator
+##   and passes them to output file. Following sinks are available:
+##		MemorySink		- Keeps whole output in memory, writes it to the
+##						  file at once upon flush.
+##		FileSink		- Passes each line directly to (buffered) file.
+##		ChunkedSink		- Collects lines till chunk of given size is
+##						  filled, then writes the chunk to the file.
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+# Default size of chunk of ChunkedSink (in characters)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class MemorySink():
+
+	# Lines written to the sink
+	lines = None
+
+	def __init__(self):
+		self.lines = []
+
+
+	def write(self, line):
+		"""
+		Write single line to the sink.
+		"""
+		self.lines.append(line)
+
+
+	def take_pending(self):
+		"""
+		Take lines which were not written to the output file yet.
+		"""
+		lines = self.lines
+		self.lines = []
+		return lines
+
+
+	def flush(self, of=None):
+		"""
+		Write whole content of the sink to output file and clear the sink.
+		"""
+		if (of != None and self.lines):
+			of.write("".join(self.lines))
+		self.lines = []
+
+
+class FileSink():
+
+	# Output file
+	of = None
+
+	def __init__(self, of):
+		self.of = of
+
+
+	def write(self, line):
+		"""
+		Write single line to the output file. Buffering is left on the file.
+		"""
+		self.of.write(line)
+
+
+	def take_pending(self):
+		return []
+
+
+	def flush(self, of=None):
+		pass
+
+
+class ChunkedSink():
+
+	# Output file
+	of = None
+
+	# Size of chunk (in characters) after which chunk is written
+	chunkSize = DEFAULT_CHUNK_SIZE
+
+	# Lines of actual chunk and their size
+	lines = None
+	size = 0
+
+	def __init__(self, of, chunkSize=DEFAULT_CHUNK_SIZE):
+		self.of = of
+		self.chunkSize = chunkSize
+		self.lines = []
+		self.size = 0
+
+
+	def write(self, line):
+		"""
+		Write single line to actual chunk. Full chunk is written to the
+		output file.
+		"""
+		self.lines.append(line)
+		self.size += len(line)
+		if (self.size >= self.chunkSize):
+			self.flush()
+
+
+	def take_pending(self):
+		lines = self.lines
+		self.lines = []
+		self.size = 0
+		return lines
+
+
+	def flush(self, of=None):
+		"""
+		Write actual chunk to the output file.
+		"""
+		if (self.lines):
+			self.of.write("".join(self.lines))
+		self.lines = []
+		self.size = 0
+
+
+def create_output_sink(sinkType, of, chunkSize=DEFAULT_CHUNK_SIZE):
+	"""
+	Create output sink of given type: "memory", "file" or "chunked".
+	"""
+	if (sinkType == "file"):
+		return FileSink(of)
+	elif (sinkType == "chunked"):
+		return ChunkedSink(of, chunkSize)
+	elif (sinkType == "memory"):
+		return MemorySink()
+
+	print("Unsupported output sink: {}, using memory sink".format(sinkType))
+	return MemorySink()
@@ -0,0 +1,166 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Regression benchmark of address vector (ADDR_VECT) of address decoder
+##   on sparse register block. Block of 4096 words with registers on small
+##   fraction of words is built in memory, address vector is calculated by
+##   register map generator, its length and entry width (12 bits) are checked
+##   and the time of calculation is reported.
+##
+##	 Example:
+##		python3 -m pyXact_generator.models.addr_vect_bench --max-time 0.5
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+import argparse
+import random
+import sys
+import time
+
+from types import SimpleNamespace
+
+from pyXact_generator.ip_xact.vhdl_reg_map_generator import VhdlRegMapGenerator
+
+# Number of words within benchmark block
+BLOCK_WORDS		= 4096
+
+# Word width in bits
+WORD_WIDTH		= 32
+
+# Width of word address within benchmark block
+ENTRY_WIDTH		= 12
+
+
+def create_reg(name, addressOffset):
+	"""
+	Create 32 bit read-write register with single field.
+	"""
+	field = SimpleNamespace(name="F", bitOffset=0, bitWidth=32,
+							modifiedWriteValue="", readAction="",
+							resets=SimpleNamespace(reset=SimpleNamespace(
+								value=0)),
+							enumeratedValues=[])
+	return SimpleNamespace(name=name, addressOffset=addressOffset, size=32,
+						   access="read-write", isPresent="", dim=None,
+						   field=[field])
+
+
+def create_sparse_component(regCount, seed):
+	"""
+	Create component with memory map of single sparse register block.
+	Registers are placed on "regCount" random words of the block.
+	"""
+	rnd = random.Random(seed)
+	words = sorted(rnd.sample(range(BLOCK_WORDS), regCount))
+	regs = [create_reg("R{}".format(i), word * 4)
+				for (i, word) in enumerate(words)]
+
+	block = SimpleNamespace(name="SPARSE", baseAddress=0,
+							range=BLOCK_WORDS * 4, width=WORD_WIDTH,
+							usage="register", register=regs)
+	memMap = SimpleNamespace(name="BENCH_MAP", addressBlock=[block])
+	return SimpleNamespace(memoryMaps=SimpleNamespace(memoryMap=[memMap]),
+						   parameters=SimpleNamespace(parameter=[]))
+
+
+def check_addr_vect(gen, block):
+	"""
+	Check that address vector has one entry of ENTRY_WIDTH bits for each
+	word with registers and that entries are word addresses of the words
+	(lowest address is the rightmost entry). Returns list of errors.
+	"""
+	errors = []
+	vect = gen.calc_addr_vect_value(block)
+	words = sorted(set([int(reg.addressOffset / 4) for reg in block.register]))
+
+	if (gen.calc_wrd_address_width(block) != ENTRY_WIDTH):
+		errors.append("Entry width {} instead of {}".format(
+			gen.calc_wrd_address_width(block), ENTRY_WIDTH))
+
+	if (len(vect) != len(words) * ENTRY_WIDTH):
+		errors.append("ADDR_VECT length {} instead of {}".format(len(vect),
+			len(words) * ENTRY_WIDTH))
+		return errors
+
+	for (i, word) in enumerate(words):
+		high = len(vect) - i * ENTRY_WIDTH
+		entry = int(vect[high - ENTRY_WIDTH:high], 2)
+		if (entry != word):
+			errors.append("Entry {} is {} instead of {}".format(i, entry,
+																word))
+	return errors
+
+
+def run_bench(regCount, iterations, seed):
+	"""
+	Calculate address vector of sparse block "iterations" times, each time
+	by new generator (word index of the block is built again).
+	Returns:
+		[errors, seconds]
+	"""
+	comp = create_sparse_component(regCount, seed)
+	block = comp.memoryMaps.memoryMap[0].addressBlock[0]
+
+	start = time.perf_counter()
+	for i in range(iterations):
+		gen = VhdlRegMapGenerator(comp, "BENCH_MAP", WORD_WIDTH)
+		gen.calc_addr_vect_value(block)
+	seconds = time.perf_counter() - start
+
+	gen = VhdlRegMapGenerator(comp, "BENCH_MAP", WORD_WIDTH)
+	return [check_addr_vect(gen, block), seconds]
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="ADDR_VECT benchmark of " \
+						"sparse {} word block".format(BLOCK_WORDS))
+	parser.add_argument("--regs", type=int, default=110,
+						help="Number of registers within the block")
+	parser.add_argument("--iterations", type=int, default=200,
+						help="Number of address vector calculations")
+	parser.add_argument("--seed", type=int, default=0,
+						help="Seed of register placement")
+	parser.add_argument("--max-time", type=float, default=None,
+						help="Fail when calculations take longer (seconds)")
+	args = parser.parse_args()
+
+	[errors, seconds] = run_bench(args.regs, args.iterations, args.seed)
+
+	print("ADDR_VECT of {} registers in {} words: {} calculations in " \
+		"{:.3f} s".format(args.regs, BLOCK_WORDS, args.iterations, seconds))
+	for error in errors:
+		print(error)
+
+	if (args.max_time != None and seconds > args.max_time):
+		print("Time limit {:.3f} s exceeded".format(args.max_time))
+		errors.append("time")
+
+	sys.exit(1 if errors else 0)
@@ -0,0 +1,320 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+
+###############################################################################
+##
+##   Cycle model of AXI4 slave front end (templates/axi4_slave.vhd) with
+##   memory behind its memory bus. Model follows the RTL clock cycle by
+##   clock cycle, so that throughput of bursts can be evaluated without
+##   VHDL simulator. Read latency and FIFO depth are the generics of the
+##   front end (READ_LATENCY constant of generated <memmap>_axi4).
+##
+##	 Example:
+##		model = Axi4SlaveModel(readLatency=2)
+##		stats = model.run([Axi4Burst(0x0, 16)] * 4)
+##		print(stats.read_throughput())
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+from collections import deque
+
+# Burst types (AxBURST)
+BURST_FIXED		= 0
+BURST_INCR		= 1
+BURST_WRAP		= 2
+
+
+class Axi4Burst():
+
+	# Byte address of first beat
+	addr = 0
+
+	# Number of beats (AxLEN + 1)
+	length = 1
+
+	# Bytes per beat is 2 ** size (AxSIZE)
+	size = 2
+
+	# Burst type (BURST_FIXED, BURST_INCR, BURST_WRAP)
+	burstType = BURST_INCR
+
+	# Transaction ID
+	id = 0
+
+	# Data of write beats (list of integers). Zeroes are written if not given.
+	data = None
+
+	def __init__(self, addr, length, size=2, burstType=BURST_INCR, id=0,
+					data=None):
+		self.addr = addr
+		self.length = length
+		self.size = size
+		self.burstType = burstType
+		self.id = id
+		self.data = data
+
+
+class Axi4ModelStats():
+
+	# Number of simulated clock cycles
+	cycles = 0
+
+	# Number of read beats returned on R channel
+	readBeats = 0
+
+	# Number of write beats executed on memory bus
+	writeBeats = 0
+
+	# Clock cycle of first and last read beat returned on R channel
+	firstReadCycle = None
+	lastReadCycle = None
+
+	# Returned read beats: list of [id, data, last]
+	readData = None
+
+	def __init__(self):
+		self.readData = []
+
+
+	def read_throughput(self):
+		"""
+		Calculate read beats per clock cycle from first to last returned
+		read beat.
+		"""
+		if (self.readBeats == 0):
+			return 0.0
+		return self.readBeats / (self.lastReadCycle - self.firstReadCycle + 1)
+
+
+class Axi4SlaveModel():
+
+	# Clock cycles from read on memory bus to valid read data
+	readLatency = 1
+
+	# Number of read data beats which can be stored in read data FIFO
+	fifoDepth = 3
+
+	# Width of data bus (in bits)
+	dataWidth = 32
+
+	# Width of byte address
+	addressWidth = 16
+
+	# Content of memory behind memory bus (word address -> value)
+	memory = None
+
+	def __init__(self, readLatency=1, fifoDepth=None, dataWidth=32,
+					addressWidth=16):
+		self.readLatency = readLatency
+		if (fifoDepth == None):
+			fifoDepth = readLatency + 2
+		self.fifoDepth = fifoDepth
+		self.dataWidth = dataWidth
+		self.addressWidth = addressWidth
+		self.memory = {}
+		self.reset()
+
+
+	def reset(self):
+		"""
+		Reset state of the front end. Memory content is kept.
+		"""
+		self.state = "idle"
+		self.lastRead = False
+		self.burstAddr = 0
+		self.burstLen = 0
+		self.burstSize = 0
+		self.burstType = BURST_INCR
+		self.burstId = 0
+		self.wrapMask = 0
+		self.outstanding = 0
+
+		# Tags of reads in flight: [valid, last, id, data], oldest last
+		self.tagPipe = [[False, False, 0, 0]] * self.readLatency
+		self.fifo = deque()
+
+
+	def calc_next_addr(self):
+		"""
+		Calculate address of next beat of current burst.
+		"""
+		addr_mask = (1 << self.addressWidth) - 1
+		incr_addr = (self.burstAddr + (1 << self.burstSize)) & addr_mask
+
+		if (self.burstType == BURST_FIXED):
+			return self.burstAddr
+		elif (self.burstType == BURST_WRAP):
+			return ((self.burstAddr & ~self.wrapMask) |
+					(incr_addr & self.wrapMask)) & addr_mask
+		return incr_addr
+
+
+	def get_word_addr(self, addr):
+		"""
+		Align byte address to address of memory word.
+		"""
+		return addr - (addr % int(self.dataWidth / 8))
+
+
+	def start_burst(self, burst):
+		"""
+		Load burst engine with accepted burst.
+		"""
+		self.burstAddr = burst.addr
+		self.burstLen = burst.length - 1
+		self.burstSize = burst.size
+		self.burstType = burst.burstType
+		self.burstId = burst.id
+		self.wrapMask = (burst.length << burst.size) - 1
+
+
+	def run(self, readBursts=[], writeBursts=[], rreadyPattern=None,
+			wvalidPattern=None, maxCycles=1000000):
+		"""
+		Simulate master issuing read and write bursts until all of them are
+		completed.
+		Arguments:
+			readBursts		List of Axi4Burst objects to read
+			writeBursts		List of Axi4Burst objects to write
+			rreadyPattern	Function: cycle -> RREADY (always high if None)
+			wvalidPattern	Function: cycle -> WVALID (always high if None)
+			maxCycles		Simulation is stopped after this number of cycles
+		Returns:
+			Axi4ModelStats object
+		"""
+		stats = Axi4ModelStats()
+		reads = deque(readBursts)
+		writes = deque(writeBursts)
+		read_beats = sum([burst.length for burst in readBursts])
+		write_bursts = len(writeBursts)
+		write_burst = None
+		write_beat = 0
+		write_resps = 0
+
+		cycle = 0
+		while (stats.readBeats < read_beats or write_resps < write_bursts):
+			if (cycle >= maxCycles):
+				print("AXI4 model: Bursts not completed in {} cycles!".format(
+					maxCycles))
+				break
+
+			rready = True if (rreadyPattern == None) else rreadyPattern(cycle)
+			wvalid = True if (wvalidPattern == None) else wvalidPattern(cycle)
+
+			# Arbitration of address channels
+			arvalid = len(reads) > 0
+			awvalid = len(writes) > 0
+			grant_write = (self.state == "idle" and awvalid and
+							(not arvalid or self.lastRead))
+			grant_read = (self.state == "idle" and arvalid and
+							not grant_write)
+
+			# Beats executed on memory bus
+			rd_issue = (self.state == "read" and
+						self.outstanding < self.fifoDepth)
+			wr_issue = (self.state == "write" and wvalid)
+
+			rd_tag = [rd_issue, self.burstLen == 0, self.burstId,
+					  self.memory.get(self.get_word_addr(self.burstAddr), 0)]
+			if (self.readLatency == 0):
+				resp_tag = rd_tag
+			else:
+				resp_tag = self.tagPipe[-1]
+
+			push = resp_tag[0]
+			pop = (len(self.fifo) > 0 and rready)
+
+			# Read data channel
+			if (pop):
+				[rid, rdata, rlast] = self.fifo.popleft()
+				stats.readData.append([rid, rdata, rlast])
+				stats.readBeats += 1
+				if (stats.firstReadCycle == None):
+					stats.firstReadCycle = cycle
+				stats.lastReadCycle = cycle
+
+			if (push):
+				self.fifo.append([resp_tag[2], resp_tag[3], resp_tag[1]])
+
+			if (rd_issue and not pop):
+				self.outstanding += 1
+			elif (pop and not rd_issue):
+				self.outstanding -= 1
+
+			if (self.readLatency > 0):
+				self.tagPipe = [rd_tag] + self.tagPipe[:-1]
+
+			# Write beat
+			if (wr_issue):
+				data = 0
+				if (write_burst.data != None):
+					data = write_burst.data[write_beat]
+				self.memory[self.get_word_addr(self.burstAddr)] = data
+				write_beat += 1
+				stats.writeBeats += 1
+
+			# Burst engine
+			if (self.state == "idle"):
+				if (grant_write):
+					write_burst = writes.popleft()
+					write_beat = 0
+					self.start_burst(write_burst)
+					self.state = "write"
+					self.lastRead = False
+				elif (grant_read):
+					self.start_burst(reads.popleft())
+					self.state = "read"
+					self.lastRead = True
+
+			elif (self.state == "read"):
+				if (rd_issue):
+					self.burstAddr = self.calc_next_addr()
+					if (self.burstLen == 0):
+						self.state = "idle"
+					else:
+						self.burstLen -= 1
+
+			elif (self.state == "write"):
+				if (wr_issue):
+					self.burstAddr = self.calc_next_addr()
+					if (self.burstLen == 0):
+						self.state = "resp"
+					else:
+						self.burstLen -= 1
+
+			# Write response is taken immediately (BREADY high)
+			elif (self.state == "resp"):
+				write_resps += 1
+				self.state = "idle"
+
+			cycle += 1
+
+		stats.cycles = cycle
+		return stats
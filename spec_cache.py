@@ -0,0 +1,220 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Persistent cache of loaded IP-XACT components. Loaded component is
+##   converted to a tree of plain attribute objects and stored on disk. Cache
+##   entry is keyed by hash of IP-XACT specification content, version of the
+##   cache format and version of the IP-XACT parser. When the entry exists,
+##   XML parsing is skipped and the tree is loaded instead.
+##
+##	Revision history:
+##		16.10.2026	First implementation
+##
+################################################################################
+
+import os
+import sys
+import glob
+import pickle
+import hashlib
+import tempfile
+
+from .gen_lib import *
+
+# Version of the cache format. Increment upon each change of stored format!
+SPEC_CACHE_VERSION = 1
+
+# Hash of IP-XACT parser sources (calculated upon first use)
+parser_version = None
+
+# Types stored in the cache as they are
+PLAIN_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+class SpecNode():
+	"""
+	Plain attribute object substituting any IP-XACT parser object in the
+	cached component tree.
+	"""
+	pass
+
+
+def calc_parser_version():
+	"""
+	Calculate version of IP-XACT parser as hash of its source files. Any
+	change of parser invalidates all cache entries.
+	"""
+	global parser_version
+
+	if (parser_version != None):
+		return parser_version
+
+	parser_hash = hashlib.sha256()
+	parser_mod = sys.modules.get(Component.__module__)
+	if (parser_mod != None and getattr(parser_mod, "__file__", None)):
+		parser_dir = os.path.dirname(os.path.abspath(parser_mod.__file__))
+		for path in sorted(glob.glob(os.path.join(parser_dir, "*.py")) +
+							glob.glob(os.path.join(parser_dir, "*.yml"))):
+			with open(path, 'rb') as fd:
+				parser_hash.update(fd.read())
+
+	parser_version = parser_hash.hexdigest()
+	return parser_version
+
+
+def calc_spec_key(spec_text):
+	"""
+	Calculate cache key of IP-XACT specification content.
+	"""
+	key = hashlib.sha256()
+	key.update("{}\n{}\n".format(SPEC_CACHE_VERSION,
+									calc_parser_version()).encode())
+	key.update(spec_text.encode())
+	return key.hexdigest()
+
+
+def convert_to_spec_node(obj, memo):
+	"""
+	Convert object of IP-XACT parser to tree of SpecNode objects. Instance
+	attributes are converted recursively, plain class attributes (defaults
+	of parser objects) are copied. Methods and types are not stored.
+	"""
+	if (isinstance(obj, PLAIN_TYPES)):
+		return obj
+
+	if (id(obj) in memo):
+		return memo[id(obj)]
+
+	if (isinstance(obj, list)):
+		conv = []
+		memo[id(obj)] = conv
+		for item in obj:
+			conv.append(convert_to_spec_node(item, memo))
+		return conv
+
+	if (isinstance(obj, tuple)):
+		return tuple(convert_to_spec_node(item, memo) for item in obj)
+
+	if (isinstance(obj, dict)):
+		conv = {}
+		memo[id(obj)] = conv
+		for key, value in obj.items():
+			conv[key] = convert_to_spec_node(value, memo)
+		return conv
+
+	if (not hasattr(obj, "__dict__") or callable(obj)):
+		raise TypeError("Unsupported type in IP-XACT component: " +
+							type(obj).__name__)
+
+	node = SpecNode()
+	memo[id(obj)] = node
+
+	# Defaults defined on parser classes
+	for cls in reversed(type(obj).__mro__):
+		for name, value in vars(cls).items():
+			if (not name.startswith("__") and isinstance(value, PLAIN_TYPES)):
+				setattr(node, name, value)
+
+	for name, value in vars(obj).items():
+		if (callable(value)):
+			continue
+		setattr(node, name, convert_to_spec_node(value, memo))
+
+	return node
+
+
+def load_cached_component(cache_path):
+	"""
+	Load component tree from cache file. None is returned if the cache
+	file does not exist or can't be loaded.
+	"""
+	if (not os.path.isfile(cache_path)):
+		return None
+
+	try:
+		with open(cache_path, 'rb') as fd:
+			return pickle.load(fd)
+	except Exception as err:
+		print("Invalid IP-XACT cache file {}: {}".format(cache_path, err))
+		return None
+
+
+def store_cached_component(cache_path, component):
+	"""
+	Store component tree to cache file. Cache file is replaced atomically,
+	so that concurrent runs never see partially written file.
+	"""
+	cache_dir = os.path.dirname(cache_path)
+	tmp_path = None
+	try:
+		node = convert_to_spec_node(component, {})
+
+		if (not os.path.isdir(cache_dir)):
+			os.makedirs(cache_dir)
+
+		(fd, tmp_path) = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+		with os.fdopen(fd, 'wb') as of:
+			pickle.dump(node, of, protocol=pickle.HIGHEST_PROTOCOL)
+		os.replace(tmp_path, cache_path)
+
+	except Exception as err:
+		print("Unable to store IP-XACT cache file {}: {}".format(cache_path,
+				err))
+		if (tmp_path != None and os.path.isfile(tmp_path)):
+			os.remove(tmp_path)
+
+
+def load_component(spec_file, cache_dir=""):
+	"""
+	Load IP-XACT component from opened specification file. If cache
+	directory is given, component is loaded from the cache when
+	specification did not change since it was stored. Otherwise the
+	specification is parsed and stored to the cache.
+	Arguments:
+		spec_file	Opened IP-XACT specification file
+		cache_dir	Directory with cached components. Empty string disables
+					the cache.
+	"""
+	if (cache_dir == "" or cache_dir == None):
+		component = Component()
+		component.load(spec_file)
+		return component
+
+	spec_text = spec_file.read()
+	spec_file.seek(0)
+	cache_path = os.path.join(cache_dir, calc_spec_key(spec_text) + ".pickle")
+
+	component = load_cached_component(cache_path)
+	if (component != None):
+		return component
+
+	component = Component()
+	component.load(spec_file)
+	store_cached_component(cache_path, component)
+
+	return component
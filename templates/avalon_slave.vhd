@@ -0,0 +1,232 @@
+--------------------------------------------------------------------------------
+-- 
+-- Register map generation tool
+--
+-- Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this SW component and associated documentation files (the "Component"),
+-- to deal in the Component without restriction, including without limitation
+-- the rights to use, copy, modify, merge, publish, distribute, sublicense,
+-- and/or sell copies of the Component, and to permit persons to whom the
+-- Component is furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in
+-- all copies or substantial portions of the Component.
+--
+-- THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+-- FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+-- IN THE COMPONENT.
+--
+--------------------------------------------------------------------------------
+--------------------------------------------------------------------------------
+--------------------------------------------------------------------------------
+-- Purpose:
+--   Avalon-MM slave front end of memory bus (address, w_data, r_data, cs,
+--   read, write, be). Pipelined reads with variable latency
+--   (readdatavalid), address is byte address (addressUnits = SYMBOLS).
+--
+--   Commands pass through skid buffer, thus waitrequest is registered and
+--   new command is accepted every clock cycle. One command is executed on
+--   memory bus per clock cycle.
+--
+--   Read data are returned "read_latency" clock cycles after read on memory
+--   bus (REGISTERED_READ + READ_LATENCY of register block). Up to
+--   "max_outstanding" reads can be in progress (maximumPendingReadTransactions
+--   of the component). Further reads are held by waitrequest. With
+--   max_outstanding >= read_latency + 1, back-to-back reads are executed at
+--   one command per clock cycle.
+--
+--   Commands are held while "full" is set, i.e. when a block behind memory
+--   bus can't take further accesses (FIFO of clock domain crossing variant
+--   of register block).
+--
+--   Byte enables are all zeroes when memory bus is idle, so that blocks
+--   with "clear_read_data" return zeroes when they are not read.
+--------------------------------------------------------------------------------
+-- Revision History:
+--    16.10.2026   Created file
+--    16.10.2026   Accesses held by "full"
+--------------------------------------------------------------------------------
+
+Library ieee;
+USE IEEE.std_logic_1164.all;
+USE IEEE.numeric_std.ALL;
+
+entity avalon_slave is
+    generic(
+        -- Width of data bus
+        constant data_width           :     natural := 32;
+
+        -- Width of address bus (byte address)
+        constant address_width        :     natural := 16;
+
+        -- Clock cycles from read on memory bus to valid read data
+        constant read_latency         :     natural := 1;
+
+        -- Number of reads in progress
+        constant max_outstanding      :     natural := 3;
+
+        -- Reset polarity
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        ------------------------------------------------------------------------
+        -- Clock and reset
+        ------------------------------------------------------------------------
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Avalon-MM slave
+        ------------------------------------------------------------------------
+        signal avs_address            :in   std_logic_vector(address_width - 1 downto 0);
+        signal avs_read               :in   std_logic;
+        signal avs_write              :in   std_logic;
+        signal avs_writedata          :in   std_logic_vector(data_width - 1 downto 0);
+        signal avs_byteenable         :in   std_logic_vector(data_width / 8 - 1 downto 0);
+        signal avs_waitrequest        :out  std_logic;
+        signal avs_readdata           :out  std_logic_vector(data_width - 1 downto 0);
+        signal avs_readdatavalid      :out  std_logic;
+
+        ------------------------------------------------------------------------
+        -- Memory bus
+        ------------------------------------------------------------------------
+        signal address                :out  std_logic_vector(address_width - 1 downto 0);
+        signal w_data                 :out  std_logic_vector(data_width - 1 downto 0);
+        signal r_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal cs                     :out  std_logic;
+        signal read                   :out  std_logic;
+        signal write                  :out  std_logic;
+        signal be                     :out  std_logic_vector(data_width / 8 - 1 downto 0);
+        signal full                   :in   std_logic
+    );
+
+end entity avalon_slave;
+
+
+architecture rtl of avalon_slave is
+
+    -- Command: read & write & byteenable & writedata & address
+    constant CMD_WIDTH                :    natural :=
+        address_width + data_width + data_width / 8 + 2;
+    constant CMD_READ                 :    natural := CMD_WIDTH - 1;
+    constant CMD_WRITE                :    natural := CMD_WIDTH - 2;
+    constant CMD_BE_H                 :    natural := CMD_WIDTH - 3;
+    constant CMD_DATA_H               :    natural := address_width + data_width - 1;
+
+    signal cmd_in                     :    std_logic_vector(CMD_WIDTH - 1 downto 0);
+    signal cmd_out                    :    std_logic_vector(CMD_WIDTH - 1 downto 0);
+    signal cmd_in_valid               :    std_logic;
+    signal cmd_in_ready               :    std_logic;
+    signal cmd_valid                  :    std_logic;
+
+    -- Commands executed on memory bus
+    signal issue                      :    std_logic;
+    signal rd_issue                   :    std_logic;
+    signal wr_issue                   :    std_logic;
+
+    -- Reads executed on memory bus whose data were not yet returned
+    signal outstanding                :    natural range 0 to max_outstanding;
+
+    -- Valid of read data delayed by "read_latency"
+    signal rd_pipe                    :    std_logic_vector(read_latency downto 0);
+    signal rd_valid                   :    std_logic;
+
+begin
+
+    ---------------------------------------------------------------------------
+    -- Skid buffer of commands
+    ---------------------------------------------------------------------------
+    cmd_in <= avs_read & avs_write & avs_byteenable & avs_writedata &
+              avs_address;
+    cmd_in_valid <= avs_read or avs_write;
+
+    cmd_skid_buffer_comp : entity work.skid_buffer
+    generic map(
+        data_width      => CMD_WIDTH,
+        reset_polarity  => reset_polarity
+    )
+    port map(
+        clk_sys         => clk_sys,
+        res_n           => res_n,
+        s_data          => cmd_in,
+        s_valid         => cmd_in_valid,
+        s_ready         => cmd_in_ready,
+        m_data          => cmd_out,
+        m_valid         => cmd_valid,
+        m_ready         => issue
+    );
+
+    avs_waitrequest <= not cmd_in_ready;
+
+
+    ---------------------------------------------------------------------------
+    -- Memory bus
+    ---------------------------------------------------------------------------
+    issue <= '1' when (cmd_valid = '1' and full = '0' and
+                       (cmd_out(CMD_READ) = '0' or
+                        outstanding < max_outstanding)) else
+             '0';
+    rd_issue <= issue and cmd_out(CMD_READ);
+    wr_issue <= issue and cmd_out(CMD_WRITE) and not cmd_out(CMD_READ);
+
+    address <= cmd_out(address_width - 1 downto 0);
+    w_data <= cmd_out(CMD_DATA_H downto address_width);
+    cs <= rd_issue or wr_issue;
+    read <= rd_issue;
+    write <= wr_issue;
+
+    be <= cmd_out(CMD_BE_H downto CMD_DATA_H + 1) when (issue = '1') else
+          (OTHERS => '0');
+
+
+    ---------------------------------------------------------------------------
+    -- Valid of read data delayed by read latency
+    ---------------------------------------------------------------------------
+    rd_pipe(0) <= rd_issue;
+
+    rd_pipe_gen : if (read_latency > 0) generate
+        rd_pipe_proc : process(res_n, clk_sys)
+        begin
+            if (res_n = reset_polarity) then
+                rd_pipe(read_latency downto 1) <= (OTHERS => '0');
+            elsif (rising_edge(clk_sys)) then
+                rd_pipe(read_latency downto 1) <=
+                    rd_pipe(read_latency - 1 downto 0);
+            end if;
+        end process;
+    end generate rd_pipe_gen;
+
+    rd_valid <= rd_pipe(read_latency);
+
+    outstanding_proc : process(res_n, clk_sys)
+    begin
+        if (res_n = reset_polarity) then
+            outstanding <= 0;
+        elsif (rising_edge(clk_sys)) then
+            if (rd_issue = '1' and rd_valid = '0') then
+                outstanding <= outstanding + 1;
+            elsif (rd_issue = '0' and rd_valid = '1') then
+                outstanding <= outstanding - 1;
+            end if;
+        end if;
+    end process;
+
+    avs_readdatavalid <= rd_valid;
+    avs_readdata <= r_data;
+
+
+    assert ((data_width mod 8) = 0)
+        report "Data width must be multiple of 8!"
+        severity failure;
+
+    assert (max_outstanding > 0)
+        report "Number of outstanding reads must be at least 1!"
+        severity failure;
+
+end architecture;
@@ -0,0 +1,438 @@
+--------------------------------------------------------------------------------
+-- 
+-- Register map generation tool
+--
+-- Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this SW component and associated documentation files (the "Component"),
+-- to deal in the Component without restriction, including without limitation
+-- the rights to use, copy, modify, merge, publish, distribute, sublicense,
+-- and/or sell copies of the Component, and to permit persons to whom the
+-- Component is furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in
+-- all copies or substantial portions of the Component.
+--
+-- THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+-- FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+-- IN THE COMPONENT.
+--
+--------------------------------------------------------------------------------
+--------------------------------------------------------------------------------
+
+
+--------------------------------------------------------------------------------
+-- Purpose:
+--   AXI4 slave front end of memory bus (address, w_data, r_data, cs, read,
+--   write, be). Supports INCR, FIXED and WRAP bursts of up to 256 beats.
+--
+--   Burst engine executes one burst at a time, one beat per clock cycle.
+--   Write and read bursts are granted in round robin manner. Write response
+--   is given after last write beat was executed on memory bus.
+--
+--   Read data are returned "read_latency" clock cycles after read on memory
+--   bus (REGISTERED_READ + READ_LATENCY of register block). Read data are
+--   stored in FIFO of "fifo_depth" beats. New read is executed only if there
+--   is a free place in FIFO for its data, thus RREADY can be de-asserted
+--   at any time. With fifo_depth >= read_latency + 2 reads continue at one
+--   beat per clock cycle as long as RREADY is high.
+--
+--   Beats are held (WREADY is low) while "full" is set, i.e. when a block
+--   behind memory bus can't take further accesses (FIFO of clock domain
+--   crossing variant of register block).
+--
+--   Byte enables are all ones for reads and all zeroes when memory bus is
+--   idle, so that blocks with "clear_read_data" return zeroes when they are
+--   not read. Responses are always OKAY.
+--------------------------------------------------------------------------------
+-- Revision History:
+--    16.10.2026   Created file
+--    16.10.2026   Accesses held by "full"
+--------------------------------------------------------------------------------
+
+Library ieee;
+USE IEEE.std_logic_1164.all;
+USE IEEE.numeric_std.ALL;
+
+entity axi4_slave is
+    generic(
+        -- Width of data bus
+        constant data_width           :     natural := 32;
+
+        -- Width of address bus (byte address)
+        constant address_width        :     natural := 16;
+
+        -- Width of transaction ID
+        constant id_width             :     natural := 4;
+
+        -- Clock cycles from read on memory bus to valid read data
+        constant read_latency         :     natural := 1;
+
+        -- Number of read data beats which can be stored
+        constant fifo_depth           :     natural := 3;
+
+        -- Reset polarity
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        ------------------------------------------------------------------------
+        -- Clock and reset
+        ------------------------------------------------------------------------
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Write address channel
+        ------------------------------------------------------------------------
+        signal s_axi_awid             :in   std_logic_vector(id_width - 1 downto 0);
+        signal s_axi_awaddr           :in   std_logic_vector(address_width - 1 downto 0);
+        signal s_axi_awlen            :in   std_logic_vector(7 downto 0);
+        signal s_axi_awsize           :in   std_logic_vector(2 downto 0);
+        signal s_axi_awburst          :in   std_logic_vector(1 downto 0);
+        signal s_axi_awvalid          :in   std_logic;
+        signal s_axi_awready          :out  std_logic;
+
+        ------------------------------------------------------------------------
+        -- Write data channel
+        ------------------------------------------------------------------------
+        signal s_axi_wdata            :in   std_logic_vector(data_width - 1 downto 0);
+        signal s_axi_wstrb            :in   std_logic_vector(data_width / 8 - 1 downto 0);
+        signal s_axi_wlast            :in   std_logic;
+        signal s_axi_wvalid           :in   std_logic;
+        signal s_axi_wready           :out  std_logic;
+
+        ------------------------------------------------------------------------
+        -- Write response channel
+        ------------------------------------------------------------------------
+        signal s_axi_bid              :out  std_logic_vector(id_width - 1 downto 0);
+        signal s_axi_bresp            :out  std_logic_vector(1 downto 0);
+        signal s_axi_bvalid           :out  std_logic;
+        signal s_axi_bready           :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Read address channel
+        ------------------------------------------------------------------------
+        signal s_axi_arid             :in   std_logic_vector(id_width - 1 downto 0);
+        signal s_axi_araddr           :in   std_logic_vector(address_width - 1 downto 0);
+        signal s_axi_arlen            :in   std_logic_vector(7 downto 0);
+        signal s_axi_arsize           :in   std_logic_vector(2 downto 0);
+        signal s_axi_arburst          :in   std_logic_vector(1 downto 0);
+        signal s_axi_arvalid          :in   std_logic;
+        signal s_axi_arready          :out  std_logic;
+
+        ------------------------------------------------------------------------
+        -- Read data channel
+        ------------------------------------------------------------------------
+        signal s_axi_rid              :out  std_logic_vector(id_width - 1 downto 0);
+        signal s_axi_rdata            :out  std_logic_vector(data_width - 1 downto 0);
+        signal s_axi_rresp            :out  std_logic_vector(1 downto 0);
+        signal s_axi_rlast            :out  std_logic;
+        signal s_axi_rvalid           :out  std_logic;
+        signal s_axi_rready           :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Memory bus
+        ------------------------------------------------------------------------
+        signal address                :out  std_logic_vector(address_width - 1 downto 0);
+        signal w_data                 :out  std_logic_vector(data_width - 1 downto 0);
+        signal r_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal cs                     :out  std_logic;
+        signal read                   :out  std_logic;
+        signal write                  :out  std_logic;
+        signal be                     :out  std_logic_vector(data_width / 8 - 1 downto 0);
+        signal full                   :in   std_logic
+    );
+
+end entity axi4_slave;
+
+
+architecture rtl of axi4_slave is
+
+    constant BURST_FIXED              :    std_logic_vector(1 downto 0) := "00";
+    constant BURST_WRAP               :    std_logic_vector(1 downto 0) := "10";
+
+    type t_state is (s_idle, s_read, s_write, s_resp);
+    signal state                      :    t_state;
+
+    -- Grant of address channels
+    signal grant_write                :    std_logic;
+    signal grant_read                 :    std_logic;
+
+    -- Last granted burst was read burst (round robin)
+    signal last_read                  :    std_logic;
+
+    -- Burst engine: address of current beat, number of remaining beats - 1
+    signal burst_addr                 :    unsigned(address_width - 1 downto 0);
+    signal burst_len                  :    unsigned(7 downto 0);
+    signal burst_size                 :    unsigned(2 downto 0);
+    signal burst_type                 :    std_logic_vector(1 downto 0);
+    signal burst_id                   :    std_logic_vector(id_width - 1 downto 0);
+    signal wrap_mask                  :    unsigned(address_width - 1 downto 0);
+    signal next_addr                  :    unsigned(address_width - 1 downto 0);
+
+    -- Beats executed on memory bus
+    signal rd_issue                   :    std_logic;
+    signal wr_issue                   :    std_logic;
+
+    -- Reads executed on memory bus whose data were not yet returned
+    signal outstanding                :    natural range 0 to fifo_depth;
+
+    -- Tag of read beat: id & last & valid. Delayed by "read_latency".
+    subtype t_tag is std_logic_vector(id_width + 1 downto 0);
+    type t_tag_pipe is array (1 to read_latency) of t_tag;
+    signal rd_tag                     :    t_tag;
+    signal tag_pipe                   :    t_tag_pipe;
+    signal resp_tag                   :    t_tag;
+
+    -- Read data FIFO, entry: data & id & last
+    type t_fifo is array (0 to fifo_depth - 1) of
+        std_logic_vector(data_width + id_width downto 0);
+    signal fifo                       :    t_fifo;
+    signal fifo_head                  :    std_logic_vector(data_width + id_width downto 0);
+    signal wr_ptr                     :    natural range 0 to fifo_depth - 1;
+    signal rd_ptr                     :    natural range 0 to fifo_depth - 1;
+    signal fifo_cnt                   :    natural range 0 to fifo_depth;
+    signal push                       :    std_logic;
+    signal pop                        :    std_logic;
+
+begin
+
+    ---------------------------------------------------------------------------
+    -- Arbitration of address channels
+    ---------------------------------------------------------------------------
+    grant_write <= '1' when (state = s_idle and s_axi_awvalid = '1' and
+                             (s_axi_arvalid = '0' or last_read = '1')) else
+                   '0';
+
+    grant_read <= '1' when (state = s_idle and s_axi_arvalid = '1' and
+                            grant_write = '0') else
+                  '0';
+
+    s_axi_awready <= grant_write;
+    s_axi_arready <= grant_read;
+
+
+    ---------------------------------------------------------------------------
+    -- Address of next beat
+    ---------------------------------------------------------------------------
+    next_addr_proc : process(burst_addr, burst_size, burst_type, wrap_mask)
+        variable incr : unsigned(address_width - 1 downto 0);
+        variable sum  : unsigned(address_width - 1 downto 0);
+    begin
+        incr := shift_left(to_unsigned(1, address_width),
+                           to_integer(burst_size));
+        sum := burst_addr + incr;
+
+        if (burst_type = BURST_FIXED) then
+            next_addr <= burst_addr;
+        elsif (burst_type = BURST_WRAP) then
+            next_addr <= (burst_addr and not wrap_mask) or (sum and wrap_mask);
+        else
+            next_addr <= sum;
+        end if;
+    end process;
+
+
+    ---------------------------------------------------------------------------
+    -- Burst engine
+    ---------------------------------------------------------------------------
+    burst_proc : process(res_n, clk_sys)
+    begin
+        if (res_n = reset_polarity) then
+            state <= s_idle;
+            last_read <= '0';
+            burst_addr <= (OTHERS => '0');
+            burst_len <= (OTHERS => '0');
+            burst_size <= (OTHERS => '0');
+            burst_type <= (OTHERS => '0');
+            burst_id <= (OTHERS => '0');
+            wrap_mask <= (OTHERS => '0');
+        elsif (rising_edge(clk_sys)) then
+            case state is
+            when s_idle =>
+                if (grant_write = '1') then
+                    state <= s_write;
+                    last_read <= '0';
+                    burst_addr <= unsigned(s_axi_awaddr);
+                    burst_len <= unsigned(s_axi_awlen);
+                    burst_size <= unsigned(s_axi_awsize);
+                    burst_type <= s_axi_awburst;
+                    burst_id <= s_axi_awid;
+                    wrap_mask <= shift_left(
+                        resize(unsigned(s_axi_awlen), address_width) + 1,
+                        to_integer(unsigned(s_axi_awsize))) - 1;
+                elsif (grant_read = '1') then
+                    state <= s_read;
+                    last_read <= '1';
+                    burst_addr <= unsigned(s_axi_araddr);
+                    burst_len <= unsigned(s_axi_arlen);
+                    burst_size <= unsigned(s_axi_arsize);
+                    burst_type <= s_axi_arburst;
+                    burst_id <= s_axi_arid;
+                    wrap_mask <= shift_left(
+                        resize(unsigned(s_axi_arlen), address_width) + 1,
+                        to_integer(unsigned(s_axi_arsize))) - 1;
+                end if;
+
+            when s_read =>
+                if (rd_issue = '1') then
+                    burst_addr <= next_addr;
+                    if (burst_len = 0) then
+                        state <= s_idle;
+                    else
+                        burst_len <= burst_len - 1;
+                    end if;
+                end if;
+
+            when s_write =>
+                if (wr_issue = '1') then
+                    burst_addr <= next_addr;
+                    if (s_axi_wlast = '1' or burst_len = 0) then
+                        state <= s_resp;
+                    else
+                        burst_len <= burst_len - 1;
+                    end if;
+                end if;
+
+            when s_resp =>
+                if (s_axi_bready = '1') then
+                    state <= s_idle;
+                end if;
+            end case;
+        end if;
+    end process;
+
+
+    ---------------------------------------------------------------------------
+    -- Memory bus
+    ---------------------------------------------------------------------------
+    rd_issue <= '1' when (state = s_read and outstanding < fifo_depth and
+                          full = '0') else
+                '0';
+    wr_issue <= '1' when (state = s_write and s_axi_wvalid = '1' and
+                          full = '0') else
+                '0';
+
+    address <= std_logic_vector(burst_addr);
+    w_data <= s_axi_wdata;
+    cs <= rd_issue or wr_issue;
+    read <= rd_issue;
+    write <= wr_issue;
+
+    be <= s_axi_wstrb when (wr_issue = '1') else
+          (OTHERS => '1') when (rd_issue = '1') else
+          (OTHERS => '0');
+
+    s_axi_wready <= '1' when (state = s_write and full = '0') else
+                    '0';
+
+
+    ---------------------------------------------------------------------------
+    -- Write response
+    ---------------------------------------------------------------------------
+    s_axi_bvalid <= '1' when (state = s_resp) else
+                    '0';
+    s_axi_bid <= burst_id;
+    s_axi_bresp <= "00";
+
+
+    ---------------------------------------------------------------------------
+    -- Tags of read beats delayed by read latency
+    ---------------------------------------------------------------------------
+    rd_tag <= burst_id & '1' & rd_issue when (burst_len = 0) else
+              burst_id & '0' & rd_issue;
+
+    tag_comb_gen : if (read_latency = 0) generate
+        resp_tag <= rd_tag;
+    end generate tag_comb_gen;
+
+    tag_pipe_gen : if (read_latency > 0) generate
+        tag_pipe_proc : process(res_n, clk_sys)
+        begin
+            if (res_n = reset_polarity) then
+                tag_pipe <= (OTHERS => (OTHERS => '0'));
+            elsif (rising_edge(clk_sys)) then
+                for i in 1 to read_latency loop
+                    if (i = 1) then
+                        tag_pipe(i) <= rd_tag;
+                    else
+                        tag_pipe(i) <= tag_pipe(i - 1);
+                    end if;
+                end loop;
+            end if;
+        end process;
+
+        resp_tag <= tag_pipe(read_latency);
+    end generate tag_pipe_gen;
+
+
+    ---------------------------------------------------------------------------
+    -- Read data FIFO
+    ---------------------------------------------------------------------------
+    push <= resp_tag(0);
+    pop <= '1' when (fifo_cnt > 0 and s_axi_rready = '1') else
+           '0';
+
+    fifo_mem_proc : process(clk_sys)
+    begin
+        if (rising_edge(clk_sys)) then
+            if (push = '1') then
+                fifo(wr_ptr) <= r_data & resp_tag(id_width + 1 downto 1);
+            end if;
+        end if;
+    end process;
+
+    fifo_ptr_proc : process(res_n, clk_sys)
+    begin
+        if (res_n = reset_polarity) then
+            wr_ptr <= 0;
+            rd_ptr <= 0;
+            fifo_cnt <= 0;
+            outstanding <= 0;
+        elsif (rising_edge(clk_sys)) then
+            if (push = '1') then
+                wr_ptr <= (wr_ptr + 1) mod fifo_depth;
+            end if;
+
+            if (pop = '1') then
+                rd_ptr <= (rd_ptr + 1) mod fifo_depth;
+            end if;
+
+            if (push = '1' and pop = '0') then
+                fifo_cnt <= fifo_cnt + 1;
+            elsif (push = '0' and pop = '1') then
+                fifo_cnt <= fifo_cnt - 1;
+            end if;
+
+            if (rd_issue = '1' and pop = '0') then
+                outstanding <= outstanding + 1;
+            elsif (rd_issue = '0' and pop = '1') then
+                outstanding <= outstanding - 1;
+            end if;
+        end if;
+    end process;
+
+    fifo_head <= fifo(rd_ptr);
+
+    s_axi_rvalid <= '1' when (fifo_cnt > 0) else
+                    '0';
+    s_axi_rdata <= fifo_head(data_width + id_width downto id_width + 1);
+    s_axi_rid <= fifo_head(id_width downto 1);
+    s_axi_rlast <= fifo_head(0);
+    s_axi_rresp <= "00";
+
+
+    assert ((data_width mod 8) = 0)
+        report "Data width must be multiple of 8!"
+        severity failure;
+
+    assert (fifo_depth > 0)
+        report "FIFO depth must be at least 1!"
+        severity failure;
+
+end architecture;
@@ -0,0 +1,384 @@
+--------------------------------------------------------------------------------
+-- 
+-- Register map generation tool
+--
+-- Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this SW component and associated documentation files (the "Component"),
+-- to deal in the Component without restriction, including without limitation
+-- the rights to use, copy, modify, merge, publish, distribute, sublicense,
+-- and/or sell copies of the Component, and to permit persons to whom the
+-- Component is furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in
+-- all copies or substantial portions of the Component.
+--
+-- THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+-- FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+-- IN THE COMPONENT.
+--
+--------------------------------------------------------------------------------
+--------------------------------------------------------------------------------
+--------------------------------------------------------------------------------
+-- Purpose:
+--   AXI4-Lite slave front end of memory bus (address, w_data, r_data, cs,
+--   read, write, be).
+--
+--   Each address and write data channel passes through skid buffer, thus
+--   ready signals are registered and new transaction is accepted every
+--   clock cycle. One access is executed on memory bus per clock cycle. When
+--   both read and write are pending, they are executed in round robin
+--   manner.
+--
+--   Read data are returned "read_latency" clock cycles after read on memory
+--   bus (REGISTERED_READ + READ_LATENCY of register block). Up to
+--   "max_outstanding" reads can be executed whose data were not yet taken
+--   by master, read data are stored in FIFO of the same depth. Thus RREADY
+--   can be de-asserted at any time. Write responses are counted, up to
+--   "max_outstanding" write responses can be pending. With
+--   max_outstanding >= read_latency + 2, back-to-back reads are executed at
+--   one access per clock cycle.
+--
+--   Accesses are held while "full" is set, i.e. when a block behind memory
+--   bus can't take further accesses (FIFO of clock domain crossing variant
+--   of register block).
+--
+--   Byte enables are all ones for reads and all zeroes when memory bus is
+--   idle, so that blocks with "clear_read_data" return zeroes when they are
+--   not read. Responses are always OKAY.
+--------------------------------------------------------------------------------
+-- Revision History:
+--    16.10.2026   Created file
+--    16.10.2026   Accesses held by "full"
+--------------------------------------------------------------------------------
+
+Library ieee;
+USE IEEE.std_logic_1164.all;
+USE IEEE.numeric_std.ALL;
+
+entity axi4lite_slave is
+    generic(
+        -- Width of data bus
+        constant data_width           :     natural := 32;
+
+        -- Width of address bus (byte address)
+        constant address_width        :     natural := 16;
+
+        -- Clock cycles from read on memory bus to valid read data
+        constant read_latency         :     natural := 1;
+
+        -- Number of outstanding reads (and pending write responses)
+        constant max_outstanding      :     natural := 3;
+
+        -- Reset polarity
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        ------------------------------------------------------------------------
+        -- Clock and reset
+        ------------------------------------------------------------------------
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Write address channel
+        ------------------------------------------------------------------------
+        signal s_axi_awaddr           :in   std_logic_vector(address_width - 1 downto 0);
+        signal s_axi_awprot           :in   std_logic_vector(2 downto 0);
+        signal s_axi_awvalid          :in   std_logic;
+        signal s_axi_awready          :out  std_logic;
+
+        ------------------------------------------------------------------------
+        -- Write data channel
+        ------------------------------------------------------------------------
+        signal s_axi_wdata            :in   std_logic_vector(data_width - 1 downto 0);
+        signal s_axi_wstrb            :in   std_logic_vector(data_width / 8 - 1 downto 0);
+        signal s_axi_wvalid           :in   std_logic;
+        signal s_axi_wready           :out  std_logic;
+
+        ------------------------------------------------------------------------
+        -- Write response channel
+        ------------------------------------------------------------------------
+        signal s_axi_bresp            :out  std_logic_vector(1 downto 0);
+        signal s_axi_bvalid           :out  std_logic;
+        signal s_axi_bready           :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Read address channel
+        ------------------------------------------------------------------------
+        signal s_axi_araddr           :in   std_logic_vector(address_width - 1 downto 0);
+        signal s_axi_arprot           :in   std_logic_vector(2 downto 0);
+        signal s_axi_arvalid          :in   std_logic;
+        signal s_axi_arready          :out  std_logic;
+
+        ------------------------------------------------------------------------
+        -- Read data channel
+        ------------------------------------------------------------------------
+        signal s_axi_rdata            :out  std_logic_vector(data_width - 1 downto 0);
+        signal s_axi_rresp            :out  std_logic_vector(1 downto 0);
+        signal s_axi_rvalid           :out  std_logic;
+        signal s_axi_rready           :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Memory bus
+        ------------------------------------------------------------------------
+        signal address                :out  std_logic_vector(address_width - 1 downto 0);
+        signal w_data                 :out  std_logic_vector(data_width - 1 downto 0);
+        signal r_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal cs                     :out  std_logic;
+        signal read                   :out  std_logic;
+        signal write                  :out  std_logic;
+        signal be                     :out  std_logic_vector(data_width / 8 - 1 downto 0);
+        signal full                   :in   std_logic
+    );
+
+end entity axi4lite_slave;
+
+
+architecture rtl of axi4lite_slave is
+
+    -- Outputs of skid buffers
+    signal ar_addr                    :    std_logic_vector(address_width - 1 downto 0);
+    signal ar_valid                   :    std_logic;
+    signal aw_addr                    :    std_logic_vector(address_width - 1 downto 0);
+    signal aw_valid                   :    std_logic;
+    signal w_in                       :    std_logic_vector(data_width + data_width / 8 - 1 downto 0);
+    signal w_out                      :    std_logic_vector(data_width + data_width / 8 - 1 downto 0);
+    signal w_valid                    :    std_logic;
+
+    -- Pending accesses and accesses executed on memory bus
+    signal rd_req                     :    std_logic;
+    signal wr_req                     :    std_logic;
+    signal rd_issue                   :    std_logic;
+    signal wr_issue                   :    std_logic;
+
+    -- Last executed access was read (round robin)
+    signal last_read                  :    std_logic;
+
+    -- Reads executed on memory bus whose data were not yet taken by master
+    signal outstanding                :    natural range 0 to max_outstanding;
+
+    -- Pending write responses
+    signal b_cnt                      :    natural range 0 to max_outstanding;
+
+    -- Valid of read data delayed by "read_latency"
+    signal rd_pipe                    :    std_logic_vector(read_latency downto 0);
+
+    -- Read data FIFO
+    type t_fifo is array (0 to max_outstanding - 1) of
+        std_logic_vector(data_width - 1 downto 0);
+    signal fifo                       :    t_fifo;
+    signal wr_ptr                     :    natural range 0 to max_outstanding - 1;
+    signal rd_ptr                     :    natural range 0 to max_outstanding - 1;
+    signal fifo_cnt                   :    natural range 0 to max_outstanding;
+    signal push                       :    std_logic;
+    signal pop                        :    std_logic;
+
+begin
+
+    ---------------------------------------------------------------------------
+    -- Skid buffers of address and write data channels
+    ---------------------------------------------------------------------------
+    ar_skid_buffer_comp : entity work.skid_buffer
+    generic map(
+        data_width      => address_width,
+        reset_polarity  => reset_polarity
+    )
+    port map(
+        clk_sys         => clk_sys,
+        res_n           => res_n,
+        s_data          => s_axi_araddr,
+        s_valid         => s_axi_arvalid,
+        s_ready         => s_axi_arready,
+        m_data          => ar_addr,
+        m_valid         => ar_valid,
+        m_ready         => rd_issue
+    );
+
+    aw_skid_buffer_comp : entity work.skid_buffer
+    generic map(
+        data_width      => address_width,
+        reset_polarity  => reset_polarity
+    )
+    port map(
+        clk_sys         => clk_sys,
+        res_n           => res_n,
+        s_data          => s_axi_awaddr,
+        s_valid         => s_axi_awvalid,
+        s_ready         => s_axi_awready,
+        m_data          => aw_addr,
+        m_valid         => aw_valid,
+        m_ready         => wr_issue
+    );
+
+    w_in <= s_axi_wstrb & s_axi_wdata;
+
+    w_skid_buffer_comp : entity work.skid_buffer
+    generic map(
+        data_width      => data_width + data_width / 8,
+        reset_polarity  => reset_polarity
+    )
+    port map(
+        clk_sys         => clk_sys,
+        res_n           => res_n,
+        s_data          => w_in,
+        s_valid         => s_axi_wvalid,
+        s_ready         => s_axi_wready,
+        m_data          => w_out,
+        m_valid         => w_valid,
+        m_ready         => wr_issue
+    );
+
+
+    ---------------------------------------------------------------------------
+    -- Arbitration of memory bus
+    ---------------------------------------------------------------------------
+    rd_req <= '1' when (ar_valid = '1' and outstanding < max_outstanding and
+                        full = '0') else
+              '0';
+    wr_req <= '1' when (aw_valid = '1' and w_valid = '1' and
+                        b_cnt < max_outstanding and full = '0') else
+              '0';
+
+    rd_issue <= '1' when (rd_req = '1' and
+                          (wr_req = '0' or last_read = '0')) else
+                '0';
+    wr_issue <= wr_req and not rd_issue;
+
+    last_read_proc : process(res_n, clk_sys)
+    begin
+        if (res_n = reset_polarity) then
+            last_read <= '0';
+        elsif (rising_edge(clk_sys)) then
+            if (rd_issue = '1') then
+                last_read <= '1';
+            elsif (wr_issue = '1') then
+                last_read <= '0';
+            end if;
+        end if;
+    end process;
+
+
+    ---------------------------------------------------------------------------
+    -- Memory bus
+    ---------------------------------------------------------------------------
+    address <= ar_addr when (rd_issue = '1') else
+               aw_addr;
+    w_data <= w_out(data_width - 1 downto 0);
+    cs <= rd_issue or wr_issue;
+    read <= rd_issue;
+    write <= wr_issue;
+
+    be <= w_out(data_width + data_width / 8 - 1 downto data_width)
+              when (wr_issue = '1') else
+          (OTHERS => '1') when (rd_issue = '1') else
+          (OTHERS => '0');
+
+
+    ---------------------------------------------------------------------------
+    -- Write responses
+    ---------------------------------------------------------------------------
+    b_cnt_proc : process(res_n, clk_sys)
+    begin
+        if (res_n = reset_polarity) then
+            b_cnt <= 0;
+        elsif (rising_edge(clk_sys)) then
+            if (wr_issue = '1' and
+                (b_cnt = 0 or s_axi_bready = '0'))
+            then
+                b_cnt <= b_cnt + 1;
+            elsif (wr_issue = '0' and b_cnt > 0 and s_axi_bready = '1') then
+                b_cnt <= b_cnt - 1;
+            end if;
+        end if;
+    end process;
+
+    s_axi_bvalid <= '1' when (b_cnt > 0) else
+                    '0';
+    s_axi_bresp <= "00";
+
+
+    ---------------------------------------------------------------------------
+    -- Valid of read data delayed by read latency
+    ---------------------------------------------------------------------------
+    rd_pipe(0) <= rd_issue;
+
+    rd_pipe_gen : if (read_latency > 0) generate
+        rd_pipe_proc : process(res_n, clk_sys)
+        begin
+            if (res_n = reset_polarity) then
+                rd_pipe(read_latency downto 1) <= (OTHERS => '0');
+            elsif (rising_edge(clk_sys)) then
+                rd_pipe(read_latency downto 1) <=
+                    rd_pipe(read_latency - 1 downto 0);
+            end if;
+        end process;
+    end generate rd_pipe_gen;
+
+
+    ---------------------------------------------------------------------------
+    -- Read data FIFO
+    ---------------------------------------------------------------------------
+    push <= rd_pipe(read_latency);
+    pop <= '1' when (fifo_cnt > 0 and s_axi_rready = '1') else
+           '0';
+
+    fifo_mem_proc : process(clk_sys)
+    begin
+        if (rising_edge(clk_sys)) then
+            if (push = '1') then
+                fifo(wr_ptr) <= r_data;
+            end if;
+        end if;
+    end process;
+
+    fifo_ptr_proc : process(res_n, clk_sys)
+    begin
+        if (res_n = reset_polarity) then
+            wr_ptr <= 0;
+            rd_ptr <= 0;
+            fifo_cnt <= 0;
+            outstanding <= 0;
+        elsif (rising_edge(clk_sys)) then
+            if (push = '1') then
+                wr_ptr <= (wr_ptr + 1) mod max_outstanding;
+            end if;
+
+            if (pop = '1') then
+                rd_ptr <= (rd_ptr + 1) mod max_outstanding;
+            end if;
+
+            if (push = '1' and pop = '0') then
+                fifo_cnt <= fifo_cnt + 1;
+            elsif (push = '0' and pop = '1') then
+                fifo_cnt <= fifo_cnt - 1;
+            end if;
+
+            if (rd_issue = '1' and pop = '0') then
+                outstanding <= outstanding + 1;
+            elsif (rd_issue = '0' and pop = '1') then
+                outstanding <= outstanding - 1;
+            end if;
+        end if;
+    end process;
+
+    s_axi_rvalid <= '1' when (fifo_cnt > 0) else
+                    '0';
+    s_axi_rdata <= fifo(rd_ptr);
+    s_axi_rresp <= "00";
+
+
+    assert ((data_width mod 8) = 0)
+        report "Data width must be multiple of 8!"
+        severity failure;
+
+    assert (max_outstanding > 0)
+        report "Number of outstanding reads must be at least 1!"
+        severity failure;
+
+end architecture;
@@ -0,0 +1,213 @@
+--------------------------------------------------------------------------------
+-- 
+-- Register map generation tool
+--
+-- Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this SW component and associated documentation files (the "Component"),
+-- to deal in the Component without restriction, including without limitation
+-- the rights to use, copy, modify, merge, publish, distribute, sublicense,
+-- and/or sell copies of the Component, and to permit persons to whom the
+-- Component is furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in
+-- all copies or substantial portions of the Component.
+--
+-- THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+-- FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+-- IN THE COMPONENT.
+--
+--------------------------------------------------------------------------------
+--------------------------------------------------------------------------------
+--------------------------------------------------------------------------------
+-- Purpose:
+--   Asynchronous FIFO for transfer of data between two clock domains.
+--   Read and write pointers are passed to the other clock domain in Gray
+--   code via two flip-flop synchronizers. FIFO has 2 ** depth_log2 entries.
+--
+--   Read side is first-word-fall-through: rd_data are valid whenever
+--   rd_valid is high and next word is shown after rd_en.
+--
+--   Word written to empty FIFO is shown on read side 2 to 3 clock cycles of
+--   read clock after write. Writes to full FIFO are ignored.
+--
+--   almost_full is set when "afull_margin" or less entries are free, so that
+--   writer which sees it with delay can stop before FIFO is full. Number of
+--   used entries is calculated from read pointer of write domain, thus both
+--   full and almost_full are released 2 to 3 clock cycles of write clock
+--   after read.
+--------------------------------------------------------------------------------
+-- Revision History:
+--    16.10.2026   Created file
+--    16.10.2026   Added almost_full
+--------------------------------------------------------------------------------
+
+Library ieee;
+USE IEEE.std_logic_1164.all;
+USE IEEE.numeric_std.ALL;
+
+entity cdc_fifo is
+    generic(
+        -- Width of data
+        constant data_width           :     natural := 32;
+
+        -- Number of entries is 2 ** depth_log2
+        constant depth_log2           :     natural := 3;
+
+        -- Number of free entries at which almost_full is set
+        constant afull_margin         :     natural := 0;
+
+        -- Reset polarity
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        ------------------------------------------------------------------------
+        -- Write side
+        ------------------------------------------------------------------------
+        signal wr_clk                 :in   std_logic;
+        signal wr_res_n               :in   std_logic;
+        signal wr_data                :in   std_logic_vector(data_width - 1 downto 0);
+        signal wr_en                  :in   std_logic;
+        signal full                   :out  std_logic;
+        signal almost_full            :out  std_logic;
+
+        ------------------------------------------------------------------------
+        -- Read side
+        ------------------------------------------------------------------------
+        signal rd_clk                 :in   std_logic;
+        signal rd_res_n               :in   std_logic;
+        signal rd_data                :out  std_logic_vector(data_width - 1 downto 0);
+        signal rd_valid               :out  std_logic;
+        signal rd_en                  :in   std_logic
+    );
+
+end entity cdc_fifo;
+
+
+architecture rtl of cdc_fifo is
+
+    constant DEPTH                    :    natural := 2 ** depth_log2;
+
+    type t_mem is array (0 to DEPTH - 1) of
+        std_logic_vector(data_width - 1 downto 0);
+    signal mem                        :    t_mem;
+
+    subtype t_ptr is unsigned(depth_log2 downto 0);
+
+    -- Write domain
+    signal wr_ptr                     :    t_ptr;
+    signal wr_ptr_gray                :    t_ptr;
+    signal rd_ptr_gray_s1             :    t_ptr;
+    signal rd_ptr_gray_s2             :    t_ptr;
+    signal full_i                     :    std_logic;
+    signal level                      :    t_ptr;
+
+    -- Read domain
+    signal rd_ptr                     :    t_ptr;
+    signal rd_ptr_gray                :    t_ptr;
+    signal wr_ptr_gray_s1             :    t_ptr;
+    signal wr_ptr_gray_s2             :    t_ptr;
+    signal empty                      :    std_logic;
+
+    function to_gray(bin : t_ptr) return t_ptr is
+    begin
+        return bin xor shift_right(bin, 1);
+    end function;
+
+    function from_gray(gray : t_ptr) return t_ptr is
+        variable bin                  :    t_ptr;
+    begin
+        bin(depth_log2) := gray(depth_log2);
+        for i in depth_log2 - 1 downto 0 loop
+            bin(i) := bin(i + 1) xor gray(i);
+        end loop;
+        return bin;
+    end function;
+
+begin
+
+    ---------------------------------------------------------------------------
+    -- Write domain
+    ---------------------------------------------------------------------------
+    full_i <= '1' when (wr_ptr_gray(depth_log2 downto depth_log2 - 1) =
+                        not rd_ptr_gray_s2(depth_log2 downto depth_log2 - 1) and
+                        wr_ptr_gray(depth_log2 - 2 downto 0) =
+                        rd_ptr_gray_s2(depth_log2 - 2 downto 0)) else
+              '0';
+
+    wr_ptr_proc : process(wr_res_n, wr_clk)
+    begin
+        if (wr_res_n = reset_polarity) then
+            wr_ptr <= (OTHERS => '0');
+            wr_ptr_gray <= (OTHERS => '0');
+            rd_ptr_gray_s1 <= (OTHERS => '0');
+            rd_ptr_gray_s2 <= (OTHERS => '0');
+        elsif (rising_edge(wr_clk)) then
+            rd_ptr_gray_s1 <= rd_ptr_gray;
+            rd_ptr_gray_s2 <= rd_ptr_gray_s1;
+
+            if (wr_en = '1' and full_i = '0') then
+                wr_ptr <= wr_ptr + 1;
+                wr_ptr_gray <= to_gray(wr_ptr + 1);
+            end if;
+        end if;
+    end process;
+
+    mem_proc : process(wr_clk)
+    begin
+        if (rising_edge(wr_clk)) then
+            if (wr_en = '1' and full_i = '0') then
+                mem(to_integer(wr_ptr(depth_log2 - 1 downto 0))) <= wr_data;
+            end if;
+        end if;
+    end process;
+
+    full <= full_i;
+
+    level <= wr_ptr - from_gray(rd_ptr_gray_s2);
+    almost_full <= '1' when (to_integer(level) + afull_margin >= DEPTH) else
+                   '0';
+
+
+    ---------------------------------------------------------------------------
+    -- Read domain
+    ---------------------------------------------------------------------------
+    empty <= '1' when (rd_ptr_gray = wr_ptr_gray_s2) else
+             '0';
+
+    rd_ptr_proc : process(rd_res_n, rd_clk)
+    begin
+        if (rd_res_n = reset_polarity) then
+            rd_ptr <= (OTHERS => '0');
+            rd_ptr_gray <= (OTHERS => '0');
+            wr_ptr_gray_s1 <= (OTHERS => '0');
+            wr_ptr_gray_s2 <= (OTHERS => '0');
+        elsif (rising_edge(rd_clk)) then
+            wr_ptr_gray_s1 <= wr_ptr_gray;
+            wr_ptr_gray_s2 <= wr_ptr_gray_s1;
+
+            if (rd_en = '1' and empty = '0') then
+                rd_ptr <= rd_ptr + 1;
+                rd_ptr_gray <= to_gray(rd_ptr + 1);
+            end if;
+        end if;
+    end process;
+
+    rd_data <= mem(to_integer(rd_ptr(depth_log2 - 1 downto 0)));
+    rd_valid <= not empty;
+
+
+    assert (depth_log2 >= 2)
+        report "FIFO must have at least 4 entries!"
+        severity failure;
+
+    assert (afull_margin < DEPTH)
+        report "Margin of almost full must be lower than number of entries!"
+        severity failure;
+
+end architecture;
@@ -28,13 +28,29 @@
 -- Purpose:
 --   Common package for register map generator. Contains following components:
 --      Address decoder
+--      Dense address decoder
 --      Data multiplexor
+--      Pipelined data multiplexor tree
 --      Memory register 
 --      Access signaller
+--      Memory (RAM)
+--      AXI4 slave front end
+--      Skid buffer
+--      AXI4-Lite slave front end
+--      Avalon-MM slave front end
+--      Asynchronous FIFO
+--   and array of naturals used by tables of table-driven register file.
 --
 --------------------------------------------------------------------------------
 -- Revision history:
 --  25.11.2018   Created file
+--  16.10.2026   Added pipelined data multiplexor tree
+--  16.10.2026   Added dense address decoder
+--  16.10.2026   Added memory (RAM)
+--  16.10.2026   Added array of naturals
+--  16.10.2026   Added AXI4 slave front end
+--  16.10.2026   Added skid buffer, AXI4-Lite and Avalon-MM front ends
+--  16.10.2026   Added asynchronous FIFO
 --------------------------------------------------------------------------------
 
 Library ieee;
@@ -43,6 +59,10 @@ USE ieee.numeric_std.ALL;
 
 package cmn_reg_map_pkg is
 
+--------------------------------------------------------------------------------
+-- Array of naturals
+--------------------------------------------------------------------------------
+type natural_array_t is array (natural range <>) of natural;
 
 --------------------------------------------------------------------------------
 -- Address decoder
@@ -65,6 +85,27 @@ component address_decoder is
 end component address_decoder;
 
 
+--------------------------------------------------------------------------------
+-- Dense address decoder
+--------------------------------------------------------------------------------
+component address_decoder_dense is
+    generic(
+        constant address_width         :     natural;
+        constant address_entries       :     natural;
+        constant addr_vect             :     std_logic_vector;
+        constant registered_out        :     boolean := false;
+        constant reset_polarity        :     std_logic := '0'
+    );
+    port(
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+        signal address                :in   std_logic_vector(address_width - 1 downto 0);
+        signal enable                 :in   std_logic;
+        signal addr_dec               :out  std_logic_vector(address_entries - 1 downto 0)
+    );
+end component address_decoder_dense;
+
+
 --------------------------------------------------------------------------------
 -- Data multiplexor
 --------------------------------------------------------------------------------
@@ -89,6 +130,30 @@ component data_mux is
 end component data_mux;
 
 
+--------------------------------------------------------------------------------
+-- Pipelined data multiplexor tree
+--------------------------------------------------------------------------------
+component data_mux_tree is
+    generic(
+        constant data_out_width        :     natural := 32;
+        constant data_in_width         :     natural := 256;
+        constant sel_width             :     natural := 8;
+        constant pipeline_stages       :     natural := 1;
+        constant registered_out        :     boolean := false;
+        constant reset_polarity        :     std_logic := '0'
+    );
+    port(
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+        signal data_selector          :in   std_logic_vector(sel_width - 1 downto 0);
+        signal data_in                :in   std_logic_vector(data_in_width - 1 downto 0);
+        signal data_mask_n            :in   std_logic_vector(data_out_width - 1 downto 0);
+        signal enable                 :in   std_logic;
+        signal data_out               :out  std_logic_vector(data_out_width - 1 downto 0)
+    );
+end component data_mux_tree;
+
+
 --------------------------------------------------------------------------------
 -- Memory register
 --------------------------------------------------------------------------------
@@ -137,4 +202,204 @@ component access_signaller is
 
 end component access_signaller;
 
+
+--------------------------------------------------------------------------------
+-- Memory (RAM)
+--------------------------------------------------------------------------------
+component memory_ram is
+    generic(
+        constant data_width           :     natural := 32;
+        constant address_width        :     natural := 8;
+        constant registered_read      :     boolean := true;
+        constant clear_read_data      :     boolean := false
+    );
+    port(
+        signal clk_sys                :in   std_logic;
+        signal address                :in   std_logic_vector(address_width - 1 downto 0);
+        signal w_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal r_data                 :out  std_logic_vector(data_width - 1 downto 0);
+        signal cs                     :in   std_logic;
+        signal read                   :in   std_logic;
+        signal write                  :in   std_logic;
+        signal be                     :in   std_logic_vector(data_width / 8 - 1 downto 0)
+    );
+end component memory_ram;
+
+
+--------------------------------------------------------------------------------
+-- AXI4 slave front end
+--------------------------------------------------------------------------------
+component axi4_slave is
+    generic(
+        constant data_width           :     natural := 32;
+        constant address_width        :     natural := 16;
+        constant id_width             :     natural := 4;
+        constant read_latency         :     natural := 1;
+        constant fifo_depth           :     natural := 3;
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+        signal s_axi_awid             :in   std_logic_vector(id_width - 1 downto 0);
+        signal s_axi_awaddr           :in   std_logic_vector(address_width - 1 downto 0);
+        signal s_axi_awlen            :in   std_logic_vector(7 downto 0);
+        signal s_axi_awsize           :in   std_logic_vector(2 downto 0);
+        signal s_axi_awburst          :in   std_logic_vector(1 downto 0);
+        signal s_axi_awvalid          :in   std_logic;
+        signal s_axi_awready          :out  std_logic;
+        signal s_axi_wdata            :in   std_logic_vector(data_width - 1 downto 0);
+        signal s_axi_wstrb            :in   std_logic_vector(data_width / 8 - 1 downto 0);
+        signal s_axi_wlast            :in   std_logic;
+        signal s_axi_wvalid           :in   std_logic;
+        signal s_axi_wready           :out  std_logic;
+        signal s_axi_bid              :out  std_logic_vector(id_width - 1 downto 0);
+        signal s_axi_bresp            :out  std_logic_vector(1 downto 0);
+        signal s_axi_bvalid           :out  std_logic;
+        signal s_axi_bready           :in   std_logic;
+        signal s_axi_arid             :in   std_logic_vector(id_width - 1 downto 0);
+        signal s_axi_araddr           :in   std_logic_vector(address_width - 1 downto 0);
+        signal s_axi_arlen            :in   std_logic_vector(7 downto 0);
+        signal s_axi_arsize           :in   std_logic_vector(2 downto 0);
+        signal s_axi_arburst          :in   std_logic_vector(1 downto 0);
+        signal s_axi_arvalid          :in   std_logic;
+        signal s_axi_arready          :out  std_logic;
+        signal s_axi_rid              :out  std_logic_vector(id_width - 1 downto 0);
+        signal s_axi_rdata            :out  std_logic_vector(data_width - 1 downto 0);
+        signal s_axi_rresp            :out  std_logic_vector(1 downto 0);
+        signal s_axi_rlast            :out  std_logic;
+        signal s_axi_rvalid           :out  std_logic;
+        signal s_axi_rready           :in   std_logic;
+        signal address                :out  std_logic_vector(address_width - 1 downto 0);
+        signal w_data                 :out  std_logic_vector(data_width - 1 downto 0);
+        signal r_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal cs                     :out  std_logic;
+        signal read                   :out  std_logic;
+        signal write                  :out  std_logic;
+        signal be                     :out  std_logic_vector(data_width / 8 - 1 downto 0)
+    );
+end component axi4_slave;
+
+
+--------------------------------------------------------------------------------
+-- Skid buffer
+--------------------------------------------------------------------------------
+component skid_buffer is
+    generic(
+        constant data_width           :     natural := 32;
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+        signal s_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal s_valid                :in   std_logic;
+        signal s_ready                :out  std_logic;
+        signal m_data                 :out  std_logic_vector(data_width - 1 downto 0);
+        signal m_valid                :out  std_logic;
+        signal m_ready                :in   std_logic
+    );
+end component skid_buffer;
+
+
+--------------------------------------------------------------------------------
+-- AXI4-Lite slave front end
+--------------------------------------------------------------------------------
+component axi4lite_slave is
+    generic(
+        constant data_width           :     natural := 32;
+        constant address_width        :     natural := 16;
+        constant read_latency         :     natural := 1;
+        constant max_outstanding      :     natural := 3;
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+        signal s_axi_awaddr           :in   std_logic_vector(address_width - 1 downto 0);
+        signal s_axi_awprot           :in   std_logic_vector(2 downto 0);
+        signal s_axi_awvalid          :in   std_logic;
+        signal s_axi_awready          :out  std_logic;
+        signal s_axi_wdata            :in   std_logic_vector(data_width - 1 downto 0);
+        signal s_axi_wstrb            :in   std_logic_vector(data_width / 8 - 1 downto 0);
+        signal s_axi_wvalid           :in   std_logic;
+        signal s_axi_wready           :out  std_logic;
+        signal s_axi_bresp            :out  std_logic_vector(1 downto 0);
+        signal s_axi_bvalid           :out  std_logic;
+        signal s_axi_bready           :in   std_logic;
+        signal s_axi_araddr           :in   std_logic_vector(address_width - 1 downto 0);
+        signal s_axi_arprot           :in   std_logic_vector(2 downto 0);
+        signal s_axi_arvalid          :in   std_logic;
+        signal s_axi_arready          :out  std_logic;
+        signal s_axi_rdata            :out  std_logic_vector(data_width - 1 downto 0);
+        signal s_axi_rresp            :out  std_logic_vector(1 downto 0);
+        signal s_axi_rvalid           :out  std_logic;
+        signal s_axi_rready           :in   std_logic;
+        signal address                :out  std_logic_vector(address_width - 1 downto 0);
+        signal w_data                 :out  std_logic_vector(data_width - 1 downto 0);
+        signal r_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal cs                     :out  std_logic;
+        signal read                   :out  std_logic;
+        signal write                  :out  std_logic;
+        signal be                     :out  std_logic_vector(data_width / 8 - 1 downto 0)
+    );
+end component axi4lite_slave;
+
+
+--------------------------------------------------------------------------------
+-- Avalon-MM slave front end
+--------------------------------------------------------------------------------
+component avalon_slave is
+    generic(
+        constant data_width           :     natural := 32;
+        constant address_width        :     natural := 16;
+        constant read_latency         :     natural := 1;
+        constant max_outstanding      :     natural := 3;
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+        signal avs_address            :in   std_logic_vector(address_width - 1 downto 0);
+        signal avs_read               :in   std_logic;
+        signal avs_write              :in   std_logic;
+        signal avs_writedata          :in   std_logic_vector(data_width - 1 downto 0);
+        signal avs_byteenable         :in   std_logic_vector(data_width / 8 - 1 downto 0);
+        signal avs_waitrequest        :out  std_logic;
+        signal avs_readdata           :out  std_logic_vector(data_width - 1 downto 0);
+        signal avs_readdatavalid      :out  std_logic;
+        signal address                :out  std_logic_vector(address_width - 1 downto 0);
+        signal w_data                 :out  std_logic_vector(data_width - 1 downto 0);
+        signal r_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal cs                     :out  std_logic;
+        signal read                   :out  std_logic;
+        signal write                  :out  std_logic;
+        signal be                     :out  std_logic_vector(data_width / 8 - 1 downto 0)
+    );
+end component avalon_slave;
+
+
+--------------------------------------------------------------------------------
+-- Asynchronous FIFO
+--------------------------------------------------------------------------------
+component cdc_fifo is
+    generic(
+        constant data_width           :     natural := 32;
+        constant depth_log2           :     natural := 3;
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        signal wr_clk                 :in   std_logic;
+        signal wr_res_n               :in   std_logic;
+        signal wr_data                :in   std_logic_vector(data_width - 1 downto 0);
+        signal wr_en                  :in   std_logic;
+        signal full                   :out  std_logic;
+        signal rd_clk                 :in   std_logic;
+        signal rd_res_n               :in   std_logic;
+        signal rd_data                :out  std_logic_vector(data_width - 1 downto 0);
+        signal rd_valid               :out  std_logic;
+        signal rd_en                  :in   std_logic
+    );
+end component cdc_fifo;
+
 end package;
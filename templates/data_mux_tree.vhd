@@ -0,0 +1,262 @@
+--------------------------------------------------------------------------------
+--
+-- Register map generation tool
+--
+-- Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this SW component and associated documentation files (the "Component"),
+-- to deal in the Component without restriction, including without limitation
+-- the rights to use, copy, modify, merge, publish, distribute, sublicense,
+-- and/or sell copies of the Component, and to permit persons to whom the
+-- Component is furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in
+-- all copies or substantial portions of the Component.
+--
+-- THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+-- FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+-- IN THE COMPONENT.
+--
+--------------------------------------------------------------------------------
+
+
+--------------------------------------------------------------------------------
+-- Purpose:
+--   Pipelined data multiplexor tree.
+--
+--   Data inputs are selected by a tree of 2:1 multiplexors with "sel_width"
+--   levels. Level "l" is controlled by bit "l - 1" of data selector. Pipeline
+--   registers are inserted after "pipeline_stages" levels of the tree, evenly
+--   distributed over the tree. Data selector, data mask and enable are
+--   delayed together with selected data.
+--
+--   Simplified diagram (sel_width = 2, pipeline_stages = 1):
+--
+--              data_selector(0)        data_selector(1)
+--                    |                        |
+--                    v                        v
+--   data_in  --->|\
+--                | |-------------------->|\
+--            --->|/                      | |    |-----|
+--                                        | |--->| D Q |---> masking, output
+--            --->|\                      | |    |-----|     register
+--                | |-------------------->|/
+--            --->|/
+--
+--   Read latency of the multiplexor is "pipeline_stages" clock cycles plus
+--   one clock cycle when "registered_out" is true.
+--
+--   Inputs beyond "data_in_width" are zeroes, thus reading beyond last
+--   address of register block returns all zeroes as "data_mux" does.
+--
+--------------------------------------------------------------------------------
+-- Revision History:
+--    16.10.2026   Created file
+--------------------------------------------------------------------------------
+
+Library ieee;
+USE IEEE.std_logic_1164.all;
+USE IEEE.numeric_std.ALL;
+
+entity data_mux_tree is
+    generic(
+
+        -- Width of data output
+        constant data_out_width        :     natural := 32;
+
+        -- Width of data input. Must be divisible by "data_out_width"
+        constant data_in_width         :     natural := 256;
+
+        -- Width of selector signal (number of levels of multiplexor tree)
+        constant sel_width             :     natural := 8;
+
+        -- Number of pipeline stages within the tree (at most "sel_width")
+        constant pipeline_stages       :     natural := 1;
+
+        -- Choose betweed registered / non-registered output
+        constant registered_out        :     boolean := false;
+
+        -- Reset polarity
+        constant reset_polarity        :     std_logic := '0'
+    );
+    port(
+        ------------------------------------------------------------------------
+        -- Clock and reset
+        ------------------------------------------------------------------------
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Data selector (unsigned)
+        ------------------------------------------------------------------------
+        signal data_selector          :in   std_logic_vector(sel_width - 1 downto 0);
+
+        ------------------------------------------------------------------------
+        -- Data inputs
+        ------------------------------------------------------------------------
+        signal data_in                :in   std_logic_vector(data_in_width - 1 downto 0);
+
+        ------------------------------------------------------------------------
+        -- Masking signals for data outputs, each bit can be masked out.
+        -- data_mask(i) = '1' -> i-th bit is propagated to the output
+        -- data_mask(i) = '0' -> i-th bit is not propagated to the output.
+        ------------------------------------------------------------------------
+        signal data_mask_n            :in  std_logic_vector(data_out_width - 1 downto 0);
+
+        ------------------------------------------------------------------------
+        -- Enables data propagation to the output.
+        ------------------------------------------------------------------------
+        signal enable                 :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Data output
+        ------------------------------------------------------------------------
+        signal data_out               :out  std_logic_vector(data_out_width - 1 downto 0)
+    );
+
+end entity data_mux_tree;
+
+
+architecture rtl of data_mux_tree is
+
+    -- Number of inputs of the tree (rounded up to power of 2) and width of
+    -- concatenated inputs.
+    constant INPUT_COUNT              :    natural := 2 ** sel_width;
+    constant INPUT_WIDTH              :    natural := INPUT_COUNT * data_out_width;
+
+    -- Data of each tree level concatenated to single vector. Level 0 are
+    -- data inputs, level "l" contains 2 ** (sel_width - l) words.
+    type t_level_data is array (0 to sel_width) of
+        std_logic_vector(INPUT_WIDTH - 1 downto 0);
+
+    -- Data selector, data mask and enable of each tree level.
+    type t_level_sel is array (0 to sel_width) of
+        std_logic_vector(sel_width - 1 downto 0);
+    type t_level_ctrl is array (0 to sel_width) of
+        std_logic_vector(data_out_width downto 0);
+
+    -- Outputs of multiplexors of a level (before pipeline register)
+    signal mux_data                   :    t_level_data;
+
+    -- Outputs of a level (after pipeline register)
+    signal level_data                 :    t_level_data;
+    signal level_sel                  :    t_level_sel;
+    signal level_ctrl                 :    t_level_ctrl;
+
+    -- Data output from the tree, data mask and enable delayed by the tree
+    signal sel_data                   :    std_logic_vector(data_out_width - 1 downto 0);
+    signal data_mask_n_d              :    std_logic_vector(data_out_width - 1 downto 0);
+    signal enable_d                   :    std_logic;
+
+    -- Data output from data mux (after masking)
+    signal masked_data                :    std_logic_vector(data_out_width - 1 downto 0);
+
+    ---------------------------------------------------------------------------
+    -- Pipeline register is inserted after level "level" of the tree. Stages
+    -- are distributed evenly, last stage is after the last level.
+    ---------------------------------------------------------------------------
+    function is_stage_level(level : natural) return boolean is
+    begin
+        return ((level * pipeline_stages) / sel_width) /=
+               (((level - 1) * pipeline_stages) / sel_width);
+    end function;
+
+begin
+
+    assert (pipeline_stages <= sel_width)
+        report "Number of pipeline stages must not exceed selector width!"
+        severity failure;
+
+    ---------------------------------------------------------------------------
+    -- Tree inputs, missing inputs are zeroes.
+    ---------------------------------------------------------------------------
+    level_data(0)(data_in_width - 1 downto 0) <= data_in;
+
+    input_pad_gen : if (INPUT_WIDTH > data_in_width) generate
+        level_data(0)(INPUT_WIDTH - 1 downto data_in_width) <= (OTHERS => '0');
+    end generate input_pad_gen;
+
+    level_sel(0) <= data_selector;
+    level_ctrl(0) <= enable & data_mask_n;
+
+
+    ---------------------------------------------------------------------------
+    -- Levels of multiplexor tree
+    ---------------------------------------------------------------------------
+    level_gen : for l in 1 to sel_width generate
+
+        node_gen : for k in 0 to 2 ** (sel_width - l) - 1 generate
+            mux_data(l)((k + 1) * data_out_width - 1 downto k * data_out_width) <=
+                level_data(l - 1)((2 * k + 2) * data_out_width - 1 downto (2 * k + 1) * data_out_width)
+                    when (level_sel(l - 1)(l - 1) = '1') else
+                level_data(l - 1)((2 * k + 1) * data_out_width - 1 downto 2 * k * data_out_width);
+        end generate node_gen;
+
+        mux_data(l)(INPUT_WIDTH - 1 downto (2 ** (sel_width - l)) * data_out_width)
+            <= (OTHERS => '0');
+
+        stage_true_gen : if (is_stage_level(l)) generate
+            stage_proc : process(res_n, clk_sys)
+            begin
+                if (res_n = reset_polarity) then
+                    level_data(l) <= (OTHERS => '0');
+                    level_sel(l) <= (OTHERS => '0');
+                    level_ctrl(l) <= (OTHERS => '0');
+
+                elsif (rising_edge(clk_sys)) then
+                    level_data(l) <= mux_data(l);
+                    level_sel(l) <= level_sel(l - 1);
+                    level_ctrl(l) <= level_ctrl(l - 1);
+                end if;
+            end process;
+        end generate stage_true_gen;
+
+        stage_false_gen : if (not is_stage_level(l)) generate
+            level_data(l) <= mux_data(l);
+            level_sel(l) <= level_sel(l - 1);
+            level_ctrl(l) <= level_ctrl(l - 1);
+        end generate stage_false_gen;
+
+    end generate level_gen;
+
+    sel_data <= level_data(sel_width)(data_out_width - 1 downto 0);
+    data_mask_n_d <= level_ctrl(sel_width)(data_out_width - 1 downto 0);
+    enable_d <= level_ctrl(sel_width)(data_out_width);
+
+
+    ---------------------------------------------------------------------------
+    -- Data masking
+    ---------------------------------------------------------------------------
+    data_mask_gen : for i in 0 to data_out_width - 1 generate
+        masked_data(i) <= sel_data(i) and data_mask_n_d(i);
+    end generate data_mask_gen;
+
+
+    ---------------------------------------------------------------------------
+    -- Registering / Not-registering output
+    ---------------------------------------------------------------------------
+    data_mux_reg_true_gen : if (registered_out) generate
+        data_mux_reg_proc : process(res_n, clk_sys)
+        begin
+            if (res_n = reset_polarity) then
+                data_out <= (OTHERS => '0');
+
+            elsif (rising_edge(clk_sys)) then
+                if (enable_d = '1') then
+                    data_out <= masked_data;
+                end if;
+            end if;
+        end process;
+    end generate data_mux_reg_true_gen;
+
+    data_mux_reg_false_gen : if (not registered_out) generate
+        data_out <= masked_data when (enable_d = '1') else
+                    (OTHERS => '0');
+    end generate data_mux_reg_false_gen;
+
+end architecture;
@@ -0,0 +1,152 @@
+--------------------------------------------------------------------------------
+-- 
+-- Register map generation tool
+--
+-- Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this SW component and associated documentation files (the "Component"),
+-- to deal in the Component without restriction, including without limitation
+-- the rights to use, copy, modify, merge, publish, distribute, sublicense,
+-- and/or sell copies of the Component, and to permit persons to whom the
+-- Component is furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in
+-- all copies or substantial portions of the Component.
+--
+-- THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+-- FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+-- IN THE COMPONENT.
+--
+--------------------------------------------------------------------------------
+
+
+--------------------------------------------------------------------------------
+-- Purpose:
+--   Memory with byte enables for address blocks with "memory" usage. Memory
+--   is described in a way which allows inferring RAM by synthesis tools:
+--      registered_read = true  -> Synchronous read (Block RAM).
+--      registered_read = false -> Asynchronous read (Distributed RAM).
+--
+--   Memory content is not reset. Read data are kept until next read. When
+--   clear_read_data is true, read data are cleared in the cycle after read.
+--------------------------------------------------------------------------------
+-- Revision History:
+--    16.10.2026   Created file
+--------------------------------------------------------------------------------
+
+Library ieee;
+USE IEEE.std_logic_1164.all;
+USE IEEE.numeric_std.ALL;
+
+entity memory_ram is
+    generic(
+        -- Width of memory word
+        constant data_width           :     natural := 32;
+
+        -- Width of word address (memory has 2 ** address_width words)
+        constant address_width        :     natural := 8;
+
+        -- Synchronous (true) / Asynchronous (false) read
+        constant registered_read      :     boolean := true;
+
+        -- Clear / Keep read data after read
+        constant clear_read_data      :     boolean := false
+    );
+    port(
+        ------------------------------------------------------------------------
+        -- Clock
+        ------------------------------------------------------------------------
+        signal clk_sys                :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Word address
+        ------------------------------------------------------------------------
+        signal address                :in   std_logic_vector(address_width - 1 downto 0);
+
+        ------------------------------------------------------------------------
+        -- Write Data / Read Data
+        ------------------------------------------------------------------------
+        signal w_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal r_data                 :out  std_logic_vector(data_width - 1 downto 0);
+
+        ------------------------------------------------------------------------
+        -- Control signals
+        ------------------------------------------------------------------------
+        signal cs                     :in   std_logic;
+        signal read                   :in   std_logic;
+        signal write                  :in   std_logic;
+        signal be                     :in   std_logic_vector(data_width / 8 - 1 downto 0)
+    );
+
+end entity memory_ram;
+
+
+architecture rtl of memory_ram is
+
+    type t_memory is array (0 to 2 ** address_width - 1) of
+        std_logic_vector(data_width - 1 downto 0);
+
+    signal memory                     :    t_memory;
+
+    -- Address converted to integer
+    signal index                      :    natural range 0 to 2 ** address_width - 1;
+
+begin
+
+    index <= to_integer(unsigned(address));
+
+    ---------------------------------------------------------------------------
+    -- Write with byte enables
+    ---------------------------------------------------------------------------
+    memory_write_proc : process(clk_sys)
+    begin
+        if (rising_edge(clk_sys)) then
+            if (cs = '1' and write = '1') then
+                for i in 0 to data_width / 8 - 1 loop
+                    if (be(i) = '1') then
+                        memory(index)(i * 8 + 7 downto i * 8) <=
+                            w_data(i * 8 + 7 downto i * 8);
+                    end if;
+                end loop;
+            end if;
+        end if;
+    end process;
+
+
+    ---------------------------------------------------------------------------
+    -- Synchronous read
+    ---------------------------------------------------------------------------
+    read_sync_gen : if (registered_read) generate
+        memory_read_proc : process(clk_sys)
+        begin
+            if (rising_edge(clk_sys)) then
+                if (cs = '1' and read = '1') then
+                    r_data <= memory(index);
+                elsif (clear_read_data) then
+                    r_data <= (OTHERS => '0');
+                end if;
+            end if;
+        end process;
+    end generate read_sync_gen;
+
+
+    ---------------------------------------------------------------------------
+    -- Asynchronous read
+    ---------------------------------------------------------------------------
+    read_async_gen : if (not registered_read) generate
+        r_data <= memory(index) when ((cs = '1' and read = '1') or
+                                      (not clear_read_data)) else
+                  (OTHERS => '0');
+    end generate read_async_gen;
+
+
+    assert ((data_width mod 8) = 0)
+        report "Memory data width must be multiple of 8!"
+        severity failure;
+
+end architecture;
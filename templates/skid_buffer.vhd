@@ -0,0 +1,118 @@
+--------------------------------------------------------------------------------
+-- 
+-- Register map generation tool
+--
+-- Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this SW component and associated documentation files (the "Component"),
+-- to deal in the Component without restriction, including without limitation
+-- the rights to use, copy, modify, merge, publish, distribute, sublicense,
+-- and/or sell copies of the Component, and to permit persons to whom the
+-- Component is furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in
+-- all copies or substantial portions of the Component.
+--
+-- THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+-- FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+-- IN THE COMPONENT.
+--
+--------------------------------------------------------------------------------
+--------------------------------------------------------------------------------
+--------------------------------------------------------------------------------
+-- Purpose:
+--   Skid buffer of valid / ready handshake. Output side (m_data, m_valid)
+--   and ready of input side are driven by registers, thus handshake path
+--   is cut without loss of throughput. Data are accepted every clock cycle
+--   as long as m_ready is high. When output is stalled, single data word is
+--   kept in skid register and input is not ready until it is passed on.
+--------------------------------------------------------------------------------
+-- Revision History:
+--    16.10.2026   Created file
+--------------------------------------------------------------------------------
+
+Library ieee;
+USE IEEE.std_logic_1164.all;
+USE IEEE.numeric_std.ALL;
+
+entity skid_buffer is
+    generic(
+        -- Width of data
+        constant data_width           :     natural := 32;
+
+        -- Reset polarity
+        constant reset_polarity       :     std_logic := '0'
+    );
+    port(
+        ------------------------------------------------------------------------
+        -- Clock and reset
+        ------------------------------------------------------------------------
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Input side
+        ------------------------------------------------------------------------
+        signal s_data                 :in   std_logic_vector(data_width - 1 downto 0);
+        signal s_valid                :in   std_logic;
+        signal s_ready                :out  std_logic;
+
+        ------------------------------------------------------------------------
+        -- Output side
+        ------------------------------------------------------------------------
+        signal m_data                 :out  std_logic_vector(data_width - 1 downto 0);
+        signal m_valid                :out  std_logic;
+        signal m_ready                :in   std_logic
+    );
+
+end entity skid_buffer;
+
+
+architecture rtl of skid_buffer is
+
+    signal out_data                   :    std_logic_vector(data_width - 1 downto 0);
+    signal out_valid                  :    std_logic;
+    signal skid_data                  :    std_logic_vector(data_width - 1 downto 0);
+    signal skid_valid                 :    std_logic;
+
+begin
+
+    skid_proc : process(res_n, clk_sys)
+    begin
+        if (res_n = reset_polarity) then
+            out_data <= (OTHERS => '0');
+            out_valid <= '0';
+            skid_data <= (OTHERS => '0');
+            skid_valid <= '0';
+        elsif (rising_edge(clk_sys)) then
+
+            -- Output register is empty or passed on, load it from skid
+            -- register first, otherwise from input.
+            if (out_valid = '0' or m_ready = '1') then
+                if (skid_valid = '1') then
+                    out_data <= skid_data;
+                    out_valid <= '1';
+                    skid_valid <= '0';
+                else
+                    out_data <= s_data;
+                    out_valid <= s_valid;
+                end if;
+
+            -- Output stalled, accepted input goes to skid register
+            elsif (s_valid = '1' and skid_valid = '0') then
+                skid_data <= s_data;
+                skid_valid <= '1';
+            end if;
+        end if;
+    end process;
+
+    s_ready <= not skid_valid;
+    m_data <= out_data;
+    m_valid <= out_valid;
+
+end architecture;